@@ -20,6 +20,10 @@
 ## Description
 Main entry point for the PlutoStudio application.
 
+With `--headless` the acquisition runs without the GUI, see `plutostudio.cli`.
+The GUI is only imported when it is started, so the headless mode does not
+load Tk or matplotlib.
+
 ### Details
 - *File:*     `PlutoStudio.py`
 - *Details:*  Python 3.11
@@ -35,14 +39,54 @@ Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
 ---
 """
 # === Imports ===
+import argparse
 import sys
-from plutostudio.ui.app import PlutoApp
+from pathlib import Path
 
 # === Main ===
-def main() -> int:
+def main(argv: list | None = None) -> int:
     """Main entry point for the PlutoStudio application."""
+    # Hand all other arguments to the headless acquisition
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if "--headless" in argv:
+        argv.remove("--headless")
+        from plutostudio.cli import main as headless # pylint: disable=import-outside-toplevel
+        return headless(argv)
+
+    # Parse the arguments of the GUI
+    parser = argparse.ArgumentParser(description="A Python based GUI for the ADALM-PlutoSDR.")
+    parser.add_argument(
+        "--headless", action="store_true", help="acquire without the GUI, see --headless --help"
+    )
+    parser.add_argument(
+        "--fps", type=float, default=30.0, help="the target frame rate of the viewer"
+    )
+    parser.add_argument("--stats", action="store_true", help="show the performance metrics")
+    parser.add_argument(
+        "--demod", choices=("fm", "am", "usb", "lsb"), help="demodulate the channel at --offset"
+    )
+    parser.add_argument(
+        "--offset", type=float, default=0.0, help="the offset of the demodulated channel in Hz"
+    )
+    parser.add_argument(
+        "--audio",
+        type=Path,
+        default=Path("audio.wav"),
+        help="the WAV file of the demodulated audio",
+    )
+    args = parser.parse_args(argv)
+
     # Create the app
-    app = PlutoApp()
+    from plutostudio.ui.app import PlutoApp # pylint: disable=import-outside-toplevel
+    app = PlutoApp(fps=args.fps, show_stats=args.stats)
+
+    # Add the audio output
+    if args.demod is not None:
+        # pylint: disable=import-outside-toplevel
+        from plutostudio.core.audio import AudioPlayer, WavOutput
+        from plutostudio.core.demodulator import Receiver
+        receiver = Receiver(args.demod, app.device.sample_rate, args.offset)
+        app.add_audio(receiver, AudioPlayer(WavOutput(args.audio, receiver.audio_rate)))
 
     # Run the app
     app.mainloop()
@@ -0,0 +1,36 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Benchmarks for the PlutoStudio package.
+
+## Description
+Standalone benchmarks to measure the throughput of the performance critical
+parts of the application. The benchmarks do not need any hardware attached.
+
+### Details
+- *File:*     `benchmark/__init__.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
@@ -0,0 +1,113 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Benchmark the buffer module.
+
+## Description
+Measures the put throughput of the buffers in samples per second and compares
+the vectorized bulk write against the previous per-sample implementation.
+
+Run with:
+```
+python -m benchmark.bench_buffer
+```
+
+### Details
+- *File:*     `bench_buffer.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import sys
+import time
+import numpy as np
+from plutostudio.core import buffer
+
+# === Reference Implementation ===
+
+
+class LegacyCircularBuffer(buffer.Buffer):
+    """The previous circular buffer which stores the data sample by sample."""
+
+    def put(self, data: float | list) -> None:
+        """Put data in the buffer.
+
+        Args:
+            data (float | list): The data to put in the buffer.
+
+        ---
+        """
+        try:
+            self._data[self._size] = data
+            self._size += 1
+        except IndexError:
+            self._size = 0
+            self.put(data)
+        except ValueError:
+            for value in data:
+                self.put(value)
+
+
+# === Functions ===
+def measure_put(buffer_class: type, capacity: int, block_size: int, duration: float = 0.5) -> float:
+    """Measure the put throughput of a buffer.
+
+    Args:
+        buffer_class (type): The buffer class to measure.
+        capacity (int): The capacity of the buffer.
+        block_size (int): The number of samples per put call.
+        duration (float, optional): The minimum measurement time in seconds. Defaults to 0.5.
+
+    Returns:
+        float: The throughput in samples per second.
+    """
+    uut = buffer_class(capacity)
+    block = np.random.rand(block_size)
+
+    # Repeat the put calls until the measurement time has passed
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < duration:
+        uut.put(block)
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return calls * block_size / elapsed
+
+
+def main() -> int:
+    """Run the buffer benchmark and print the results."""
+    capacity = 65536
+    print(f"{'block size':>10} | {'legacy [S/s]':>14} | {'bulk [S/s]':>14} | {'speedup':>8}")
+    for block_size in (1, 64, 1024, 16384, 65536):
+        legacy = measure_put(LegacyCircularBuffer, capacity, block_size)
+        bulk = measure_put(buffer.CircularBuffer, capacity, block_size)
+        print(f"{block_size:>10} | {legacy:>14.3e} | {bulk:>14.3e} | {bulk / legacy:>7.1f}x")
+    return 0
+
+
+# Run the benchmark
+if __name__ == "__main__":
+    sys.exit(main())
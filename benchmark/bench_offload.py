@@ -0,0 +1,133 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Benchmark the offload module.
+
+## Description
+Measures the sustainable sample rate of an FFT stage when it runs inline
+in the acquisition process and when it is offloaded to one or more worker
+processes. The rate should grow with the number of workers until the
+cores of the machine are used up.
+
+Run with:
+```
+python -m benchmark.bench_offload
+```
+
+### Details
+- *File:*     `bench_offload.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import os
+import sys
+import time
+import numpy as np
+from plutostudio.core.offload import DspOffload
+
+# === Constants ===
+PLUTO_MAX_RATE = 61.44e6
+FFT_SIZE = 1024
+
+# === Functions ===
+def power_spectrum(block: np.ndarray) -> np.ndarray:
+    """The benchmarked stage, averages the power spectra of a block.
+
+    Args:
+        block (np.ndarray): The samples, a multiple of the FFT size.
+
+    Returns:
+        np.ndarray: The averaged power spectrum.
+    """
+    spectra = np.fft.fft(block.reshape(-1, FFT_SIZE))
+    return (spectra.real**2 + spectra.imag**2).mean(axis=0)
+
+
+def measure_inline(block_size: int = 2**16, duration: float = 2.0) -> float:
+    """Measure the rate of the stage in the calling process.
+
+    Args:
+        block_size (int, optional): The number of samples per block. Defaults to 2**16.
+        duration (float, optional): The duration of the measurement in seconds. Defaults to 2.0.
+
+    Returns:
+        float: The processed samples per second.
+    """
+    block = np.ones(block_size, dtype=np.complex64)
+    blocks = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        power_spectrum(block)
+        blocks += 1
+    return blocks * block_size / (time.perf_counter() - start)
+
+
+def measure_offload(workers: int, block_size: int = 2**16, duration: float = 2.0) -> float:
+    """Measure the rate of the stage offloaded to worker processes.
+
+    The samples are put as fast as possible, the blocks which do not fit
+    are dropped. The rate is computed from the results which arrive.
+
+    Args:
+        workers (int): The number of worker processes.
+        block_size (int, optional): The number of samples per block. Defaults to 2**16.
+        duration (float, optional): The duration of the measurement in seconds. Defaults to 2.0.
+
+    Returns:
+        float: The processed samples per second.
+    """
+    block = np.ones(block_size, dtype=np.complex64)
+    offload = DspOffload(power_spectrum, block_size=block_size, workers=workers, slots=16)
+    offload.start()
+
+    # Wait for the workers to process the first block before measuring
+    offload.put(block)
+    while not offload.results():
+        time.sleep(0.001)
+    results = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        offload.put(block)
+        results += len(offload.results())
+    elapsed = time.perf_counter() - start
+    offload.stop()
+    return results * block_size / elapsed
+
+
+def main() -> int:
+    """Run the offload benchmark and print the results."""
+    print(f"{'workers':>8} | {'rate [S/s]':>12} | {'Pluto max':>9}")
+    rate = measure_inline()
+    print(f"{'inline':>8} | {rate:>12.3e} | {rate / PLUTO_MAX_RATE:>8.2f}x")
+    for workers in sorted({1, 2, os.cpu_count() or 1}):
+        rate = measure_offload(workers)
+        print(f"{workers:>8} | {rate:>12.3e} | {rate / PLUTO_MAX_RATE:>8.2f}x")
+    return 0
+
+
+# Run the benchmark
+if __name__ == "__main__":
+    sys.exit(main())
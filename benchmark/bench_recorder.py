@@ -0,0 +1,93 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Benchmark the recorder module.
+
+## Description
+Measures the sustained write throughput of the recorder and compares it
+with the maximum sample rate of the ADALM-Pluto. The recording is written
+to a temporary directory and deleted afterwards.
+
+Run with:
+```
+python -m benchmark.bench_recorder
+```
+
+### Details
+- *File:*     `bench_recorder.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import sys
+import time
+import tempfile
+from pathlib import Path
+import numpy as np
+from plutostudio.core.recorder import Recorder
+
+# === Constants ===
+PLUTO_MAX_RATE = 61.44e6
+
+# === Functions ===
+def measure_record(block_size: int = 2**16, total: int = 2**26) -> tuple:
+    """Measure the throughput of the recorder.
+
+    The blocks are handed to the recorder as fast as possible, like an
+    acquisition thread would do.
+
+    Args:
+        block_size (int, optional): The number of samples per block. Defaults to 2**16.
+        total (int, optional): The number of samples to record. Defaults to 2**26.
+
+    Returns:
+        tuple: The throughput in samples per second and the number of dropped samples.
+    """
+    block = np.zeros(block_size, dtype=np.complex64)
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = Recorder(Path(directory) / "bench", PLUTO_MAX_RATE, max_segment_bytes=2**28)
+        start = time.perf_counter()
+        recorder.start()
+        for _ in range(total // block_size):
+            while not recorder.put(block):
+                time.sleep(0.0001)
+        recorder.stop()
+        elapsed = time.perf_counter() - start
+    return recorder.samples_written / elapsed, recorder.dropped
+
+
+def main() -> int:
+    """Run the recorder benchmark and print the results."""
+    print(f"{'block size':>10} | {'rate [S/s]':>12} | {'rate [MB/s]':>11} | {'Pluto max':>9}")
+    for block_size in (2**12, 2**16, 2**20):
+        rate, _ = measure_record(block_size)
+        ratio = rate / PLUTO_MAX_RATE
+        print(f"{block_size:>10} | {rate:>12.3e} | {rate * 8 / 1e6:>11.1f} | {ratio:>8.2f}x")
+    return 0
+
+
+# Run the benchmark
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Benchmark the spectrum module.
+
+## Description
+Measures the throughput of the spectrum processing in samples per second
+for different FFT sizes and compares it with the maximum sample rate of the
+ADALM-Pluto.
+
+Run with:
+```
+python -m benchmark.bench_spectrum
+```
+
+### Details
+- *File:*     `bench_spectrum.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import sys
+import time
+import numpy as np
+from plutostudio.core.spectrum import Spectrum
+
+# === Constants ===
+PLUTO_MAX_RATE = 61.44e6
+
+# === Functions ===
+def measure_update(
+    fft_size: int, block_size: int = 2**18, duration: float = 0.5, **kwargs
+) -> float:
+    """Measure the processing throughput of the spectrum.
+
+    Args:
+        fft_size (int): The FFT size.
+        block_size (int, optional): The number of samples per update. Defaults to 2**18.
+        duration (float, optional): The minimum measurement time in seconds. Defaults to 0.5.
+        **kwargs: Further settings passed to the spectrum.
+
+    Returns:
+        float: The throughput in samples per second.
+    """
+    uut = Spectrum(fft_size, **kwargs)
+    rng = np.random.default_rng(0)
+    block = rng.standard_normal(block_size) + 1j * rng.standard_normal(block_size)
+    block = block.astype(np.complex64)
+
+    # Repeat the updates until the measurement time has passed
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < duration:
+        uut.update(block)
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return calls * block_size / elapsed
+
+
+def main() -> int:
+    """Run the spectrum benchmark and print the results."""
+    print(f"{'FFT size':>8} | {'overlap':>7} | {'rate [S/s]':>12} | {'Pluto max':>9}")
+    for fft_size in (256, 1024, 4096, 16384, 65536):
+        for overlap in (0.0, 0.5):
+            rate = measure_update(fft_size, overlap=overlap)
+            ratio = rate / PLUTO_MAX_RATE
+            print(f"{fft_size:>8} | {overlap:>7.2f} | {rate:>12.3e} | {ratio:>8.2f}x")
+    return 0
+
+
+# Run the benchmark
+if __name__ == "__main__":
+    sys.exit(main())
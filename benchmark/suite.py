@@ -0,0 +1,350 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Run the benchmark suite.
+
+## Description
+Measures the throughput of the buffers, the acquisition rate of the
+`RandomGenerator` and the frame times of the `DefaultViewer` and the
+`WaterfallViewer`. The viewers are rendered off-screen on the Agg
+backend, so the suite needs neither a device nor a display. The startup
+cost of the entry points is measured with `python -X importtime` in fresh
+interpreters.
+
+The results are written as JSON together with the commit and the versions
+of the environment. A previous result can be passed to compare against,
+the suite then prints the change of every measurement and fails when one
+regressed by more than the tolerance.
+
+Run with:
+```
+python -m benchmark.suite --output results.json
+python -m benchmark.suite --compare results.json
+```
+
+### Details
+- *File:*     `suite.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+import matplotlib
+import numpy as np
+
+# Render without a display, must be selected before pyplot is imported
+matplotlib.use("Agg")
+
+# pylint: disable=wrong-import-position
+from plutostudio import __version__
+from plutostudio.core.buffer import CircularBuffer, FixedBuffer
+from plutostudio.core.device import RandomGenerator
+from plutostudio.core import dsp
+from plutostudio.core.metrics import Histogram
+from plutostudio.ui.viewer import DefaultViewer, WaterfallViewer
+
+# === Constants ===
+BLOCK_SIZES = (64, 1024, 16384, 65536)
+CAPACITY = 2**17
+TOLERANCE = 0.2
+STARTUP_MODULES = (
+    "plutostudio.cli",
+    "plutostudio.core.device",
+    "plutostudio.ui.viewer",
+    "plutostudio.ui.app",
+)
+LOWER_IS_BETTER = ("import.", ".draw.")
+
+# === Functions ===
+def _repeat(function, duration: float) -> tuple:
+    """Call a function repeatedly until the duration has passed.
+
+    Args:
+        function (function): The function to call without arguments.
+        duration (float): The minimum measurement time in seconds.
+
+    Returns:
+        tuple: The number of calls and the elapsed time in seconds.
+    """
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < duration:
+        function()
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return calls, elapsed
+
+
+def bench_buffers(duration: float = 0.5) -> dict:
+    """Measure the put and get throughput of the buffers.
+
+    The fixed buffer is cleared whenever the next block would not fit, so
+    only complete blocks are measured.
+
+    Args:
+        duration (float, optional): The measurement time per case in seconds. Defaults to 0.5.
+
+    Returns:
+        dict: The samples per second of each buffer, operation and block size.
+    """
+    results = {}
+    for buffer_class in (FixedBuffer, CircularBuffer):
+        name = buffer_class.__name__
+        for block_size in BLOCK_SIZES:
+            uut = buffer_class(CAPACITY, dtype=np.complex64)
+            block = np.ones(block_size, dtype=np.complex64)
+
+            def put(uut=uut, block=block):
+                if uut.size + block.size > uut.capacity:
+                    uut.clear()
+                uut.put(block)
+
+            calls, elapsed = _repeat(put, duration)
+            results[f"{name}.put.{block_size}"] = calls * block_size / elapsed
+
+        # Reading copies the whole content, like handing it to a viewer
+        calls, elapsed = _repeat(lambda uut=uut: uut.get().copy(), duration)
+        results[f"{name}.get.{CAPACITY}"] = calls * CAPACITY / elapsed
+    return results
+
+
+def bench_devices(duration: float = 0.5) -> dict:
+    """Measure the acquisition rate of the random generator.
+
+    Args:
+        duration (float, optional): The measurement time in seconds. Defaults to 0.5.
+
+    Returns:
+        dict: The samples per second of the device.
+    """
+    device = RandomGenerator()
+    size = device.acquire().size
+    calls, elapsed = _repeat(device.acquire, duration)
+    return {"RandomGenerator.acquire": calls * size / elapsed}
+
+
+def bench_filters(duration: float = 0.5, block_size: int = 16384) -> dict:
+    """Measure the throughput of the decimating filters.
+
+    Args:
+        duration (float, optional): The measurement time per filter in seconds. Defaults to 0.5.
+        block_size (int, optional): The number of input samples per block. Defaults to 16384.
+
+    Returns:
+        dict: The input samples per second of each filter.
+    """
+    rng = np.random.default_rng(0)
+    block = rng.standard_normal(block_size) + 1j * rng.standard_normal(block_size)
+    block = block.astype(np.complex64)
+    filters = {
+        "FirDecimator.8": dsp.FirDecimator(8),
+        "HalfbandCascade.8": dsp.halfband_cascade(3),
+        "CicChain.8": dsp.cic_chain(8),
+        "CicChain.64": dsp.cic_chain(64),
+        "DigitalDownConverter.4x16": dsp.DigitalDownConverter(
+            1.0, [-0.3, -0.1, 0.1, 0.3], decimation=16
+        ),
+    }
+    results = {}
+    for name, uut in filters.items():
+        calls, elapsed = _repeat(lambda uut=uut: uut.process(block), duration)
+        results[f"{name}.process"] = calls * block_size / elapsed
+    return results
+
+
+def bench_viewers(frames: int = 50) -> dict:
+    """Measure the frame times of the default and the waterfall viewer on the Agg backend.
+
+    The first frame draws the complete figure and is not measured.
+
+    Args:
+        frames (int, optional): The number of measured frames per data size. Defaults to 50.
+
+    Returns:
+        dict: The median and the 99th percentile frame time in seconds per data size.
+    """
+    rng = np.random.default_rng(0)
+    results = {}
+    for size in (1024, 65536):
+        viewer = DefaultViewer(None)
+        data = (rng.standard_normal(size) + 1j * rng.standard_normal(size)).astype(np.complex64)
+        viewer.draw(data)
+        histogram = Histogram()
+        for _ in range(frames):
+            with histogram.time():
+                viewer.draw(data)
+        results[f"DefaultViewer.draw.{size}.p50"] = histogram.percentile(50)
+        results[f"DefaultViewer.draw.{size}.p99"] = histogram.percentile(99)
+    viewer = WaterfallViewer(None, bins=1024, rows=512)
+    viewer.figure.set_size_inches(19.2, 10.0)
+    spectrum = rng.uniform(-120.0, 0.0, 1024)
+    viewer.draw(spectrum)
+    histogram = Histogram()
+    for _ in range(frames):
+        with histogram.time():
+            viewer.draw(spectrum)
+    results["WaterfallViewer.draw.1024x512.p50"] = histogram.percentile(50)
+    results["WaterfallViewer.draw.1024x512.p99"] = histogram.percentile(99)
+    return results
+
+
+def import_time(report: str, module: str) -> float | None:
+    """Get the cumulative import time of a module from a `-X importtime` report.
+
+    Args:
+        report (str): The report written to stderr by `python -X importtime`.
+        module (str): The name of the module.
+
+    Returns:
+        float | None: The import time in seconds, None when the module is not in the report.
+    """
+    for line in report.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) * 1e-6
+    return None
+
+
+def bench_startup(repeat: int = 3) -> dict:
+    """Measure the import time of the entry points in fresh interpreters.
+
+    The best of the repetitions is reported, the others include the time
+    to warm up the file system cache. Modules which cannot be imported,
+    e.g. the GUI without Tk, are skipped.
+
+    Args:
+        repeat (int, optional): The number of interpreters per module. Defaults to 3.
+
+    Returns:
+        dict: The import time in seconds of each module.
+    """
+    results = {}
+    for module in STARTUP_MODULES:
+        times = []
+        for _ in range(repeat):
+            report = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            if report.returncode != 0:
+                break
+            times.append(import_time(report.stderr, module))
+        if times and None not in times:
+            results[f"import.{module}"] = min(times)
+    return results
+
+
+def environment() -> dict:
+    """Describe the environment of the measurement.
+
+    Returns:
+        dict: The commit, the versions and the platform.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "plutostudio": __version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float = TOLERANCE) -> list:
+    """Compare the results with a previous run.
+
+    Rates are better when higher, frame times are better when lower.
+
+    Args:
+        results (dict): The new results.
+        baseline (dict): The results of the previous run.
+        tolerance (float, optional): The relative change which counts as regression.
+            Defaults to TOLERANCE.
+
+    Returns:
+        list: The names of the regressed measurements.
+    """
+    regressions = []
+    print(f"{'measurement':<36} | {'baseline':>10} | {'current':>10} | {'change':>8}")
+    for name, value in results.items():
+        if name not in baseline:
+            continue
+        change = value / baseline[name] - 1
+        # Frame and import times are durations, for them an increase is a regression
+        if any(token in name for token in LOWER_IS_BETTER):
+            change = -change
+        flag = " !" if change < -tolerance else ""
+        print(f"{name:<36} | {baseline[name]:>10.3e} | {value:>10.3e} | {change:>+7.1%}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: list | None = None) -> int:
+    """Run the benchmark suite and save the results."""
+    parser = argparse.ArgumentParser(description="Run the PlutoStudio benchmark suite.")
+    parser.add_argument("--output", type=Path, help="write the results as JSON to this file")
+    parser.add_argument("--compare", type=Path, help="compare with the results of a previous run")
+    parser.add_argument(
+        "--duration", type=float, default=0.5, help="measurement time per case in seconds"
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    results.update(bench_buffers(args.duration))
+    results.update(bench_devices(args.duration))
+    results.update(bench_filters(args.duration))
+    results.update(bench_viewers())
+    results.update(bench_startup())
+    document = {"environment": environment(), "results": results}
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))["results"]
+        return 1 if compare(results, baseline) else 0
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+# Run the benchmark
+if __name__ == "__main__":
+    sys.exit(main())
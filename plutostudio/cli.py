@@ -0,0 +1,350 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Run the acquisition without the GUI.
+
+## Description
+Headless entry point for capture servers without a display. A device is
+acquired through the pipeline and the samples are recorded to SigMF
+files or streamed to stdout, while the status is printed to stderr.
+
+Only the core modules are imported, and only when they are needed, so
+neither Tk nor matplotlib is loaded. The time from the start of the
+module until the acquisition runs is checked against `STARTUP_BUDGET`.
+
+Run with:
+```
+python PlutoStudio.py --headless --device pluto --lo 433.92e6 --record capture
+python -m plutostudio.cli --device signal --duration 5 --stream - > samples.cf32
+```
+
+### Details
+- *File:*     `cli.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import time
+
+# Measure the startup from the first import on
+_START = time.perf_counter()
+
+# pylint: disable=wrong-import-position
+import argparse
+import logging
+import math
+import sys
+from pathlib import Path
+from threading import Event
+
+# === Logging ===
+logger = logging.getLogger(__name__)
+
+# === Constants ===
+DEVICES = ("pluto", "signal", "random", "file")
+MODES = ("fm", "am", "usb", "lsb")
+SAMPLE_RATE = 4e6
+STARTUP_BUDGET = 0.5
+AUDIO_LATENCY = 0.06
+
+# === Functions ===
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the parser for the command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(description="Acquire from a device without the GUI.")
+    parser.add_argument(
+        "--device", choices=DEVICES, default="pluto", help="the source of the samples"
+    )
+    parser.add_argument("--uri", default="", help="the context URI of the Pluto, e.g. usb:1.2.5")
+    parser.add_argument("--file", type=Path, help="the recording to replay with the file device")
+    parser.add_argument(
+        "--realtime",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="replay files at their sample rate",
+    )
+    parser.add_argument("--lo", type=float, default=1e9, help="the center frequency in Hz")
+    parser.add_argument(
+        "--sample-rate",
+        type=float,
+        help=f"the sample rate, defaults to {SAMPLE_RATE:g} or the rate of the recording",
+    )
+    parser.add_argument(
+        "--block-size", type=int, default=2**16, help="the number of samples per block"
+    )
+    parser.add_argument("--duration", type=float, help="stop after this many seconds")
+    parser.add_argument("--samples", type=int, help="stop after at least this many samples")
+    parser.add_argument("--record", type=Path, help="record to SigMF files with this base path")
+    parser.add_argument("--stream", metavar="-", help="stream the raw complex64 samples to stdout")
+    parser.add_argument(
+        "--spectrum", type=int, metavar="FFT_SIZE", help="report the strongest spectral peak"
+    )
+    parser.add_argument(
+        "--channel",
+        type=float,
+        action="append",
+        metavar="OFFSET",
+        help="monitor the channel at this offset in Hz",
+    )
+    parser.add_argument("--decimation", type=int, default=16, help="the decimation of the channels")
+    parser.add_argument(
+        "--demod",
+        choices=MODES,
+        help="demodulate the first channel, or the center without channels",
+    )
+    parser.add_argument("--audio", type=Path, help="write the demodulated audio to this WAV file")
+    parser.add_argument(
+        "--metrics", type=Path, help="write the performance metrics as JSON to this file"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=1.0, help="the status interval in seconds"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="log debug messages")
+    return parser
+
+
+def create_device(args: argparse.Namespace):
+    """Create the device selected on the command line.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+
+    Raises:
+        ValueError: The file device is selected without a file.
+
+    Returns:
+        tuple: The device and its sample rate.
+    """
+    # pylint: disable=import-outside-toplevel
+    from plutostudio.core import device
+
+    rate = args.sample_rate or SAMPLE_RATE
+    if args.device == "pluto":
+        config = device.PlutoConfig(
+            lo=int(args.lo), sample_rate=int(rate), bandwidth=int(rate), buffer_size=args.block_size
+        )
+        return device.Pluto(config, uri=args.uri), rate
+    if args.device == "signal":
+        generator = device.SignalGenerator(block_size=args.block_size, sample_rate=rate)
+        generator.add_tone(rate / 8, amplitude=0.5)
+        generator.set_noise(snr=30.0)
+        return generator, rate
+    if args.device == "random":
+        return device.RandomGenerator(), rate
+    if args.file is None:
+        raise ValueError("The file device needs a recording, pass it with --file.")
+    replay = device.FileReplayDevice(
+        args.file,
+        block_size=args.block_size,
+        sample_rate=args.sample_rate,
+        realtime=args.realtime,
+        loop=False,
+    )
+    return replay, replay.sample_rate
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the acquisition until it is stopped.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+
+    Returns:
+        int: The exit code.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+    from plutostudio.core.metrics import Telemetry
+    from plutostudio.core.pipeline import Pipeline
+
+    source, sample_rate = create_device(args)
+    pipeline = Pipeline(source)
+    telemetry = Telemetry()
+    stopped = Event()
+    peak = [math.nan, math.nan]
+    channels = []
+
+    # Report the strongest frequency of the averaged spectrum, as a sink the lossy queue never
+    # decouples the other sinks from the source
+    if args.spectrum:
+        from plutostudio.core.spectrum import Spectrum, frequencies, to_db
+
+        spectrum = Spectrum(args.spectrum)
+        bins = frequencies(args.spectrum, sample_rate)
+
+        def analyze(block: np.ndarray) -> None:
+            if spectrum.update(block):
+                power = spectrum.get()
+                index = int(np.argmax(power))
+                peak[:] = [float(bins[index]), float(to_db(power[index]))]
+
+        pipeline.add_sink(analyze, name="spectrum", policy="drop-oldest")
+
+    # Down-convert the channels and report their power
+    if args.channel:
+        from plutostudio.core.dsp import DigitalDownConverter
+        from plutostudio.core.spectrum import to_db
+
+        ddc = DigitalDownConverter(sample_rate, args.channel, decimation=args.decimation)
+        channels[:] = [math.nan] * len(args.channel)
+
+        def monitor(block: np.ndarray) -> None:
+            output = ddc.process(block)
+            if output.shape[1]:
+                channels[:] = to_db(np.mean(np.abs(output) ** 2, axis=1)).tolist()
+
+        pipeline.add_sink(monitor, name="ddc", policy="drop-oldest")
+
+    # Demodulate on the thread of the sink, the player paces the audio output. Sources which run
+    # faster than real time wait for the player, the short queue keeps the latency of the sink low.
+    player = None
+    if args.demod is not None:
+        if args.audio is None:
+            raise ValueError("The demodulator needs an audio output, pass it with --audio.")
+        from plutostudio.core.audio import AudioPlayer, WavOutput
+        from plutostudio.core.demodulator import Receiver
+
+        receiver = Receiver(args.demod, sample_rate, args.channel[0] if args.channel else 0.0)
+        realtime = args.device == "pluto" or (args.device == "file" and args.realtime)
+        wav = WavOutput(args.audio, receiver.audio_rate)
+        player = AudioPlayer(wav, max_latency=AUDIO_LATENCY, block=not realtime)
+        player.register(telemetry)
+        pipeline.add_sink(
+            lambda block: player.put(receiver.process(block)), name="audio", max_blocks=2
+        )
+
+    # Record to disk, the recorder buffers the blocks for its writer thread
+    recorder = None
+    if args.record is not None:
+        from plutostudio.core.recorder import Recorder
+
+        recorder = Recorder(args.record, sample_rate, center_frequency=args.lo)
+        pipeline.add_sink(recorder.put, name="recorder")
+
+    # Stream the raw samples, a closed pipe ends the acquisition
+    if args.stream is not None:
+        output = sys.stdout.buffer
+
+        def stream(block: np.ndarray) -> None:
+            try:
+                output.write(np.asarray(block, dtype=np.complex64).tobytes())
+            except BrokenPipeError:
+                stopped.set()
+
+        pipeline.add_sink(stream, name="stream")
+
+    # Start the acquisition and check the startup time
+    pipeline.register(telemetry)
+    if recorder is not None:
+        recorder.start()
+    if player is not None:
+        player.start()
+    pipeline.start()
+    startup = time.perf_counter() - _START
+    telemetry.add("cli.startup", lambda: startup)
+    logger.info("Acquisition started after %.3f s.", startup)
+    if startup > STARTUP_BUDGET:
+        logger.warning("Startup took %.3f s, over the budget of %.3f s.", startup, STARTUP_BUDGET)
+
+    # Print the status until a stop condition is reached
+    deadline = time.monotonic() + args.duration if args.duration else math.inf
+    report = time.monotonic() + args.interval
+    try:
+        while pipeline.is_acquiring() and not stopped.is_set():
+            if args.samples is not None and pipeline.rate.total >= args.samples:
+                break
+            if recorder is not None and not recorder.is_recording():
+                break
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            if now >= report:
+                _report(pipeline, peak, channels)
+                report += args.interval
+            stopped.wait(min(0.05, deadline - now))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pipeline.stop(drain=True)
+        if player is not None:
+            player.stop()
+        if source.is_connected():
+            source.disconnect()
+        # Raises the error of the writer thread, so the run fails
+        if recorder is not None:
+            recorder.stop()
+
+    print(f"Acquired {pipeline.rate.total} samples.", file=sys.stderr)
+    if args.metrics is not None:
+        telemetry.to_json(args.metrics)
+    return 0
+
+
+def _report(pipeline, peak: list, channels: list) -> None:
+    """Print the status of the acquisition to stderr.
+
+    Args:
+        pipeline (Pipeline): The running pipeline.
+        peak (list): The frequency and the power of the strongest peak.
+        channels (list): The power of each down-converted channel.
+    """
+    dropped = sum(stage.dropped for stage in pipeline.stages)
+    status = f"{pipeline.rate.total:>14} samples | {pipeline.rate.rate / 1e6:8.3f} MS/s"
+    status += f" | {dropped} dropped"
+    if not math.isnan(peak[0]):
+        status += f" | peak {peak[1]:7.1f} dB at {peak[0] / 1e3:10.3f} kHz"
+    if channels:
+        status += " | channels " + " ".join(f"{power:6.1f}" for power in channels) + " dB"
+    print(status, file=sys.stderr)
+
+
+def main(argv: list | None = None) -> int:
+    """Main entry point for the headless acquisition.
+
+    Args:
+        argv (list | None, optional): The command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: The exit code.
+    """
+    args = create_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO, format="%(levelname)s: %(message)s"
+    )
+    try:
+        return run(args)
+    except (OSError, ValueError) as error:
+        logger.error("%s", error)
+        return 1
+
+
+# Run the acquisition
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,389 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Acquire data from several devices at once.
+
+## Description
+Runs the acquisition of several devices concurrently, each on its own
+worker thread. The blocks of every device are tagged with a monotonic
+timestamp and a sample counter, so consumers can request time-aligned
+windows across the devices.
+
+### Details
+- *File:*     `acquisition.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from threading import Thread, Event, Lock
+import numpy as np
+from .buffer import CircularBuffer
+from .device import Device, DeviceSupervisor
+from .metrics import RateCounter
+
+# === Logging ===
+logger = logging.getLogger(__name__)
+
+# === Classes ===
+
+
+@dataclass(frozen=True)
+class BlockTag:
+    """Position of an acquired block on the common time base.
+
+    Attributes:
+        sample (int): The index of the first sample of the block since the start.
+        timestamp (float): The monotonic time of the first sample in seconds.
+        size (int): The number of samples in the block.
+    """
+    sample: int
+    timestamp: float
+    size: int
+
+
+class DeviceStream:
+    """This class holds the acquired history of one device.
+
+    The newest samples are kept in a circular buffer per channel. Every
+    block written to the stream is tagged with the index of its first sample
+    and the monotonic time at which it was sampled. The time of a sample is
+    interpolated from the tag of the newest block at or before the sample,
+    so the jitter of the block timestamps does not accumulate.
+
+    The stream is written by the worker thread of the device and read by the
+    consumers, a short lock protects only the copying of the samples.
+    """
+
+    @property
+    def samples(self) -> int:
+        """Get the number of samples written since the start.
+
+        Returns:
+            int: The sample counter.
+        """
+        return self._samples
+
+    @property
+    def oldest(self) -> int:
+        """Get the index of the oldest sample still in the history.
+
+        Returns:
+            int: The sample index.
+        """
+        return max(self._samples - self._capacity, 0)
+
+    @property
+    def capacity(self) -> int:
+        """Get the number of samples kept in the history.
+
+        Returns:
+            int: The capacity per channel.
+        """
+        return self._capacity
+
+    def __init__(
+        self, device: Device, sample_rate: float, capacity: int = 2**20, max_tags: int = 1024
+    ) -> None:
+        """Initialize the stream.
+
+        Args:
+            device (Device): The device which is acquired.
+            sample_rate (float): The sample rate of the device in samples per second.
+            capacity (int, optional): The number of samples kept per channel. Defaults to 2**20.
+            max_tags (int, optional): The number of block tags kept. Defaults to 1024.
+
+        ---
+        """
+        if sample_rate <= 0:
+            raise ValueError("The sample rate must be positive.")
+        self.device = device
+        self.sample_rate: float = float(sample_rate)
+        self.supervisor = DeviceSupervisor(device)
+        self.rate = RateCounter()
+        self._capacity: int = capacity
+        self._history: list[CircularBuffer] = []
+        self._tags: deque[BlockTag] = deque(maxlen=max_tags)
+        self._samples: int = 0
+        self._lock = Lock()
+
+    def put(self, data: np.ndarray, timestamp: float) -> BlockTag:
+        """Put an acquired block into the history.
+
+        Args:
+            data (np.ndarray): The block, one row per channel when more than one channel is enabled.
+            timestamp (float): The monotonic time at which the last sample of the block was
+                received.
+
+        Returns:
+            BlockTag: The tag of the block.
+        """
+        rows = np.atleast_2d(data)
+        size = rows.shape[-1]
+        tag = BlockTag(self._samples, timestamp - size / self.sample_rate, size)
+        with self._lock:
+            if len(self._history) != rows.shape[0]:
+                self._history = [CircularBuffer(self._capacity, dtype=np.complex64) for _ in rows]
+            for history, row in zip(self._history, rows):
+                history.put(row)
+            self._tags.append(tag)
+            self._samples += size
+        self.rate.add(size)
+        return tag
+
+    def sample_at(self, timestamp: float) -> int:
+        """Get the index of the sample taken at the given time.
+
+        Args:
+            timestamp (float): The monotonic time in seconds.
+
+        Raises:
+            IndexError: No block was acquired yet.
+
+        Returns:
+            int: The index of the sample, may be in the future or out of the history.
+        """
+        with self._lock:
+            if not self._tags:
+                raise IndexError(f"No data acquired from {self.device.name} yet.")
+            reference = self._tags[0]
+            for tag in reversed(self._tags):
+                if tag.timestamp <= timestamp:
+                    reference = tag
+                    break
+        return reference.sample + round((timestamp - reference.timestamp) * self.sample_rate)
+
+    def time_of(self, sample: int) -> float:
+        """Get the time at which the given sample was taken.
+
+        Args:
+            sample (int): The index of the sample.
+
+        Raises:
+            IndexError: No block was acquired yet.
+
+        Returns:
+            float: The monotonic time in seconds.
+        """
+        with self._lock:
+            if not self._tags:
+                raise IndexError(f"No data acquired from {self.device.name} yet.")
+            reference = self._tags[0]
+            for tag in reversed(self._tags):
+                if tag.sample <= sample:
+                    reference = tag
+                    break
+        return reference.timestamp + (sample - reference.sample) / self.sample_rate
+
+    def read(self, sample: int, count: int) -> np.ndarray:
+        """Copy samples out of the history.
+
+        Args:
+            sample (int): The index of the first sample.
+            count (int): The number of samples.
+
+        Raises:
+            IndexError: The samples are not in the history.
+
+        Returns:
+            np.ndarray: The samples, one row per channel when more than one channel is enabled.
+        """
+        with self._lock:
+            oldest = max(self._samples - self._capacity, 0)
+            if sample < oldest or sample + count > self._samples or not self._history:
+                raise IndexError(
+                    f"Samples {sample} to {sample + count} of {self.device.name} are not in the "
+                    f"history ({oldest} to {self._samples})."
+                )
+            start = self._history[0].size - (self._samples - sample)
+            rows = [history.get()[start : start + count].copy() for history in self._history]
+        return rows[0] if len(rows) == 1 else np.stack(rows)
+
+    def clear(self) -> None:
+        """Discard the history and restart the sample counter."""
+        with self._lock:
+            self._history = []
+            self._tags.clear()
+            self._samples = 0
+        self.rate.reset()
+
+
+class AcquisitionManager:
+    """This class acquires several devices concurrently.
+
+    Every device is acquired by its own worker thread through a
+    `DeviceSupervisor`, which reconnects the device when it fails. The
+    threads only wait for the drivers, which release the GIL while waiting
+    for the USB transfers, so the throughput scales with the number of
+    devices until the bus is saturated.
+
+    Each device writes to its own `DeviceStream`. Consumers request windows
+    with `window()`, which returns the samples of all devices taken at the
+    same time.
+    """
+
+    @property
+    def streams(self) -> tuple:
+        """Get the streams of the devices.
+
+        Returns:
+            tuple: The DeviceStream of each device in the order they were added.
+        """
+        return tuple(self._streams)
+
+    def __init__(self, capacity: int = 2**20, clock=time.monotonic) -> None:
+        """Initialize the manager.
+
+        Args:
+            capacity (int, optional): The number of samples kept per device and channel.
+                Defaults to 2**20.
+            clock (function, optional): The monotonic clock to timestamp the blocks.
+                Defaults to time.monotonic.
+
+        ---
+        """
+        self.capacity: int = capacity
+        self._clock = clock
+        self._streams: list[DeviceStream] = []
+        self._threads: list[Thread] = []
+        self._stop_event = Event()
+
+    def add_device(self, device: Device, sample_rate: float | None = None) -> DeviceStream:
+        """Add a device to the acquisition.
+
+        Args:
+            device (Device): The device to acquire.
+            sample_rate (float | None, optional): The sample rate of the device.
+                Defaults to the rate of the device.
+
+        Raises:
+            RuntimeError: The acquisition is running.
+            ValueError: The sample rate of the device is unknown.
+
+        Returns:
+            DeviceStream: The stream of the device.
+        """
+        if self.is_running():
+            raise RuntimeError("Devices cannot be added while the acquisition is running.")
+        sample_rate = sample_rate or getattr(device, "sample_rate", None)
+        if not sample_rate:
+            raise ValueError(f"The sample rate of {device.name} is unknown.")
+        stream = DeviceStream(device, sample_rate, self.capacity)
+        self._streams.append(stream)
+        return stream
+
+    def is_running(self) -> bool:
+        """Check whether the acquisition threads are running.
+
+        Returns:
+            bool: True when at least one thread is running.
+        """
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        """Start one acquisition thread per device."""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._threads = [
+            Thread(
+                target=self._acquire,
+                args=(stream,),
+                name=f"acquire-{stream.device.name}",
+                daemon=True,
+            )
+            for stream in self._streams
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the acquisition threads and disconnect the devices.
+
+        Args:
+            timeout (float | None, optional): The time to wait for each thread in seconds.
+                Defaults to None.
+
+        ---
+        """
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        for stream in self._streams:
+            if stream.device.is_connected():
+                stream.device.disconnect()
+
+    def latest(self) -> float:
+        """Get the newest time covered by all devices.
+
+        Raises:
+            IndexError: A device has not acquired any data yet.
+
+        Returns:
+            float: The monotonic time of the newest sample acquired by every device.
+        """
+        return min(stream.time_of(stream.samples) for stream in self._streams)
+
+    def window(self, count: int, timestamp: float | None = None) -> tuple:
+        """Get time-aligned windows of all devices.
+
+        Args:
+            count (int): The number of samples per device.
+            timestamp (float | None, optional): The monotonic time of the first sample.
+                Defaults to the newest window which all devices have acquired.
+
+        Raises:
+            IndexError: The window is not in the history of all devices.
+
+        Returns:
+            tuple: The samples of each device in the order the devices were added.
+        """
+        if timestamp is None:
+            # A late block tag moves the latest time past the stored samples,
+            # the window then ends at the newest stored sample
+            timestamp = self.latest() - count / min(stream.sample_rate for stream in self._streams)
+            return tuple(
+                stream.read(min(stream.sample_at(timestamp), stream.samples - count), count)
+                for stream in self._streams
+            )
+        return tuple(stream.read(stream.sample_at(timestamp), count) for stream in self._streams)
+
+    def _acquire(self, stream: DeviceStream) -> None:
+        """The acquisition loop of one device.
+
+        Args:
+            stream (DeviceStream): The stream of the device.
+        """
+        while not self._stop_event.is_set():
+            try:
+                data = stream.supervisor.acquire(self._stop_event)
+            except EOFError:
+                logger.info("Acquisition of %s reached the end of the data.", stream.device.name)
+                return
+            if data.size:
+                stream.put(data, self._clock())
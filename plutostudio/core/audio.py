@@ -0,0 +1,330 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Play demodulated audio.
+
+## Description
+The audio player moves the audio samples from the processing threads to an
+audio output. The producer puts the blocks into a bounded ring buffer, the
+player thread takes one period of samples from it at the pace of the
+audio clock and writes it to the output. When the buffer runs empty the
+period is filled with silence, so the output never has gaps, and the size
+of the buffer bounds the latency which is added to the audio.
+
+The outputs are pluggable, the WAV file output is the reference output
+which needs no sound card.
+
+### Details
+- *File:*     `audio.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import time
+import wave
+from pathlib import Path
+from threading import Thread, Event
+import numpy as np
+from .buffer import RingBuffer
+from .metrics import Histogram, Telemetry
+
+# === Constants ===
+AUDIO_RATE = 48000
+PERIOD = 0.02
+MAX_LATENCY = 0.1
+
+# === Classes ===
+
+
+class AudioOutput:
+    """Base class for all audio outputs.
+
+    An output receives periods of float32 samples in the range [-1, 1].
+    Outputs which write to a sound card should block in `write()` until the
+    device accepts the samples, the player then follows the device clock.
+    """
+
+    def __init__(self, sample_rate: float) -> None:
+        """Initialize the output.
+
+        Args:
+            sample_rate (float): The sample rate of the audio in Hz.
+
+        ---
+        """
+        self.sample_rate: float = sample_rate
+
+    def open(self) -> None:
+        """Open the output before the first period is written."""
+
+    def close(self) -> None:
+        """Close the output after the last period is written."""
+
+    def write(self, samples: np.ndarray) -> None:
+        """Write one period of audio samples.
+
+        Args:
+            samples (np.ndarray): The float32 samples.
+
+        Raises:
+            NotImplementedError: The function has to be implemented by the actual output class.
+        """
+        raise NotImplementedError(
+            "This function needs to be implemented by the actual output class."
+        )
+
+
+class WavOutput(AudioOutput):
+    """This class writes the audio to a mono 16 bit WAV file."""
+
+    @property
+    def frames(self) -> int:
+        """Get the number of samples written so far.
+
+        Returns:
+            int: The number of written samples.
+        """
+        return self._frames
+
+    def __init__(self, path: str | Path, sample_rate: float) -> None:
+        """Initialize the output.
+
+        Args:
+            path (str | Path): The path of the WAV file.
+            sample_rate (float): The sample rate of the audio in Hz, rounded to an integer.
+
+        ---
+        """
+        super().__init__(sample_rate)
+        self.path = Path(path)
+        self._file = None
+        self._frames: int = 0
+
+    def open(self) -> None:
+        """Create the WAV file."""
+        self._file = wave.open(str(self.path), "wb")
+        self._file.setnchannels(1)
+        self._file.setsampwidth(2)
+        self._file.setframerate(round(self.sample_rate))
+        self._frames = 0
+
+    def close(self) -> None:
+        """Finish the WAV file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def write(self, samples: np.ndarray) -> None:
+        """Write one period of audio samples.
+
+        Args:
+            samples (np.ndarray): The float32 samples, clipped to [-1, 1].
+        """
+        pcm = np.rint(np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+        self._file.writeframes(pcm.tobytes())
+        self._frames += pcm.size
+
+
+class AudioPlayer:
+    """This class plays audio from a bounded ring buffer on its own thread.
+
+    The player waits until `prefill` seconds of audio are buffered and then
+    writes one period every `period` seconds. Periods which find the buffer
+    empty are padded with silence and counted as underrun.
+
+    Blocks which do not fit into the buffer of `max_latency` seconds are
+    dropped and counted as overrun, so a real-time source never stalls.
+    Sources which are faster than real time, e.g. generators, should use
+    `block`: the producer then waits for room in the buffer, which paces
+    the source to the audio clock through the backpressure of the pipeline.
+    """
+
+    @property
+    def latency(self) -> float:
+        """Get the current latency added by the buffer.
+
+        Returns:
+            float: The buffered audio in seconds.
+        """
+        return self._buffer.size / self.output.sample_rate
+
+    @property
+    def underruns(self) -> int:
+        """Get the number of periods which were padded with silence.
+
+        Returns:
+            int: The number of underruns.
+        """
+        return self._underruns
+
+    @property
+    def overruns(self) -> int:
+        """Get the number of blocks dropped because the buffer was full.
+
+        Returns:
+            int: The number of overruns.
+        """
+        return self._buffer.overruns
+
+    def is_playing(self) -> bool:
+        """Check if the player is running.
+
+        Returns:
+            bool: True if the player thread is running, False otherwise.
+        """
+        return self._thread is not None
+
+    def __init__(
+        self, output: AudioOutput, period: float = PERIOD, max_latency: float = MAX_LATENCY,
+        prefill: float | None = None, block: bool = False,
+    ) -> None:
+        """Initialize the player.
+
+        Args:
+            output (AudioOutput): The output to play the audio on.
+            period (float, optional): The duration of one written period in seconds.
+                Defaults to PERIOD.
+            max_latency (float, optional): The capacity of the buffer in seconds.
+                Defaults to MAX_LATENCY.
+            prefill (float | None, optional): The buffered audio before the playback starts in
+                seconds. Defaults to two periods.
+            block (bool, optional): Wait for room in the buffer instead of dropping blocks.
+                Defaults to False.
+
+        Raises:
+            ValueError: The buffer cannot hold the prefill and one period.
+
+        ---
+        """
+        prefill = 2 * period if prefill is None else prefill
+        if prefill + period > max_latency:
+            raise ValueError(
+                "The maximum latency has to be larger than the prefill and one period."
+            )
+        self.output: AudioOutput = output
+        self.period: float = period
+        self.prefill: float = prefill
+        self.block: bool = block
+        self.duration: Histogram = Histogram()
+        self._period_size: int = max(1, round(period * output.sample_rate))
+        self._buffer = RingBuffer(round(max_latency * output.sample_rate), dtype=np.float32)
+        self._underruns: int = 0
+        self._stop_event = Event()
+        self._thread = None
+
+    def start(self) -> None:
+        """Open the output and start the player thread."""
+        if self.is_playing():
+            return
+        self._stop_event.clear()
+        self._buffer.clear()
+        self.output.open()
+        self._thread = Thread(target=self._play_loop, name="AudioPlayer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Play the buffered audio, stop the player thread and close the output."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def put(self, samples: np.ndarray) -> bool:
+        """Hand a block of audio samples to the player.
+
+        Note:
+            Must only be called from one producer thread.
+
+        Args:
+            samples (np.ndarray): The audio samples.
+
+        Returns:
+            bool: True if the block was buffered, False if it was dropped.
+        """
+        if not self.block:
+            return self._buffer.put(samples)
+
+        # Hand the block over in pieces as the player makes room, until the player is stopped
+        samples = np.asarray(samples, dtype=np.float32)
+        while samples.size and self.is_playing():
+            free = self._buffer.capacity - self._buffer.size
+            if free:
+                self._buffer.put(samples[:free])
+                samples = samples[free:]
+            elif self._stop_event.wait(self.period / 4):
+                break
+        return samples.size == 0 or self._buffer.put(samples)
+
+    def register(self, telemetry: Telemetry, prefix: str = "audio") -> None:
+        """Register the metrics of the player.
+
+        Args:
+            telemetry (Telemetry): The registry to add the metrics to.
+            prefix (str, optional): The prefix of the metric names. Defaults to "audio".
+
+        ---
+        """
+        telemetry.add(f"{prefix}.write", self.duration)
+        telemetry.add(f"{prefix}.latency", lambda: self.latency)
+        telemetry.add(f"{prefix}.underruns", lambda: self.underruns)
+        telemetry.add(f"{prefix}.overruns", lambda: self.overruns)
+
+    def _play_loop(self) -> None:
+        """Write one period after the other until the player is stopped."""
+        try:
+            # Wait for the prefill, so short delays of the producer do not cause underruns
+            prefill = round(self.prefill * self.output.sample_rate)
+            while self._buffer.size < prefill and not self._stop_event.is_set():
+                self._stop_event.wait(self.period / 4)
+
+            # Schedule the periods on an absolute clock, so the timing errors do not add up
+            deadline = time.monotonic()
+            while not self._stop_event.is_set():
+                self._write_period()
+                deadline += self.period
+                self._stop_event.wait(max(0.0, deadline - time.monotonic()))
+
+            # Play what is left after the stop request
+            while self._buffer.size:
+                self._write_period(final=True)
+        finally:
+            self.output.close()
+
+    def _write_period(self, final: bool = False) -> None:
+        """Write one period to the output, padded with silence when the buffer runs empty.
+
+        Args:
+            final (bool, optional): The period is the end of the audio, the padding is no underrun.
+                Defaults to False.
+        """
+        samples = self._buffer.read_available(self._period_size)
+        if samples.size < self._period_size:
+            if not final:
+                self._underruns += 1
+            padding = np.zeros(self._period_size - samples.size, dtype=np.float32)
+            samples = np.concatenate((samples, padding))
+        with self.duration.time():
+            self.output.write(samples)
@@ -38,6 +38,51 @@ Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
 # === Imports ===
 import numpy as np
 
+# === Constants ===
+# Interleaved 16 bit IQ samples, 4 bytes per complex sample
+IQ_INT16 = np.dtype([("i", np.int16), ("q", np.int16)])
+
+
+# === Functions ===
+def _as_block(data: float | list | np.ndarray, dtype: np.dtype | None = None) -> np.ndarray:
+    """Convert the input data to a flat block of samples.
+
+    Complex data is split into its I and Q components when the target
+    type is the interleaved `IQ_INT16` format.
+
+    Args:
+        data (float | list | np.ndarray): A single sample or a block of samples.
+        dtype (np.dtype | None, optional): The data type of the target buffer. Defaults to None.
+
+    Returns:
+        np.ndarray: The samples as one dimensional array.
+    """
+    block = np.asarray(data)
+    if dtype == IQ_INT16 and block.dtype != IQ_INT16:
+        interleaved = np.empty(block.shape, dtype=IQ_INT16)
+        interleaved["i"] = np.real(block)
+        interleaved["q"] = np.imag(block)
+        block = interleaved
+    return block.reshape(-1)
+
+
+def to_complex(data: np.ndarray) -> np.ndarray:
+    """Convert buffer data to complex IQ samples.
+
+    Args:
+        data (np.ndarray): The data as returned by a buffer.
+
+    Returns:
+        np.ndarray: The data as complex64 samples.
+    """
+    if data.dtype == IQ_INT16:
+        samples = np.empty(data.shape, dtype=np.complex64)
+        samples.real = data["i"]
+        samples.imag = data["q"]
+        return samples
+    return np.asarray(data, dtype=np.complex64)
+
+
 # === Classes ===
 
 
@@ -66,17 +111,28 @@ class Buffer:
         """
         return self._capacity
 
-    def __init__(self, max_capacity: int = 1000) -> None:
+    @property
+    def dtype(self) -> np.dtype:
+        """Get the data type of the samples in the buffer.
+
+        Returns:
+            np.dtype: The data type of the buffer.
+        """
+        return self._data.dtype
+
+    def __init__(self, max_capacity: int = 1000, dtype: np.dtype = np.float64) -> None:
         """Initialize the buffer.
 
         Args:
             max_capacity (int, optional): The maximum capacity of the buffer. Defaults to 1000.
+            dtype (np.dtype, optional): The data type of the samples, e.g. `np.complex64`,
+                `np.float32` or `IQ_INT16`. Defaults to np.float64.
 
         ---
         """
         self._size: int = 0
         self._capacity: int = max_capacity
-        self._data = np.zeros(max_capacity)
+        self._data = np.zeros(max_capacity, dtype=dtype)
 
     def get(self) -> np.ndarray:
         """Get data from the buffer.
@@ -108,53 +164,245 @@ class FixedBuffer(Buffer):
         IndexError: The buffer is full and cannot accept more data.
     """
 
-    def put(self, data: float | list) -> None:
+    def put(self, data: float | list | np.ndarray) -> None:
         """Put data in the buffer.
 
+        The whole block is copied with a single slice assignment. When the
+        block does not fit completely, the part which still fits is stored
+        before the exception is raised.
+
         Args:
-            data (float | list): The data to put in the buffer.
+            data (float | list | np.ndarray): The data to put in the buffer.
 
         Raises:
-            ValueError: _description_
+            IndexError: The buffer is full and cannot accept more data.
 
         ---
         """
-        # Put the data in the buffer
-        try:
-            self._data[self._size] = data
-            self._size += 1
-        # If the data is a list, put each element in the buffer
-        except ValueError:
-            for value in data:
-                self.put(value)
+        # Copy as much of the block as fits into the remaining space
+        block = _as_block(data, self._data.dtype)
+        stored = min(block.size, self._capacity - self._size)
+        self._data[self._size : self._size + stored] = block[:stored]
+        self._size += stored
+
+        # Signal that the remaining data was discarded
+        if stored < block.size:
+            raise IndexError("The buffer is full and cannot accept more data.")
 
 
 class CircularBuffer(Buffer):
     """This class implements a circular buffer.
 
     This buffer has a fixed size and will overwrite the oldest data when it is full.
+
+    The data is stored twice in a mirrored backing array of twice the capacity.
+    This way the newest `capacity` samples are always one contiguous region of
+    the backing array and can be returned in chronological order as a view,
+    without copying the data.
     """
 
-    def put(self, data: float | list) -> None:
+    def __init__(self, max_capacity: int = 1000, dtype: np.dtype = np.float64) -> None:
+        """Initialize the buffer.
+
+        Args:
+            max_capacity (int, optional): The maximum capacity of the buffer. Defaults to 1000.
+            dtype (np.dtype, optional): The data type of the samples. Defaults to np.float64.
+
+        ---
+        """
+        super().__init__(max_capacity, dtype)
+        self._data = np.zeros(2 * max_capacity, dtype=dtype)
+        self._index: int = 0
+
+    def get(self) -> np.ndarray:
+        """Get the data from the buffer in chronological order.
+
+        The oldest sample is the first element. As long as the buffer is not
+        full yet, the unused samples follow at the end.
+
+        Note:
+            The returned view is updated in place by the following put calls.
+
+        Returns:
+            np.ndarray: View of the data from the buffer.
+        """
+        start = (self._index - self._size) % self._capacity
+        return self._data[start : start + self._capacity]
+
+    def put(self, data: float | list | np.ndarray) -> None:
         """Put data in the buffer.
 
+        The block is written to the mirrored backing array, which needs one
+        slice assignment for the primary copy and at most two slice assignments
+        for the mirrored copy, depending on whether the block wraps around the
+        end of the buffer. When the block is larger than the capacity, only the
+        newest samples are kept.
+
         Args:
-            data (float | list): The data to put in the buffer.
+            data (float | list | np.ndarray): The data to put in the buffer.
 
-        Raises:
-            ValueError: _description_
+        ---
+        """
+        block = _as_block(data, self._data.dtype)
+        count = block.size
+
+        # Only the newest samples survive a block larger than the buffer
+        if count > self._capacity:
+            self._index = (self._index + count - self._capacity) % self._capacity
+            block = block[-self._capacity :]
+
+        # Write the block once contiguous and once to the mirrored positions
+        first = min(block.size, self._capacity - self._index)
+        mirror = self._index + self._capacity
+        self._data[self._index : self._index + block.size] = block
+        self._data[mirror : mirror + first] = block[:first]
+        self._data[: block.size - first] = block[first:]
+
+        # Advance the write index and the fill level
+        self._index = (self._index + block.size) % self._capacity
+        self._size = min(self._size + count, self._capacity)
+
+    def clear(self) -> None:
+        """Clear the buffer."""
+        super().clear()
+
+        # Reset the write index
+        self._index = 0
+
+
+class RingBuffer(Buffer):
+    """This class implements a lock-free single-producer/single-consumer ring buffer.
+
+    The buffer transfers blocks of samples from one producer thread to one
+    consumer thread without locks. The read and write indices are monotonically
+    increasing sample counters and each of them is only ever written by one of
+    the two threads. Rebinding an integer attribute is atomic in Python, and the
+    producer only publishes the new write index after the block is copied, so
+    the consumer never sees a half-written block.
+
+    The producer never blocks. When a block does not fit into the free space,
+    the whole block is dropped and counted as overrun instead of overwriting
+    data the consumer has not read yet.
+    """
+
+    @property
+    def size(self) -> int:
+        """Get the number of samples available for reading.
+
+        Returns:
+            int: The number of unread samples in the buffer.
+        """
+        return self._write_index - self._read_index
+
+    @property
+    def overruns(self) -> int:
+        """Get the number of blocks dropped because the buffer was full.
+
+        Returns:
+            int: The number of dropped blocks.
+        """
+        return self._overruns
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of samples dropped because the buffer was full.
+
+        Returns:
+            int: The number of dropped samples.
+        """
+        return self._dropped
+
+    def __init__(self, max_capacity: int = 1000, dtype: np.dtype = np.float64) -> None:
+        """Initialize the buffer.
+
+        Args:
+            max_capacity (int, optional): The maximum capacity of the buffer. Defaults to 1000.
+            dtype (np.dtype, optional): The data type of the samples. Defaults to np.float64.
 
         ---
         """
-        # Put the data in the buffer
-        try:
-            self._data[self._size] = data
-            self._size += 1
-        # Wrap around if the buffer is full
-        except IndexError:
-            self._size = 0
-            self.put(data)
-        # If the data is a list, put each element in the buffer
-        except ValueError:
-            for value in data:
-                self.put(value)
+        super().__init__(max_capacity, dtype)
+        # Only written by the producer
+        self._write_index: int = 0
+        self._overruns: int = 0
+        self._dropped: int = 0
+        # Only written by the consumer
+        self._read_index: int = 0
+
+    def put(self, data: float | list | np.ndarray) -> bool:
+        """Put a block of data in the buffer.
+
+        Note:
+            Must only be called from the producer thread.
+
+        Args:
+            data (float | list | np.ndarray): The data to put in the buffer.
+
+        Returns:
+            bool: True if the block was stored, False if it was dropped.
+
+        ---
+        """
+        block = _as_block(data, self._data.dtype)
+        count = block.size
+
+        # Drop the whole block when it does not fit
+        if count > self._capacity - (self._write_index - self._read_index):
+            self._overruns += 1
+            self._dropped += count
+            return False
+
+        # Copy the block before publishing it to the consumer
+        start = self._write_index % self._capacity
+        first = min(count, self._capacity - start)
+        self._data[start : start + first] = block[:first]
+        self._data[: count - first] = block[first:]
+        self._write_index += count
+        return True
+
+    def read_available(self, max_samples: int | None = None) -> np.ndarray:
+        """Read all samples which are available in the buffer.
+
+        The samples are copied out of the buffer, so the returned array stays
+        valid after the producer reuses the space.
+
+        Note:
+            Must only be called from the consumer thread.
+
+        Args:
+            max_samples (int | None, optional): The maximum number of samples to read.
+                Defaults to None.
+
+        Returns:
+            np.ndarray: The available samples in chronological order.
+        """
+        count = self._write_index - self._read_index
+        if max_samples is not None:
+            count = min(count, max_samples)
+
+        # Copy the samples up to the end of the buffer and the wrapped part
+        start = self._read_index % self._capacity
+        first = min(count, self._capacity - start)
+        samples = np.empty(count, dtype=self._data.dtype)
+        samples[:first] = self._data[start : start + first]
+        samples[first:] = self._data[: count - first]
+
+        # Release the space to the producer
+        self._read_index += count
+        return samples
+
+    def get(self) -> np.ndarray:
+        """Get all available data from the buffer.
+
+        Returns:
+            np.ndarray: The available samples in chronological order.
+        """
+        return self.read_available()
+
+    def clear(self) -> None:
+        """Discard all unread samples.
+
+        Note:
+            Must only be called from the consumer thread.
+        """
+        self._read_index = self._write_index
@@ -0,0 +1,354 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Demodulate IQ samples to audio.
+
+## Description
+The demodulators turn blocks of complex baseband samples into real audio
+samples. The signal of interest has to be at the center, e.g. a channel of
+the digital down-converter. Like the filters of the dsp module, the
+demodulators keep their state between the blocks, and each one can
+decimate its output to the audio rate.
+
+### Details
+- *File:*     `demodulator.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import numpy as np
+from .audio import AUDIO_RATE
+from .dsp import DigitalDownConverter, FirDecimator, Nco, lowpass
+
+# === Constants ===
+MODES = ("fm", "am", "usb", "lsb")
+
+IF_RATIO = 4  # Minimum ratio of the channel and audio sample rate
+
+# === Classes ===
+
+
+class Demodulator:
+    """Base class for all demodulators.
+
+    The subclasses implement `_demodulate()`, this class decimates the
+    demodulated samples to the audio rate.
+    """
+
+    @property
+    def decimation(self) -> int:
+        """Get the decimation factor of the audio.
+
+        Returns:
+            int: The ratio of the input and audio sample rate.
+        """
+        return self._filter.decimation
+
+    @property
+    def audio_rate(self) -> float:
+        """Get the sample rate of the audio.
+
+        Returns:
+            float: The audio sample rate in Hz.
+        """
+        return self.sample_rate / self.decimation
+
+    def __init__(self, sample_rate: float, decimation: int = 1) -> None:
+        """Initialize the demodulator.
+
+        Args:
+            sample_rate (float): The sample rate of the input in Hz.
+            decimation (int, optional): The decimation of the audio. Defaults to 1.
+
+        ---
+        """
+        self.sample_rate: float = sample_rate
+        coefficients = [1.0] if decimation == 1 else None
+        self._filter = FirDecimator(decimation, coefficients, dtype=np.float32)
+
+    def reset(self) -> None:
+        """Clear the state of the demodulator."""
+        self._filter.reset()
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Demodulate a block of samples.
+
+        Args:
+            samples (np.ndarray): The new complex baseband samples.
+
+        Returns:
+            np.ndarray: The float32 audio samples, may be empty for short blocks.
+        """
+        audio = self._demodulate(np.asarray(samples, dtype=np.complex64))
+        return self._filter.process(audio.astype(np.float32, copy=False))
+
+    def _demodulate(self, samples: np.ndarray) -> np.ndarray:
+        """Demodulate the samples at the input rate.
+
+        Args:
+            samples (np.ndarray): The complex baseband samples.
+
+        Raises:
+            NotImplementedError: The function has to be implemented by the demodulator.
+
+        Returns:
+            np.ndarray: The real demodulated samples.
+        """
+        raise NotImplementedError(
+            "This function needs to be implemented by the actual demodulator class."
+        )
+
+
+class FmDemodulator(Demodulator):
+    """This class demodulates frequency modulation.
+
+    The instantaneous frequency is the phase difference of consecutive
+    samples, computed for the whole block as the angle of each sample times
+    the conjugate of its predecessor. A frequency deviation of `deviation`
+    gives an audio amplitude of one.
+    """
+
+    def __init__(self, sample_rate: float, deviation: float = 5e3, decimation: int = 1) -> None:
+        """Initialize the demodulator.
+
+        Args:
+            sample_rate (float): The sample rate of the input in Hz.
+            deviation (float, optional): The frequency deviation for full scale in Hz.
+                Defaults to 5e3.
+            decimation (int, optional): The decimation of the audio. Defaults to 1.
+
+        ---
+        """
+        super().__init__(sample_rate, decimation)
+        self.deviation: float = deviation
+        self._last = np.complex64(0)
+
+    def reset(self) -> None:
+        """Clear the state of the demodulator."""
+        super().reset()
+        self._last = np.complex64(0)
+
+    def _demodulate(self, samples: np.ndarray) -> np.ndarray:
+        """Demodulate the samples at the input rate.
+
+        Args:
+            samples (np.ndarray): The complex baseband samples.
+
+        Returns:
+            np.ndarray: The instantaneous frequency relative to the deviation.
+        """
+        previous = np.concatenate(([self._last], samples[:-1]))
+        if samples.size:
+            self._last = samples[-1]
+        scale = self.sample_rate / (2 * np.pi * self.deviation)
+        return np.angle(samples * np.conj(previous)) * scale
+
+
+class AmDemodulator(Demodulator):
+    """This class demodulates amplitude modulation.
+
+    The envelope is divided by the carrier level, the moving average of the
+    envelope over `window` seconds, so the audio is the modulation depth
+    independent of the signal strength.
+    """
+
+    def __init__(self, sample_rate: float, window: float = 0.05, decimation: int = 1) -> None:
+        """Initialize the demodulator.
+
+        Args:
+            sample_rate (float): The sample rate of the input in Hz.
+            window (float, optional): The averaging time of the carrier level in seconds.
+                Defaults to 0.05.
+            decimation (int, optional): The decimation of the audio. Defaults to 1.
+
+        ---
+        """
+        super().__init__(sample_rate, decimation)
+        self._window: int = max(1, round(window * sample_rate))
+        self._history = np.zeros(0)
+
+    def reset(self) -> None:
+        """Clear the state of the demodulator."""
+        super().reset()
+        self._history = np.zeros(0)
+
+    def _demodulate(self, samples: np.ndarray) -> np.ndarray:
+        """Demodulate the samples at the input rate.
+
+        Args:
+            samples (np.ndarray): The complex baseband samples.
+
+        Returns:
+            np.ndarray: The modulation depth.
+        """
+        envelope = np.abs(samples).astype(np.float64)
+        extended = np.concatenate((self._history, envelope))
+
+        # Average over the window, or over all samples at the start of the stream
+        sums = np.concatenate(([0.0], np.cumsum(extended)))
+        end = np.arange(self._history.size, extended.size) + 1
+        start = np.maximum(end - self._window, 0)
+        carrier = (sums[end] - sums[start]) / (end - start)
+        self._history = extended[-self._window :]
+        return envelope / np.maximum(carrier, np.finfo(np.float32).tiny) - 1.0
+
+
+class SsbDemodulator(Demodulator):
+    """This class demodulates single sideband modulation.
+
+    The selected sideband is shifted to the center, filtered with a
+    lowpass of half the bandwidth and shifted back. The real part of the
+    result is the audio, the other sideband is suppressed by the filter.
+    """
+
+    def __init__(
+        self, sample_rate: float, sideband: str = "usb", bandwidth: float = 2.7e3, taps: int = 127,
+        decimation: int = 1,
+    ) -> None:
+        """Initialize the demodulator.
+
+        Args:
+            sample_rate (float): The sample rate of the input in Hz.
+            sideband (str, optional): The sideband, either "usb" or "lsb". Defaults to "usb".
+            bandwidth (float, optional): The audio bandwidth in Hz. Defaults to 2.7e3.
+            taps (int, optional): The number of coefficients of the sideband filter.
+                Defaults to 127.
+            decimation (int, optional): The decimation of the audio. Defaults to 1.
+
+        Raises:
+            ValueError: The sideband is unknown or the bandwidth is too large.
+
+        ---
+        """
+        if sideband not in ("usb", "lsb"):
+            raise ValueError(f"Unknown sideband '{sideband}', use 'usb' or 'lsb'.")
+        if bandwidth >= sample_rate / 2:
+            raise ValueError("The bandwidth has to be smaller than half of the sample rate.")
+        super().__init__(sample_rate, decimation)
+        self.sideband: str = sideband
+        center = bandwidth / 2 if sideband == "usb" else -bandwidth / 2
+        self._nco = Nco([-center, center], sample_rate)
+        self._sideband = FirDecimator(1, lowpass(taps, bandwidth / 2 / sample_rate))
+
+    def reset(self) -> None:
+        """Clear the state of the demodulator."""
+        super().reset()
+        self._nco.reset()
+        self._sideband.reset()
+
+    def _demodulate(self, samples: np.ndarray) -> np.ndarray:
+        """Demodulate the samples at the input rate.
+
+        Args:
+            samples (np.ndarray): The complex baseband samples.
+
+        Returns:
+            np.ndarray: The audio of the selected sideband.
+        """
+        down, up = self._nco.generate(samples.size)
+        return (self._sideband.process(samples * down) * up).real
+
+
+class Receiver:
+    """This class demodulates one channel of the acquired samples.
+
+    The channel is moved to baseband and decimated to a few times the audio
+    rate by a digital down-converter, the demodulator then decimates to the
+    audio rate. Use it in a sink of the pipeline, so the demodulation runs
+    on the thread of the sink and not on the thread of the GUI, e.g.
+    `pipeline.add_sink(lambda block: player.put(receiver.process(block)))`.
+    """
+
+    @property
+    def audio_rate(self) -> float:
+        """Get the sample rate of the audio.
+
+        Returns:
+            float: The audio sample rate in Hz, close to the requested rate.
+        """
+        return self.demodulator.audio_rate
+
+    def __init__(
+        self, mode: str, sample_rate: float, offset: float = 0.0, audio_rate: float = AUDIO_RATE
+    ) -> None:
+        """Initialize the receiver.
+
+        Args:
+            mode (str): The modulation, one of `MODES`.
+            sample_rate (float): The sample rate of the acquired samples in Hz.
+            offset (float, optional): The offset of the channel from the center frequency in Hz.
+                Defaults to 0.0.
+            audio_rate (float, optional): The requested audio sample rate in Hz.
+                Defaults to AUDIO_RATE.
+
+        ---
+        """
+        decimation = max(1, int(sample_rate // (IF_RATIO * audio_rate)))
+        self.converter = DigitalDownConverter(sample_rate, offset, decimation=decimation)
+        channel_rate = self.converter.output_rate
+        audio_decimation = max(1, round(channel_rate / audio_rate))
+        self.demodulator: Demodulator = create_demodulator(mode, channel_rate, audio_decimation)
+
+    def reset(self) -> None:
+        """Clear the state of the down-converter and the demodulator."""
+        self.converter.reset()
+        self.demodulator.reset()
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Demodulate a block of acquired samples.
+
+        Args:
+            samples (np.ndarray): The new samples.
+
+        Returns:
+            np.ndarray: The float32 audio samples.
+        """
+        return self.demodulator.process(self.converter.process(samples)[0])
+
+
+# === Functions ===
+
+
+def create_demodulator(mode: str, sample_rate: float, decimation: int = 1) -> Demodulator:
+    """Create a demodulator with its default settings.
+
+    Args:
+        mode (str): The modulation, one of `MODES`.
+        sample_rate (float): The sample rate of the input in Hz.
+        decimation (int, optional): The decimation of the audio. Defaults to 1.
+
+    Raises:
+        ValueError: The modulation is unknown.
+
+    Returns:
+        Demodulator: The demodulator.
+    """
+    if mode == "fm":
+        return FmDemodulator(sample_rate, decimation=decimation)
+    if mode == "am":
+        return AmDemodulator(sample_rate, decimation=decimation)
+    if mode in ("usb", "lsb"):
+        return SsbDemodulator(sample_rate, mode, decimation=decimation)
+    raise ValueError(f"Unknown modulation '{mode}', use one of {', '.join(MODES)}.")
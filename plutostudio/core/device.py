@@ -35,9 +35,18 @@ Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
 ---
 """
 # === Imports ===
+import json
+import logging
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from threading import Event, Lock
 import numpy as np
-import iio
-import adi
+from .buffer import IQ_INT16, to_complex
+from .recorder import DATATYPES
+
+# === Logging ===
+logger = logging.getLogger(__name__)
 
 
 # === Functions ===
@@ -47,12 +56,64 @@ def list_devices() -> tuple:
     Returns:
         tuple: A list of all available devices.
     """
+    # The libiio bindings are only loaded when the hardware is used
+    import iio # pylint: disable=import-outside-toplevel
     return tuple(iio.scan_contexts().keys())
 
 
 # === Classes ===
 
 
+@dataclass(frozen=True)
+class PlutoConfig:
+    """Receiver settings of the ADALM Pluto.
+
+    The size and the number of the kernel buffers decide how long the
+    application may stall before samples are lost: the driver keeps
+    `kernel_buffers` buffers of `buffer_size` samples in flight.
+
+    Attributes:
+        lo (int): The frequency of the local oscillator in Hz.
+        sample_rate (int): The sample rate in samples per second.
+        bandwidth (int): The bandwidth of the analog filter in Hz.
+        buffer_size (int): The number of samples per buffer and per `acquire()` call.
+        kernel_buffers (int): The number of buffers queued in the kernel.
+        gain_mode (str): The gain control mode, one of `GAIN_MODES`.
+        gain (float): The hardware gain in dB, only used with the manual gain mode.
+        channels (tuple): The enabled receive channels.
+    """
+
+    GAIN_MODES = ("manual", "slow_attack", "fast_attack", "hybrid")
+
+    lo: int = 1_000_000_000
+    sample_rate: int = 4_000_000
+    bandwidth: int = 4_000_000
+    buffer_size: int = 2**16
+    kernel_buffers: int = 8
+    gain_mode: str = "slow_attack"
+    gain: float = 50.0
+    channels: tuple = (0,)
+
+    def __post_init__(self) -> None:
+        """Check the settings.
+
+        Raises:
+            ValueError: One of the settings is out of range.
+        """
+        if not 70_000_000 <= self.lo <= 6_000_000_000:
+            raise ValueError("The LO frequency has to be in the range 70 MHz to 6 GHz.")
+        if not 521_000 <= self.sample_rate <= 61_440_000:
+            raise ValueError("The sample rate has to be in the range 521 kS/s to 61.44 MS/s.")
+        if not 200_000 <= self.bandwidth <= 56_000_000:
+            raise ValueError("The bandwidth has to be in the range 200 kHz to 56 MHz.")
+        if self.buffer_size < 1 or self.kernel_buffers < 1:
+            raise ValueError("At least one buffer with one sample is needed.")
+        if self.gain_mode not in self.GAIN_MODES:
+            raise ValueError(f"Unknown gain mode '{self.gain_mode}', use one of {self.GAIN_MODES}.")
+        if not self.channels or not set(self.channels) <= {0, 1}:
+            raise ValueError("The enabled channels have to be a selection of (0, 1).")
+
+
 class Device:
     """Base class for all devices."""
 
@@ -98,44 +159,735 @@ class Device:
         Returns:
             np.ndarray: The base always returns 0.
         """
-        return np.zeros(1)
+        return np.zeros(1, dtype=np.complex64)
 
 
 class RandomGenerator(Device):
     """This class generates random data for testing purposes."""
 
+    def connect(self) -> None:
+        """Connect to the device."""
+        self._device = self
+
+    def disconnect(self) -> None:
+        """Disconnect from the device."""
+        self._device = None
+
     def acquire(self) -> np.ndarray:
         """Acquire data from the device.
 
         Returns:
-            np.ndarray: 1x1024 The acquired data.
+            np.ndarray: 1x1024 The acquired complex IQ data.
 
         ---
         """
-        return np.random.rand(1024)
+        samples = np.empty(1024, dtype=np.complex64)
+        samples.real = np.random.rand(1024)
+        samples.imag = np.random.rand(1024)
+        return samples
 
 
-class Pluto(Device):
-    """This class interacts with the ADALM Pluto device."""
-    def __init__(self) -> None:
-        """Initialize the device."""
+class _Tone:
+    """Phase continuous complex tone.
+
+    The oscillator advances block by block: the samples of one block are the
+    current phasor times a precomputed table of rotations, afterwards the
+    phasor is rotated by one block length.
+    """
+
+    def __init__(
+        self, frequency: float, amplitude: float, phase: float, sample_rate: float, block_size: int
+    ):
+        step = 2 * np.pi * frequency / sample_rate
+        self.power: float = amplitude**2
+        self._rotation = np.exp(1j * step * np.arange(block_size)).astype(np.complex64)
+        self._advance = np.exp(1j * step * block_size)
+        self._phasor = amplitude * np.exp(1j * phase)
+        self._amplitude = amplitude
+        self._work = np.empty(block_size, dtype=np.complex64)
+
+    def add_to(self, output: np.ndarray) -> None:
+        """Add the next block of the tone to the output."""
+        np.multiply(self._rotation, self._phasor, out=self._work)
+        output += self._work
+        # Keep the amplitude of the phasor from drifting
+        self._phasor *= self._advance
+        self._phasor *= self._amplitude / abs(self._phasor)
+
+
+class _Chirp:
+    """Phase continuous linear frequency sweep.
+
+    The frequency rises linearly from `start` to `stop` within one period and
+    jumps back afterwards. The phase is the running sum of the frequency, so
+    it stays continuous across the sweeps and the blocks.
+    """
+
+    def __init__(
+        self,
+        start: float,
+        stop: float,
+        period: float,
+        amplitude: float,
+        sample_rate: float,
+        block_size: int,
+    ):
+        self.power: float = amplitude**2
+        self._start = 2 * np.pi * start / sample_rate
+        self._slope = 2 * np.pi * (stop - start) / sample_rate
+        self._period = max(round(period * sample_rate), 1)
+        self._amplitude = amplitude
+        self._counter: int = 0
+        self._phase: float = 0.0
+        self._index = np.arange(block_size)
+        self._work = np.empty(block_size, dtype=np.float64)
+        self._scratch = np.empty(block_size, dtype=np.float64)
+        self._angle = np.empty(block_size, dtype=np.float32)
+        self._wave = np.empty(block_size, dtype=np.complex64)
+
+    def _wrap(self, period: float) -> None:
+        """Wrap the work values into [0, period).
+
+        Subtracting the floored quotient is much faster than `np.remainder`.
+        """
+        np.multiply(self._work, 1 / period, out=self._scratch)
+        np.floor(self._scratch, out=self._scratch)
+        self._scratch *= period
+        self._work -= self._scratch
+
+    def add_to(self, output: np.ndarray) -> None:
+        """Add the next block of the chirp to the output."""
+        # Phase increment of every sample within the current sweep
+        np.add(self._index, self._counter, out=self._work)
+        self._wrap(self._period)
+        self._work *= self._slope / self._period
+        self._work += self._start
+
+        # Accumulate the phase in double precision and wrap it
+        np.cumsum(self._work, out=self._work)
+        self._work += self._phase
+        self._wrap(2 * np.pi)
+        self._phase = float(self._work[-1])
+        self._counter = (self._counter + self._work.size) % self._period
+
+        # The wrapped phase is precise enough for the single precision cos and sin
+        self._angle[:] = self._work
+        np.cos(self._angle, out=self._wave.real)
+        np.sin(self._angle, out=self._wave.imag)
+        self._wave *= self._amplitude
+        output += self._wave
+
+
+class _Burst:
+    """Repeated burst of random PSK symbols on a carrier."""
+
+    CONSTELLATIONS = {
+        "bpsk": np.array([1, -1], dtype=np.complex64),
+        "qpsk": np.exp(1j * (np.pi / 4 + np.pi / 2 * np.arange(4))).astype(np.complex64),
+    }
+
+    def __init__(
+        self,
+        carrier: _Tone,
+        symbol_rate: float,
+        duration: float,
+        period: float,
+        modulation: str,
+        rng: np.random.Generator,
+        sample_rate: float,
+    ):
+        self._carrier = carrier
+        self._samples_per_symbol = max(round(sample_rate / symbol_rate), 1)
+        self._duration = round(duration * sample_rate)
+        self._period = max(round(period * sample_rate), 1)
+        self._constellation = self.CONSTELLATIONS[modulation]
+        self._rng = rng
+        self._counter: int = 0
+        self._symbol = self._constellation[0]
+        self.power: float = carrier.power * min(self._duration / self._period, 1.0)
+        size = carrier._work.size  # pylint: disable=protected-access
+        self._work = np.zeros(size, dtype=np.complex64)
+
+    def add_to(self, output: np.ndarray) -> None:
+        """Add the next block of the bursts to the output."""
+        # Draw the symbols of the block and keep the symbol which continues from the last block
+        offset = self._counter % self._samples_per_symbol
+        count = (offset + output.size - 1) // self._samples_per_symbol + 1
+        symbols = self._constellation[self._rng.integers(len(self._constellation), size=count)]
+        if offset:
+            symbols[0] = self._symbol
+        self._symbol = symbols[-1]
+
+        # Modulate the carrier
+        self._work.fill(0)
+        self._carrier.add_to(self._work)
+        self._work *= np.repeat(symbols, self._samples_per_symbol)[offset : offset + output.size]
+
+        # Silence the carrier between the bursts
+        start = 0
+        position = self._counter % self._period
+        while start < output.size:
+            stop = start + self._period - position
+            self._work[start + max(self._duration - position, 0) : stop] = 0
+            start, position = stop, 0
+        output += self._work
+        self._counter += output.size
+
+
+class SignalGenerator(Device):
+    """This class generates deterministic test signals.
+
+    The signal is the sum of the added tones, chirps and bursts plus complex
+    white Gaussian noise. All random values come from a seeded generator, so
+    the same seed produces the same signal. The oscillators are phase
+    continuous across the blocks.
+
+    Every call of `acquire()` fills the same preallocated output block, so
+    the generator can produce data much faster than a real device.
+
+    Note:
+        The returned block is overwritten by the next call of `acquire()`.
+    """
+
+    def __init__(
+        self, block_size: int = 1024, sample_rate: float = 1e6, seed: int | None = None
+    ) -> None:
+        """Initialize the device.
+
+        Args:
+            block_size (int, optional): The number of samples per block. Defaults to 1024.
+            sample_rate (float, optional): The sample rate in Hz. Defaults to 1e6.
+            seed (int | None, optional): The seed of the random generator. Defaults to None.
+
+        ---
+        """
         super().__init__()
-        self.name = "PlutoSDR"
+        self.name = "SignalGenerator"
+        self.block_size: int = block_size
+        self.sample_rate: float = sample_rate
+        self._rng = np.random.default_rng(seed)
+        self._signals = []
+        self._noise_level: float = 0.0
+        self._noise = np.empty((2, block_size), dtype=np.float32)
+        self._output = np.zeros(block_size, dtype=np.complex64)
+
+    @property
+    def signal_power(self) -> float:
+        """Get the mean power of all signals without noise.
+
+        Returns:
+            float: The signal power.
+        """
+        return sum(signal.power for signal in self._signals)
 
     def connect(self) -> None:
         """Connect to the device."""
+        self._device = self
+
+    def disconnect(self) -> None:
+        """Disconnect from the device."""
+        self._device = None
+
+    def add_tone(self, frequency: float, amplitude: float = 1.0, phase: float = 0.0) -> None:
+        """Add a complex tone.
+
+        Args:
+            frequency (float): The frequency in Hz.
+            amplitude (float, optional): The amplitude. Defaults to 1.0.
+            phase (float, optional): The start phase in rad. Defaults to 0.0.
+
+        ---
+        """
+        self._signals.append(_Tone(frequency, amplitude, phase, self.sample_rate, self.block_size))
+
+    def add_chirp(self, start: float, stop: float, period: float, amplitude: float = 1.0) -> None:
+        """Add a repeating linear chirp.
+
+        Args:
+            start (float): The start frequency in Hz.
+            stop (float): The stop frequency in Hz.
+            period (float): The duration of one sweep in seconds.
+            amplitude (float, optional): The amplitude. Defaults to 1.0.
+
+        ---
+        """
+        self._signals.append(
+            _Chirp(start, stop, period, amplitude, self.sample_rate, self.block_size)
+        )
+
+    def add_burst(
+        self,
+        frequency: float,
+        symbol_rate: float,
+        duration: float,
+        period: float,
+        amplitude: float = 1.0,
+        modulation: str = "qpsk",
+    ) -> None:
+        """Add repeating bursts of random PSK symbols.
+
+        Args:
+            frequency (float): The carrier frequency in Hz.
+            symbol_rate (float): The symbol rate in symbols per second.
+            duration (float): The duration of one burst in seconds.
+            period (float): The time between the start of two bursts in seconds.
+            amplitude (float, optional): The amplitude. Defaults to 1.0.
+            modulation (str, optional): The modulation, "bpsk" or "qpsk". Defaults to "qpsk".
+
+        Raises:
+            ValueError: The modulation is not known.
+
+        ---
+        """
+        if modulation not in _Burst.CONSTELLATIONS:
+            raise ValueError(
+                f"Unknown modulation '{modulation}', use one of {tuple(_Burst.CONSTELLATIONS)}."
+            )
+        carrier = _Tone(frequency, amplitude, 0.0, self.sample_rate, self.block_size)
+        self._signals.append(
+            _Burst(carrier, symbol_rate, duration, period, modulation, self._rng, self.sample_rate)
+        )
+
+    def set_noise(self, snr: float | None = None, power: float | None = None) -> None:
+        """Set the power of the white Gaussian noise.
+
+        The noise is either given relative to the power of the signals added
+        so far or as absolute power.
+
+        Args:
+            snr (float | None, optional): The signal to noise ratio in dB. Defaults to None.
+            power (float | None, optional): The absolute noise power. Defaults to None.
+
+        ---
+        """
+        if snr is not None:
+            power = self.signal_power / 10 ** (snr / 10)
+        self._noise_level = np.sqrt((power or 0.0) / 2)
+
+    def clear(self) -> None:
+        """Remove all signals and the noise."""
+        self._signals.clear()
+        self._noise_level = 0.0
+
+    def acquire(self) -> np.ndarray:
+        """Acquire data from the device.
+
+        Returns:
+            np.ndarray: The next block of complex IQ data.
+        """
+        self._output.fill(0)
+        for signal in self._signals:
+            signal.add_to(self._output)
+
+        # Add the noise without allocating new memory
+        if self._noise_level:
+            self._rng.standard_normal(dtype=np.float32, out=self._noise)
+            self._noise *= self._noise_level
+            self._output.real += self._noise[0]
+            self._output.imag += self._noise[1]
+        return self._output
+
+
+class FileReplayDevice(Device):
+    """This class replays a recorded file as if it was acquired from a device.
+
+    The file is mapped into memory with `np.memmap`, so the blocks are views
+    into the page cache of the operating system and no data is copied for
+    complex64 recordings. Recordings with interleaved 16 bit IQ samples are
+    converted to complex64 block by block.
+
+    When a SigMF metadata file is found next to the data file, the sample type
+    and the sample rate are taken from it.
+
+    With `realtime` enabled, `acquire()` waits until the returned block would
+    have been received at the recorded sample rate. Otherwise the blocks are
+    returned as fast as possible, e.g. for benchmarks.
+    """
+
+    @property
+    def position(self) -> int:
+        """Get the index of the next sample to replay.
+
+        Returns:
+            int: The sample index.
+        """
+        return self._position
+
+    @property
+    def length(self) -> int:
+        """Get the number of samples in the recording.
+
+        Returns:
+            int: The number of samples, 0 when not connected.
+        """
+        return 0 if self._device is None else self._device.size
+
+    def __init__(
+        self,
+        path: str | Path,
+        block_size: int = 1024,
+        sample_rate: float | None = None,
+        dtype: np.dtype | None = None,
+        realtime: bool = True,
+        loop: bool = True,
+    ) -> None:
+        """Initialize the device.
+
+        Args:
+            path (str | Path): The path of the recorded data file.
+            block_size (int, optional): The number of samples per block. Defaults to 1024.
+            sample_rate (float | None, optional): The sample rate, read from the metadata when None.
+                Defaults to None.
+            dtype (np.dtype | None, optional): The sample type, read from the metadata when None.
+                Defaults to None.
+            realtime (bool, optional): Replay at the recorded sample rate. Defaults to True.
+            loop (bool, optional): Restart at the beginning when the end is reached.
+                Defaults to True.
+
+        ---
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.name = self.path.name
+        self.block_size: int = block_size
+        self.realtime: bool = realtime
+        self.loop: bool = loop
+
+        # Take the missing settings from the metadata
+        metadata = self._read_metadata()
+        if sample_rate is None:
+            sample_rate = metadata.get("core:sample_rate", 1.0)
+        if dtype is None:
+            names = {name: key for key, name in DATATYPES.items()}
+            dtype = names.get(metadata.get("core:datatype"), np.complex64)
+        self.sample_rate: float = sample_rate
+        self.dtype = np.dtype(dtype)
+
+        # State of the replay
+        self._position: int = 0
+        self._replayed: int = 0
+        self._started: float = 0.0
+
+    def connect(self) -> None:
+        """Map the recorded file into memory.
+
+        Raises:
+            IOError: The file could not be opened.
+        """
+        try:
+            self._device = np.memmap(self.path, dtype=self.dtype, mode="r")
+        except (OSError, ValueError) as error:
+            self._device = None
+            raise IOError(f"Could not open recording '{self.path}'.") from error
+        self.seek(0)
+
+    def disconnect(self) -> None:
+        """Release the memory mapped file."""
+        self._device = None
+
+    def seek(self, sample: int) -> None:
+        """Continue the replay at the given sample.
+
+        Args:
+            sample (int): The index of the next sample to replay.
+
+        ---
+        """
+        self._position = min(max(sample, 0), self.length)
+        self._replayed = 0
+        self._started = time.perf_counter()
+
+    def acquire(self) -> np.ndarray:
+        """Acquire the next block from the recording.
+
+        The last block before the end of the recording can be shorter than
+        the block size.
+
+        Raises:
+            EOFError: The end of the recording is reached and looping is disabled.
+
+        Returns:
+            np.ndarray: The next block of complex IQ data.
+        """
+        # Restart at the end of the recording
+        if self._position >= self.length:
+            if not self.loop or self.length == 0:
+                raise EOFError("The end of the recording is reached.")
+            self._position = 0
+
+        # Take the block as view of the mapped file
+        stop = min(self._position + self.block_size, self.length)
+        block = self._device[self._position : stop].view(np.ndarray)
+        self._position = stop
+        self._replayed += block.size
+
+        # Wait until the block would have been received
+        if self.realtime:
+            delay = self._started + self._replayed / self.sample_rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+        if self.dtype == IQ_INT16:
+            return to_complex(block)
+        return block
+
+    def _read_metadata(self) -> dict:
+        """Read the global SigMF metadata of the recording.
+
+        Returns:
+            dict: The global metadata, empty when there is no metadata file.
+        """
+        path = self.path.with_name(self.path.stem + ".sigmf-meta")
         try:
-            self._device = adi.Pluto()
+            with open(path, encoding="utf-8") as file:
+                return json.load(file).get("global", {})
+        except (OSError, ValueError):
+            return {}
+
+
+class Pluto(Device):
+    """This class interacts with the ADALM Pluto device.
+
+    The receiver is set up with a `PlutoConfig` when connecting. The settings
+    can be changed with `configure()` while the acquisition is running. Only
+    changes of the buffers or channels recreate the receive buffer, all other
+    settings are applied without interrupting the stream.
+    """
+    def __init__(self, config: PlutoConfig | None = None, uri: str = "") -> None:
+        """Initialize the device.
+
+        Args:
+            config (PlutoConfig | None, optional): The receiver settings. Defaults to PlutoConfig().
+            uri (str, optional): The context URI of the device, e.g. `usb:1.2.5`.
+                Defaults to the first device found.
+
+        ---
+        """
+        super().__init__()
+        self.name = f"PlutoSDR ({uri})" if uri else "PlutoSDR"
+        self.uri: str = uri
+        self.config: PlutoConfig = config or PlutoConfig()
+        self._lock = Lock()
+
+    @property
+    def sample_rate(self) -> int:
+        """Get the configured sample rate.
+
+        Returns:
+            int: The sample rate in samples per second.
+        """
+        return self.config.sample_rate
+
+    def connect(self) -> None:
+        """Connect to the device and apply the configuration."""
+        try:
+            import adi # pylint: disable=import-outside-toplevel
+            self._device = adi.Pluto(self.uri)
+            self._apply(self.config, None)
         # The pluto driver throws a generic exception if the device is not found
         except Exception as error: # pylint: disable=broad-except
             self._device = None
             raise IOError("Could not connect to device.") from error
-        # if self._device is not None:
-        #     self._device.rx_lo = 1000000000
-        #     self._device.rx_rf_bandwidth = 20000000
-        #     self._device.rx_buffer_size = 1024
-        #     self._device.rx_enabled_channels = [0]
-        #     self._device.rx_enabled = True
-
-    def acquire(self):
-        return self._device.rx().real
+
+    def disconnect(self) -> None:
+        """Disconnect from the device and release the receive buffers."""
+        with self._lock:
+            if self._device is None:
+                return
+            try:
+                self._device.rx_destroy_buffer()
+            # The buffers cannot be released anymore when the device is gone
+            except Exception: # pylint: disable=broad-except
+                pass
+            self._device = None
+
+    def configure(self, config: PlutoConfig | None = None, **changes) -> None:
+        """Change the receiver settings.
+
+        The new settings are applied immediately when the device is connected
+        and otherwise with the next connect.
+
+        Args:
+            config (PlutoConfig | None, optional): The new settings.
+                Defaults to the current settings.
+            **changes: Single settings to change, e.g. `lo=2_400_000_000`.
+
+        ---
+        """
+        new = replace(config or self.config, **changes)
+        with self._lock:
+            if self.is_connected():
+                self._apply(new, self.config)
+            self.config = new
+
+    def acquire(self) -> np.ndarray:
+        """Acquire data from the device.
+
+        Returns:
+            np.ndarray: The acquired complex IQ data, one row per channel when
+                more than one channel is enabled.
+
+        ---
+        """
+        with self._lock:
+            return np.asarray(self._device.rx(), dtype=np.complex64)
+
+    def _apply(self, config: PlutoConfig, previous: PlutoConfig | None) -> None:
+        """Write the settings to the device.
+
+        Args:
+            config (PlutoConfig): The new settings.
+            previous (PlutoConfig | None): The settings currently active on the device.
+        """
+        device = self._device
+
+        # The buffer layout can only change while no receive buffer exists
+        if previous is None or (config.buffer_size, config.kernel_buffers, config.channels) != (
+            previous.buffer_size,
+            previous.kernel_buffers,
+            previous.channels,
+        ):
+            device.rx_destroy_buffer()
+            rxadc = device._rxadc  # pylint: disable=protected-access
+            rxadc.set_kernel_buffers_count(config.kernel_buffers)
+            device.rx_buffer_size = config.buffer_size
+            device.rx_enabled_channels = list(config.channels)
+
+        # The frontend settings can change while streaming
+        device.sample_rate = config.sample_rate
+        device.rx_rf_bandwidth = config.bandwidth
+        device.rx_lo = config.lo
+        device.gain_control_mode_chan0 = config.gain_mode
+        if config.gain_mode == "manual":
+            device.rx_hardwaregain_chan0 = config.gain
+
+
+class DeviceSupervisor:
+    """This class keeps the acquisition of a device running.
+
+    When the acquisition fails, e.g. because the USB connection dropped, the
+    device is disconnected and connected again with an exponential backoff
+    between the attempts. Connecting applies the last configuration of the
+    device again. The delay between the attempts is limited, so the
+    acquisition continues shortly after the device is back.
+
+    The samples missed during the outage are estimated from the time between
+    the last block before and the first block after the outage.
+    """
+
+    @property
+    def reconnects(self) -> int:
+        """Get the number of successful reconnects.
+
+        Returns:
+            int: The number of reconnects.
+        """
+        return self._reconnects
+
+    @property
+    def lost_samples(self) -> int:
+        """Get the total number of samples missed during outages.
+
+        Returns:
+            int: The estimated number of missed samples.
+        """
+        return self._lost_samples
+
+    def __init__(
+        self,
+        device: Device,
+        initial_delay: float = 0.05,
+        max_delay: float = 1.0,
+        on_gap=None,
+    ) -> None:
+        """Initialize the supervisor.
+
+        Args:
+            device (Device): The device to supervise.
+            initial_delay (float, optional): The delay before the first reconnect in seconds.
+                Defaults to 0.05.
+            max_delay (float, optional): The maximum delay between two reconnects in seconds.
+                Defaults to 1.0.
+            on_gap (function, optional): Called with the number of missed samples after an outage.
+                Defaults to None.
+
+        ---
+        """
+        self.device = device
+        self.initial_delay: float = initial_delay
+        self.max_delay: float = max_delay
+        self._on_gap = on_gap
+        self._reconnects: int = 0
+        self._lost_samples: int = 0
+        self._last_block: float | None = None
+        self._failed_since: float | None = None
+
+    def acquire(self, stop_event: Event | None = None) -> np.ndarray:
+        """Acquire the next block and recover from errors of the device.
+
+        Args:
+            stop_event (Event | None, optional): Stops the recovery when set. Defaults to None.
+
+        Raises:
+            EOFError: The device has no more data.
+
+        Returns:
+            np.ndarray: The acquired block, empty when stopped during an outage.
+        """
+        stop_event = stop_event or Event()
+        delay = self.initial_delay
+        while not stop_event.is_set():
+            try:
+                if not self.device.is_connected():
+                    self.device.connect()
+                data = self.device.acquire()
+            # The end of a recording is not an error of the device
+            except EOFError:
+                raise
+            # The drivers throw generic exceptions when the device is lost
+            except Exception as error: # pylint: disable=broad-except
+                self._fail(error)
+                stop_event.wait(delay)
+                delay = min(2 * delay, self.max_delay)
+                continue
+
+            self._recovered(data)
+            return data
+        return np.zeros(0, dtype=np.complex64)
+
+    def _fail(self, error: Exception) -> None:
+        """Disconnect the device after an error.
+
+        Args:
+            error (Exception): The error of the device.
+        """
+        if self._failed_since is None:
+            self._failed_since = time.monotonic()
+            logger.warning("Acquisition of %s failed: %s", self.device.name, error)
+        try:
+            self.device.disconnect()
+        except Exception: # pylint: disable=broad-except
+            pass
+
+    def _recovered(self, data: np.ndarray) -> None:
+        """Report the gap after an outage.
+
+        Args:
+            data (np.ndarray): The first block after the outage.
+        """
+        now = time.monotonic()
+        if self._failed_since is not None:
+            # The first block after the outage was received during the elapsed time as well
+            gap = 0
+            sample_rate = getattr(self.device, "sample_rate", None)
+            if sample_rate and self._last_block is not None:
+                gap = max(round((now - self._last_block) * sample_rate) - data.shape[-1], 0)
+            self._reconnects += 1
+            self._lost_samples += gap
+            self._failed_since = None
+            logger.warning(
+                "Acquisition of %s recovered, missed about %d samples.", self.device.name, gap
+            )
+            if self._on_gap is not None:
+                self._on_gap(gap)
+        self._last_block = now
@@ -0,0 +1,251 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Discover the available devices in the background.
+
+## Description
+Scanning for devices can take several seconds on USB and network backends.
+The discovery service scans on a background thread and keeps the results in
+a cache, so the list of devices can be queried at any time without waiting
+for a scan.
+
+### Details
+- *File:*     `discovery.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import logging
+import time
+from threading import Thread, Event, Lock
+from .device import list_devices
+
+# === Logging ===
+logger = logging.getLogger(__name__)
+
+# === Classes ===
+
+
+class DeviceDiscovery:
+    """This class scans for devices on a background thread.
+
+    `devices()` always returns the cached result of the last scan. When the
+    cached result is older than the time to live, a new scan is started in
+    the background and the next call returns the updated result. After a
+    failed scan, the next scan is started at the earliest one time to live
+    later.
+
+    With `start()` the devices are scanned periodically. Registered callbacks
+    are called with the device URI when a device is added or removed.
+
+    Note:
+        The callbacks run on the scanning thread. GUI code has to pass the
+        event to its main loop, e.g. with `after()`.
+    """
+
+    @property
+    def age(self) -> float:
+        """Get the age of the cached scan result.
+
+        Returns:
+            float: The time since the last scan in seconds, infinite before the first scan.
+        """
+        if self._timestamp is None:
+            return float("inf")
+        return time.monotonic() - self._timestamp
+
+    def is_stale(self) -> bool:
+        """Check if the cached scan result is outdated.
+
+        Returns:
+            bool: True if the result is older than the time to live.
+        """
+        return self.age > self.ttl
+
+    def is_scanning(self) -> bool:
+        """Check if a scan is in progress.
+
+        Returns:
+            bool: True while scanning.
+        """
+        return self._scanning
+
+    def __init__(self, scanner=None, ttl: float = 5.0) -> None:
+        """Initialize the discovery service.
+
+        Args:
+            scanner (function, optional): Returns the URIs of the available devices.
+                Defaults to list_devices.
+            ttl (float, optional): The time to live of the cached result in seconds.
+                Defaults to 5.0.
+
+        ---
+        """
+        self.ttl: float = ttl
+        self._scanner = scanner or list_devices
+        self._devices: tuple = ()
+        self._timestamp: float | None = None
+        self._attempt: float | None = None
+        self._scanning: bool = False
+        self._lock = Lock()
+        self._idle = Event()
+        self._idle.set()
+        self._stop_event = Event()
+        self._thread = None
+        self._added_callbacks = []
+        self._removed_callbacks = []
+
+    def register_added_callback(self, callback) -> None:
+        """Register a callback for new devices.
+
+        Args:
+            callback (function): Called with the URI of the new device.
+        """
+        self._added_callbacks.append(callback)
+
+    def register_removed_callback(self, callback) -> None:
+        """Register a callback for removed devices.
+
+        Args:
+            callback (function): Called with the URI of the removed device.
+        """
+        self._removed_callbacks.append(callback)
+
+    def devices(self) -> tuple:
+        """Get the available devices without waiting for a scan.
+
+        Starts a background scan when the cached result is outdated and the
+        last attempt to scan is older than the time to live.
+
+        Returns:
+            tuple: The URIs of the devices found by the last scan.
+        """
+        retry = self._attempt is None or time.monotonic() - self._attempt > self.ttl
+        if self.is_stale() and retry:
+            self.refresh()
+        return self._devices
+
+    def refresh(self) -> None:
+        """Start a scan in the background, unless one is already running."""
+        if self._claim_scan():
+            Thread(target=self._run_scan, name="DeviceDiscovery", daemon=True).start()
+
+    def scan(self) -> tuple:
+        """Scan for devices and wait for the result.
+
+        When a scan is already running, this waits for its result instead.
+
+        Returns:
+            tuple: The URIs of the available devices.
+        """
+        if self._claim_scan():
+            self._run_scan()
+        else:
+            self._idle.wait()
+        return self._devices
+
+    def start(self, interval: float | None = None) -> None:
+        """Start scanning periodically.
+
+        Args:
+            interval (float | None, optional): The time between two scans.
+                Defaults to the time to live.
+
+        ---
+        """
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = Thread(
+            target=self._scan_loop,
+            args=(interval or self.ttl,),
+            name="DeviceDiscovery",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop scanning periodically."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _scan_loop(self, interval: float) -> None:
+        """Scan periodically until stopped.
+
+        Args:
+            interval (float): The time between two scans.
+        """
+        while not self._stop_event.is_set():
+            if self._claim_scan():
+                self._run_scan()
+            self._stop_event.wait(interval)
+
+    def _claim_scan(self) -> bool:
+        """Reserve the scanner so only one scan runs at a time.
+
+        Returns:
+            bool: True if the caller may scan, False if a scan is running.
+        """
+        with self._lock:
+            if self._scanning:
+                return False
+            self._scanning = True
+            self._idle.clear()
+            return True
+
+    def _run_scan(self) -> None:
+        """Scan for devices, update the cache and emit the events."""
+        try:
+            found = tuple(self._scanner())
+        # Keep the last result when the backend fails
+        except Exception as error: # pylint: disable=broad-except
+            logger.warning("Scanning for devices failed: %s", error)
+            self._attempt = time.monotonic()
+            self._release_scan()
+            return
+
+        previous = self._devices
+        self._devices = found
+        self._timestamp = self._attempt = time.monotonic()
+        self._release_scan()
+
+        # Emit the changes
+        for uri in found:
+            if uri not in previous:
+                for callback in self._added_callbacks:
+                    callback(uri)
+        for uri in previous:
+            if uri not in found:
+                for callback in self._removed_callbacks:
+                    callback(uri)
+
+    def _release_scan(self) -> None:
+        """Release the scanner and wake up the callers waiting for the result."""
+        with self._lock:
+            self._scanning = False
+            self._idle.set()
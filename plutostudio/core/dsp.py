@@ -0,0 +1,677 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Decimating filters for the application.
+
+## Description
+The dsp module reduces the sample rate of a stream of IQ samples, so
+narrowband viewers and recorders can work at a fraction of the rate of
+the device. All filters keep their state between the blocks, so a stream
+split into arbitrary blocks gives the same output as the stream filtered
+at once. The coefficients are designed once and cached.
+
+The digital down-converter shifts several channels inside the captured
+bandwidth to baseband and decimates them, without retuning the device.
+
+### Details
+- *File:*     `dsp.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+from functools import lru_cache
+import numpy as np
+
+# === Constants ===
+KAISER_BETA = 8.6  # About 90 dB stopband attenuation
+PHASE_BITS = 32
+TABLE_BITS = 16  # The phase truncation spurs are about 96 dB below the carrier
+
+# === Functions ===
+
+
+def _read_only(coefficients: np.ndarray) -> np.ndarray:
+    """Convert coefficients to a read-only float32 array.
+
+    Args:
+        coefficients (np.ndarray): The coefficients.
+
+    Returns:
+        np.ndarray: The read-only float32 coefficients.
+    """
+    coefficients = np.asarray(coefficients, dtype=np.float32)
+    coefficients.flags.writeable = False
+    return coefficients
+
+
+@lru_cache(maxsize=32)
+def lowpass(taps: int, cutoff: float, beta: float = KAISER_BETA) -> np.ndarray:
+    """Design a linear phase lowpass filter with a Kaiser window.
+
+    Args:
+        taps (int): The number of coefficients.
+        cutoff (float): The cutoff frequency relative to the sample rate, in (0, 0.5).
+        beta (float, optional): The shape of the Kaiser window. Defaults to KAISER_BETA.
+
+    Raises:
+        ValueError: The cutoff frequency is not in (0, 0.5).
+
+    Returns:
+        np.ndarray: The read-only float32 coefficients with unity gain at DC.
+    """
+    if not 0 < cutoff < 0.5:
+        raise ValueError("The cutoff frequency has to be in the range (0, 0.5).")
+    time = np.arange(taps) - (taps - 1) / 2
+    coefficients = np.sinc(2 * cutoff * time) * np.kaiser(taps, beta)
+    return _read_only(coefficients / coefficients.sum())
+
+
+@lru_cache(maxsize=32)
+def halfband(taps: int = 23, beta: float = KAISER_BETA) -> np.ndarray:
+    """Design a halfband filter for the decimation by two.
+
+    Every second coefficient of a halfband filter is zero, except for the
+    center. The number of coefficients is rounded up to the next `4k + 3`,
+    so the first and last coefficients are not zero.
+
+    Args:
+        taps (int, optional): The minimum number of coefficients. Defaults to 23.
+        beta (float, optional): The shape of the Kaiser window. Defaults to KAISER_BETA.
+
+    Returns:
+        np.ndarray: The read-only float32 coefficients with unity gain at DC.
+    """
+    taps = max(taps + (3 - taps) % 4, 3)
+    coefficients = np.array(lowpass(taps, 0.25, beta), dtype=np.float64)
+
+    # Remove the rounding errors of the coefficients which are zero in theory
+    center = (taps - 1) // 2
+    coefficients[center % 2 :: 2] = 0.0
+    coefficients[center] = 0.5
+    return _read_only(coefficients / coefficients.sum())
+
+
+def cic_response(frequency: np.ndarray, decimation: int, stages: int, delay: int = 1) -> np.ndarray:
+    """Get the magnitude response of a CIC decimator.
+
+    Args:
+        frequency (np.ndarray): The frequencies relative to the output sample rate.
+        decimation (int): The decimation of the CIC filter.
+        stages (int): The number of integrator and comb stages.
+        delay (int, optional): The differential delay of the combs. Defaults to 1.
+
+    Returns:
+        np.ndarray: The magnitude response normalized to unity gain at DC.
+    """
+    frequency = np.asarray(frequency, dtype=np.float64)
+    numerator = np.sin(np.pi * delay * frequency)
+    denominator = decimation * delay * np.sin(np.pi * frequency / decimation)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        response = np.where(frequency == 0, 1.0, numerator / denominator)
+    return np.abs(response) ** stages
+
+
+@lru_cache(maxsize=32)
+def compensator(
+    decimation: int,
+    stages: int,
+    delay: int = 1,
+    taps: int = 63,
+    cutoff: float = 0.2,
+    beta: float = KAISER_BETA,
+) -> np.ndarray:
+    """Design a lowpass filter which compensates the droop of a CIC decimator.
+
+    The filter runs at the output rate of the CIC filter. Its passband
+    follows the inverse response of the CIC filter, so the combined response
+    is flat up to the cutoff frequency. The filter is designed by frequency
+    sampling and a Kaiser window.
+
+    Args:
+        decimation (int): The decimation of the CIC filter.
+        stages (int): The number of stages of the CIC filter.
+        delay (int, optional): The differential delay of the CIC filter. Defaults to 1.
+        taps (int, optional): The number of coefficients. Defaults to 63.
+        cutoff (float, optional): The end of the passband relative to the CIC output rate.
+            Defaults to 0.2.
+        beta (float, optional): The shape of the Kaiser window. Defaults to KAISER_BETA.
+
+    Returns:
+        np.ndarray: The read-only float32 coefficients with unity gain at DC.
+    """
+    if not 0 < cutoff < 0.5:
+        raise ValueError("The cutoff frequency has to be in the range (0, 0.5).")
+
+    # Sample the desired response densely and transform it to the impulse response
+    size = 16 * max(taps, 64)
+    frequency = np.fft.rfftfreq(size)
+    inverse = 1 / cic_response(frequency, decimation, stages, delay)
+    desired = np.where(frequency <= cutoff, inverse, 0.0)
+    impulse = np.fft.fftshift(np.fft.irfft(desired, size))
+    start = size // 2 - (taps - 1) // 2
+    coefficients = impulse[start : start + taps] * np.kaiser(taps, beta)
+    return _read_only(coefficients / coefficients.sum())
+
+
+@lru_cache(maxsize=4)
+def nco_table(bits: int = TABLE_BITS) -> np.ndarray:
+    """Get one period of a complex exponential as lookup table.
+
+    Args:
+        bits (int, optional): The number of phase bits which address the table.
+            Defaults to TABLE_BITS.
+
+    Returns:
+        np.ndarray: The read-only complex64 table with `2**bits` entries.
+    """
+    table = np.exp(2j * np.pi * np.arange(2**bits) / 2**bits).astype(np.complex64)
+    table.flags.writeable = False
+    return table
+
+
+# === Classes ===
+
+
+class Nco:
+    """This class implements a bank of numerically controlled oscillators.
+
+    Each oscillator has an integer phase accumulator with `PHASE_BITS` bits,
+    the upper bits of the phase address a shared lookup table. The phase
+    is kept between the blocks, so the oscillators are continuous across
+    blocks and when they are retuned. All oscillators are computed together
+    as one array operation.
+    """
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        """Get the frequencies of the oscillators.
+
+        Returns:
+            np.ndarray: The frequencies in Hz after the quantization of the phase increments.
+        """
+        increments = self._increments.astype(np.int64)
+        increments[increments >= 2 ** (PHASE_BITS - 1)] -= 2**PHASE_BITS
+        return increments * self.sample_rate / 2**PHASE_BITS
+
+    def __init__(self, frequencies, sample_rate: float, bits: int = TABLE_BITS) -> None:
+        """Initialize the oscillators.
+
+        Args:
+            frequencies (float | list): The frequency of each oscillator in Hz, may be negative.
+            sample_rate (float): The sample rate in Hz.
+            bits (int, optional): The number of phase bits which address the table.
+                Defaults to TABLE_BITS.
+
+        ---
+        """
+        self.sample_rate: float = sample_rate
+        self._table: np.ndarray = nco_table(bits)
+        self._shift = np.uint64(PHASE_BITS - bits)
+        self._mask = np.uint64(2**PHASE_BITS - 1)
+        frequencies = np.atleast_1d(np.asarray(frequencies, dtype=np.float64))
+        self._increments = np.zeros(frequencies.size, dtype=np.uint64)
+        self._phases = np.zeros(frequencies.size, dtype=np.uint64)
+        for index, frequency in enumerate(frequencies):
+            self.tune(index, frequency)
+
+    def tune(self, index: int, frequency: float) -> None:
+        """Change the frequency of one oscillator without a phase jump.
+
+        Args:
+            index (int): The index of the oscillator.
+            frequency (float): The new frequency in Hz.
+        """
+        increment = round(frequency / self.sample_rate * 2**PHASE_BITS) % 2**PHASE_BITS
+        self._increments[index] = increment
+
+    def reset(self) -> None:
+        """Set the phases of all oscillators to zero."""
+        self._phases[:] = 0
+
+    def generate(self, count: int) -> np.ndarray:
+        """Generate the next samples of all oscillators.
+
+        Args:
+            count (int): The number of samples per oscillator.
+
+        Returns:
+            np.ndarray: The complex64 samples with the shape (oscillators, count).
+        """
+        steps = np.arange(count, dtype=np.uint64)
+        phases = (self._phases[:, None] + self._increments[:, None] * steps) & self._mask
+        self._phases = (self._phases + self._increments * np.uint64(count)) & self._mask
+        return self._table[phases >> self._shift]
+
+    def mix(self, samples: np.ndarray) -> np.ndarray:
+        """Multiply the samples with all oscillators.
+
+        Args:
+            samples (np.ndarray): The new samples.
+
+        Returns:
+            np.ndarray: The mixed samples with the shape (oscillators, samples).
+        """
+        samples = np.asarray(samples, dtype=np.complex64)
+        return self.generate(samples.size) * samples
+
+
+class FirDecimator:
+    """This class implements a decimating FIR filter in polyphase form.
+
+    The coefficients are split into one sub-filter per phase of the
+    decimation. Every sub-filter is applied with `np.convolve` to the strided
+    view of the samples which belong to its phase, so only the kept output
+    samples are computed. Zero coefficients at the borders of the
+    sub-filters are removed, e.g. every second coefficient of a halfband
+    filter costs nothing.
+
+    The last samples of each block are kept as history for the next block,
+    so the output does not depend on how the stream is split into blocks.
+    """
+
+    @property
+    def decimation(self) -> int:
+        """Get the decimation factor.
+
+        Returns:
+            int: The ratio of the input and output sample rate.
+        """
+        return self._decimation
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        """Get the coefficients of the filter.
+
+        Returns:
+            np.ndarray: The read-only coefficients.
+        """
+        return self._coefficients
+
+    def __init__(
+        self, decimation: int, coefficients: np.ndarray | None = None, taps: int | None = None,
+        dtype: np.dtype = np.complex64,
+    ) -> None:
+        """Initialize the filter.
+
+        Args:
+            decimation (int): The decimation factor.
+            coefficients (np.ndarray | None, optional): The filter coefficients. Defaults to a
+                `lowpass()` with the cutoff at 0.8 of the output Nyquist frequency.
+            taps (int | None, optional): The number of coefficients of the default lowpass.
+                Defaults to `16 * decimation + 1`.
+            dtype (np.dtype, optional): The data type of the samples. Defaults to np.complex64.
+
+        Raises:
+            ValueError: The decimation is smaller than one.
+
+        ---
+        """
+        if decimation < 1:
+            raise ValueError("The decimation has to be at least one.")
+        if coefficients is None:
+            coefficients = lowpass(taps or 16 * decimation + 1, 0.4 / decimation)
+        self._decimation: int = decimation
+        self._coefficients = _read_only(coefficients)
+        self._dtype = np.dtype(dtype)
+
+        # Split the coefficients into the sub-filters without their zero borders
+        self._phases: list[tuple[int, np.ndarray]] = []
+        for phase in range(decimation):
+            taps = self._coefficients[phase::decimation]
+            nonzero = np.flatnonzero(taps)
+            if nonzero.size == 0:
+                continue
+            first, last = nonzero[0], nonzero[-1]
+            # The offset is the index of the last used coefficient of the sub-filter
+            self._phases.append((phase + last * decimation, np.array(taps[first : last + 1])))
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the history of the filter."""
+        self._history = np.zeros(self._coefficients.size - 1, dtype=self._dtype)
+        # Like the CIC decimator, the last sample of each group of inputs is kept
+        self._skip: int = self._decimation - 1
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Filter and decimate a block of samples.
+
+        Args:
+            samples (np.ndarray): The new samples.
+
+        Returns:
+            np.ndarray: The decimated samples, may be empty for short blocks.
+        """
+        extended = np.concatenate((self._history, np.asarray(samples, dtype=self._dtype)))
+
+        # Index of the first output sample in the extended samples
+        first = self._history.size + self._skip
+        count = max(0, -(-(extended.size - first) // self._decimation))
+        output = np.zeros(count, dtype=self._dtype)
+        if count:
+            step = self._decimation
+            for offset, taps in self._phases:
+                start = first - offset
+                length = taps.size - 1 + count
+                branch = extended[start : start + (length - 1) * step + 1 : step]
+                output += np.convolve(branch, taps, mode="valid")
+
+        # Keep the history and the position of the next output sample
+        self._skip = first + count * self._decimation - extended.size
+        if self._history.size:
+            self._history = extended[-self._history.size :].copy()
+        return output
+
+
+class CicDecimator:
+    """This class implements a cascaded integrator-comb (CIC) decimator.
+
+    The CIC filter needs no multiplications: the integrators run at the
+    input rate with `np.cumsum`, the combs run at the output rate with
+    differences. Like in hardware, the integrators use wrapping integer
+    arithmetic, so the overflows of the integrators cancel in the combs.
+    The samples are quantized with the given resolution, the magnitude of
+    the samples times `(decimation * delay)**stages` divided by the
+    resolution has to stay below `2**63`.
+
+    The passband of a CIC filter droops, use a `compensator()` filter after
+    it, e.g. with `cic_chain()`.
+    """
+
+    @property
+    def decimation(self) -> int:
+        """Get the decimation factor.
+
+        Returns:
+            int: The ratio of the input and output sample rate.
+        """
+        return self._decimation
+
+    def __init__(
+        self, decimation: int, stages: int = 4, delay: int = 1, resolution: float = 2**-16,
+        dtype: np.dtype = np.complex64,
+    ) -> None:
+        """Initialize the filter.
+
+        Args:
+            decimation (int): The decimation factor.
+            stages (int, optional): The number of integrator and comb stages. Defaults to 4.
+            delay (int, optional): The differential delay of the combs. Defaults to 1.
+            resolution (float, optional): The quantization step of the samples. Defaults to 2**-16.
+            dtype (np.dtype, optional): The data type of the samples. Defaults to np.complex64.
+
+        Raises:
+            ValueError: The decimation, the stages or the delay are smaller than one.
+
+        ---
+        """
+        if min(decimation, stages, delay) < 1:
+            raise ValueError("The decimation, the stages and the delay have to be at least one.")
+        self._decimation: int = decimation
+        self.stages: int = stages
+        self.delay: int = delay
+        self.resolution: float = resolution
+        self._dtype = np.dtype(dtype)
+        self._gain: float = float(decimation * delay) ** stages
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the integrators and combs."""
+        # Complex samples are processed as pairs of real and imaginary part
+        width = 2 if self._dtype.kind == "c" else 1
+        self._integrators = np.zeros((self.stages, width), dtype=np.int64)
+        self._combs = np.zeros((self.stages, self.delay, width), dtype=np.int64)
+        self._skip: int = self._decimation - 1
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Filter and decimate a block of samples.
+
+        Args:
+            samples (np.ndarray): The new samples.
+
+        Returns:
+            np.ndarray: The decimated samples, may be empty for short blocks.
+        """
+        # The real view needs contiguous samples, e.g. a channel of interleaved data is strided
+        samples = np.ascontiguousarray(samples, dtype=self._dtype)
+        width = self._integrators.shape[1]
+        real = samples.view(samples.real.dtype).reshape(-1, width)
+        values = np.rint(real / self.resolution).astype(np.int64)
+
+        # Integrate at the input rate, the integer overflows wrap around
+        with np.errstate(over="ignore"):
+            for stage in range(self.stages):
+                np.cumsum(values, axis=0, out=values)
+                values += self._integrators[stage]
+                if values.size:
+                    self._integrators[stage] = values[-1]
+
+            # Keep every decimation-th sample
+            values = values[self._skip :: self._decimation]
+            self._skip = (self._skip - samples.size) % self._decimation
+
+            # Differentiate at the output rate
+            for stage in range(self.stages):
+                extended = np.concatenate((self._combs[stage], values))
+                values = extended[self.delay :] - extended[: -self.delay]
+                self._combs[stage] = extended[-self.delay :]
+
+        output = (values * (self.resolution / self._gain)).astype(real.dtype)
+        return output.view(self._dtype).reshape(-1)
+
+
+class FilterChain:
+    """This class runs decimating filters one after another.
+
+    The chain itself behaves like a filter, so it can be used as a stage of
+    the pipeline with `pipeline.add_stage(chain.process)`.
+    """
+
+    @property
+    def decimation(self) -> int:
+        """Get the total decimation factor.
+
+        Returns:
+            int: The product of the decimations of all filters.
+        """
+        return int(np.prod([stage.decimation for stage in self.filters]))
+
+    def __init__(self, *filters) -> None:
+        """Initialize the chain.
+
+        Args:
+            *filters: The filters in the order they are applied.
+
+        ---
+        """
+        self.filters: tuple = filters
+
+    def reset(self) -> None:
+        """Clear the state of all filters."""
+        for stage in self.filters:
+            stage.reset()
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Filter and decimate a block of samples.
+
+        Args:
+            samples (np.ndarray): The new samples.
+
+        Returns:
+            np.ndarray: The decimated samples.
+        """
+        for stage in self.filters:
+            samples = stage.process(samples)
+        return samples
+
+
+def halfband_cascade(stages: int, taps: int = 23, dtype: np.dtype = np.complex64) -> FilterChain:
+    """Create a cascade of halfband filters which decimate by two each.
+
+    The later filters run at lower rates, so the whole cascade costs about
+    twice as much as its first filter.
+
+    Args:
+        stages (int): The number of halfband filters, the decimation is `2**stages`.
+        taps (int, optional): The minimum number of coefficients per filter. Defaults to 23.
+        dtype (np.dtype, optional): The data type of the samples. Defaults to np.complex64.
+
+    Returns:
+        FilterChain: The cascade.
+    """
+    return FilterChain(*(FirDecimator(2, halfband(taps), dtype=dtype) for _ in range(stages)))
+
+
+def cic_chain(
+    decimation: int,
+    stages: int = 4,
+    taps: int = 63,
+    resolution: float = 2**-16,
+    dtype: np.dtype = np.complex64,
+) -> FilterChain:
+    """Create a CIC decimator followed by a compensating FIR decimator.
+
+    The CIC filter does the coarse decimation by `decimation / 2`, the
+    compensating filter flattens the passband and decimates by the last
+    factor of two.
+
+    Args:
+        decimation (int): The total decimation factor, has to be even.
+        stages (int, optional): The number of stages of the CIC filter. Defaults to 4.
+        taps (int, optional): The number of coefficients of the compensating filter. Defaults to 63.
+        resolution (float, optional): The quantization step of the CIC filter. Defaults to 2**-16.
+        dtype (np.dtype, optional): The data type of the samples. Defaults to np.complex64.
+
+    Raises:
+        ValueError: The decimation is not even.
+
+    Returns:
+        FilterChain: The chain of the CIC and the compensating filter.
+    """
+    if decimation < 2 or decimation % 2:
+        raise ValueError("The decimation of the CIC chain has to be even.")
+    coarse = decimation // 2
+    return FilterChain(
+        CicDecimator(coarse, stages, resolution=resolution, dtype=dtype),
+        FirDecimator(2, compensator(coarse, stages, taps=taps), dtype=dtype),
+    )
+
+
+class DigitalDownConverter:
+    """This class extracts several narrow channels from one stream of samples.
+
+    Each channel is given by its offset from the center frequency of the
+    device. The samples are mixed with one oscillator per channel, which
+    moves the channel to baseband, and then every channel is decimated by
+    its own filter. The mixing of all channels is one array operation.
+
+    Use it as a stage of the pipeline, e.g. with
+    `pipeline.add_stage(ddc.process)`, the stage then forwards one row of
+    decimated samples per channel.
+    """
+
+    @property
+    def decimation(self) -> int:
+        """Get the decimation factor of the channels.
+
+        Returns:
+            int: The ratio of the input and output sample rate.
+        """
+        return self._filters[0].decimation
+
+    @property
+    def output_rate(self) -> float:
+        """Get the sample rate of the channels.
+
+        Returns:
+            float: The output sample rate in Hz.
+        """
+        return self.sample_rate / self.decimation
+
+    @property
+    def offsets(self) -> tuple:
+        """Get the offsets of the channels.
+
+        Returns:
+            tuple: The offset of each channel from the center frequency in Hz.
+        """
+        return tuple(-self._nco.frequencies)
+
+    def __init__(self, sample_rate: float, offsets, decimation: int = 16, factory=None) -> None:
+        """Initialize the down-converter.
+
+        Args:
+            sample_rate (float): The sample rate of the input in Hz.
+            offsets (float | list): The offset of each channel from the center frequency in Hz.
+            decimation (int, optional): The decimation of the channels. Defaults to 16.
+            factory (function, optional): Called without arguments to create the filter of each
+                channel.
+                Defaults to a `FirDecimator` with the given decimation.
+
+        Raises:
+            ValueError: No channel is given or an offset is outside of the captured bandwidth.
+
+        ---
+        """
+        offsets = np.atleast_1d(np.asarray(offsets, dtype=np.float64))
+        if offsets.size == 0:
+            raise ValueError("The down-converter needs at least one channel.")
+        if np.any(np.abs(offsets) >= sample_rate / 2):
+            raise ValueError("The channel offsets have to be within the sample rate.")
+        self.sample_rate: float = sample_rate
+        self._nco = Nco(-offsets, sample_rate)
+        factory = factory or (lambda: FirDecimator(decimation))
+        self._filters: list = [factory() for _ in offsets]
+
+    def tune(self, channel: int, offset: float) -> None:
+        """Move a channel to another offset.
+
+        Args:
+            channel (int): The index of the channel.
+            offset (float): The new offset from the center frequency in Hz.
+
+        Raises:
+            ValueError: The offset is outside of the captured bandwidth.
+        """
+        if abs(offset) >= self.sample_rate / 2:
+            raise ValueError("The channel offset has to be within the sample rate.")
+        self._nco.tune(channel, -offset)
+
+    def reset(self) -> None:
+        """Clear the oscillators and the filters."""
+        self._nco.reset()
+        for channel in self._filters:
+            channel.reset()
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Down-convert and decimate a block of samples.
+
+        Args:
+            samples (np.ndarray): The new samples.
+
+        Returns:
+            np.ndarray: The complex64 channels with the shape (channels, decimated samples).
+        """
+        mixed = self._nco.mix(samples)
+        return np.stack([channel.process(row) for channel, row in zip(self._filters, mixed)])
@@ -0,0 +1,370 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Performance metrics for the application.
+
+## Description
+The metrics module contains lightweight counters to measure the performance
+of the different stages of the application, e.g. the acquisition rate of a
+device or the frame rate of a viewer. Latencies are recorded in histograms
+with a bounded relative error, and all metrics can be collected in a
+`Telemetry` registry and exported as JSON.
+
+### Details
+- *File:*     `metrics.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import json
+import math
+import time
+from itertools import accumulate
+from pathlib import Path
+
+# === Constants ===
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+# === Classes ===
+
+
+class RateCounter:
+    """Measure the rate of events per second.
+
+    The events are counted over a measurement interval. When the interval
+    has passed, the rate is updated and the counting starts again. The
+    counter is meant to be updated by one thread and can be read by any
+    other thread.
+    """
+
+    @property
+    def rate(self) -> float:
+        """Get the rate measured in the last complete interval.
+
+        Returns:
+            float: The rate in events per second.
+        """
+        return self._rate
+
+    @property
+    def total(self) -> int:
+        """Get the total number of counted events.
+
+        Returns:
+            int: The number of events since the last reset.
+        """
+        return self._total
+
+    def __init__(self, interval: float = 1.0) -> None:
+        """Initialize the rate counter.
+
+        Args:
+            interval (float, optional): The measurement interval in seconds. Defaults to 1.0.
+
+        ---
+        """
+        self.interval: float = interval
+        self._rate: float = 0.0
+        self._total: int = 0
+        self._count: int = 0
+        self._start: float = time.perf_counter()
+
+    def add(self, count: int = 1) -> None:
+        """Count new events.
+
+        Args:
+            count (int, optional): The number of new events. Defaults to 1.
+
+        ---
+        """
+        self._count += count
+        self._total += count
+
+        # Update the rate when the interval has passed
+        now = time.perf_counter()
+        if now - self._start >= self.interval:
+            self._rate = self._count / (now - self._start)
+            self._count = 0
+            self._start = now
+
+    def reset(self) -> None:
+        """Reset the counter and start a new measurement."""
+        self._rate = 0.0
+        self._total = 0
+        self._count = 0
+        self._start = time.perf_counter()
+
+    def to_dict(self) -> dict:
+        """Get the state of the counter.
+
+        Returns:
+            dict: The total number of events and the rate.
+        """
+        return {"total": self._total, "rate": self._rate}
+
+
+class _Timer:
+    """Context manager which records the elapsed time in a histogram."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram) -> None:
+        self._histogram = histogram
+        self._start: float = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._histogram.record(time.perf_counter() - self._start)
+
+
+class Histogram:
+    """Record the distribution of values with a bounded relative error.
+
+    Like a HDR histogram, the range is split into octaves which are each
+    split into linear sub-buckets. A value is counted in its bucket with a
+    single `frexp`, so recording is cheap enough for every block and frame.
+    The percentiles have a relative error below `10**-digits`. Values below
+    the lowest value, including negative values, are counted in the first
+    bucket and values above the highest value in the last one. The exact
+    minimum and maximum are kept.
+
+    The histogram is meant to be updated by one thread and can be read by
+    any other thread.
+    """
+
+    @property
+    def count(self) -> int:
+        """Get the number of recorded values.
+
+        Returns:
+            int: The number of values.
+        """
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        """Get the mean of the recorded values.
+
+        Returns:
+            float: The mean, 0.0 when no value was recorded.
+        """
+        return self._sum / self._count if self._count else 0.0
+
+    @property
+    def min(self) -> float:
+        """Get the smallest recorded value.
+
+        Returns:
+            float: The minimum, 0.0 when no value was recorded.
+        """
+        return self._min if self._count else 0.0
+
+    @property
+    def max(self) -> float:
+        """Get the largest recorded value.
+
+        Returns:
+            float: The maximum, 0.0 when no value was recorded.
+        """
+        return self._max if self._count else 0.0
+
+    def __init__(self, lowest: float = 1e-6, highest: float = 60.0, digits: int = 2) -> None:
+        """Initialize the histogram.
+
+        Args:
+            lowest (float, optional): The lowest value to resolve, e.g. 1 µs for latencies.
+                Defaults to 1e-6.
+            highest (float, optional): The highest value to resolve. Defaults to 60.0.
+            digits (int, optional): The number of significant decimal digits. Defaults to 2.
+
+        ---
+        """
+        if not 0 < lowest < highest:
+            raise ValueError("The lowest value must be positive and below the highest value.")
+        self.lowest: float = lowest
+        self.highest: float = highest
+        self._sub_buckets: int = 2 ** math.ceil(math.log2(10**digits / 2))
+        octaves = math.ceil(math.log2(highest / lowest)) + 1
+        self._counts: list[int] = [0] * (1 + octaves * self._sub_buckets)
+        self.reset()
+
+    def record(self, value: float) -> None:
+        """Record a value.
+
+        Args:
+            value (float): The value, e.g. a latency in seconds.
+
+        ---
+        """
+        mantissa, exponent = math.frexp(value / self.lowest)
+        if exponent < 1 or mantissa < 0:
+            index = 0
+        else:
+            sub_bucket = int((2 * mantissa - 1) * self._sub_buckets)
+            index = min((exponent - 1) * self._sub_buckets + sub_bucket + 1, len(self._counts) - 1)
+        self._counts[index] += 1
+        self._count += 1
+        self._sum += value
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+    def time(self) -> _Timer:
+        """Record the time spent in a `with` block.
+
+        Returns:
+            _Timer: The context manager, records the elapsed seconds when the block is left.
+        """
+        return _Timer(self)
+
+    def percentile(self, percent: float) -> float:
+        """Get a percentile of the recorded values.
+
+        Args:
+            percent (float): The percentile between 0 and 100.
+
+        Returns:
+            float: The value below which the given percentage of values lie, 0.0 when no value was
+                recorded.
+        """
+        if not self._count:
+            return 0.0
+        rank = max(math.ceil(percent / 100 * self._count), 1)
+        index = next(index for index, total in enumerate(accumulate(self._counts)) if total >= rank)
+        if index == 0:
+            return self.min
+        if index == len(self._counts) - 1:
+            return self.max
+
+        # Report the middle of the bucket, limited by the exact extremes
+        octave, sub_bucket = divmod(index - 1, self._sub_buckets)
+        value = self.lowest * 2**octave * (1 + (sub_bucket + 0.5) / self._sub_buckets)
+        return min(max(value, self.min), self.max)
+
+    def reset(self) -> None:
+        """Discard all recorded values."""
+        self._counts[:] = [0] * len(self._counts)
+        self._count: int = 0
+        self._sum: float = 0.0
+        self._min: float = math.inf
+        self._max: float = -math.inf
+
+    def to_dict(self) -> dict:
+        """Get a summary of the recorded values.
+
+        Returns:
+            dict: The count, mean, minimum, maximum and the percentiles of `PERCENTILES`.
+        """
+        summary = {"count": self._count, "mean": self.mean, "min": self.min, "max": self.max}
+        for percent in PERCENTILES:
+            summary[f"p{percent:g}"] = self.percentile(percent)
+        return summary
+
+
+class Telemetry:
+    """Collect the metrics of the application under one name each.
+
+    The registry holds histograms, rate counters and gauges. Gauges are
+    functions which are only called when a snapshot is taken, e.g. to read
+    the fill level of a buffer, so they cost nothing while running.
+    """
+
+    @property
+    def names(self) -> tuple:
+        """Get the names of the registered metrics.
+
+        Returns:
+            tuple: The names in the order they were registered.
+        """
+        return tuple(self._metrics)
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._metrics: dict = {}
+
+    def add(self, name: str, metric) -> None:
+        """Register a metric.
+
+        Args:
+            name (str): The name of the metric, e.g. `viewer.draw`.
+            metric (Histogram | RateCounter | function): The metric or a gauge function returning a
+                number.
+
+        ---
+        """
+        self._metrics[name] = metric
+
+    def histogram(self, name: str, **kwargs) -> Histogram:
+        """Get a histogram, it is created when it does not exist yet.
+
+        Args:
+            name (str): The name of the histogram.
+            **kwargs: The arguments to create the histogram.
+
+        Returns:
+            Histogram: The registered histogram.
+        """
+        return self._metrics.setdefault(name, Histogram(**kwargs))
+
+    def counter(self, name: str, **kwargs) -> RateCounter:
+        """Get a rate counter, it is created when it does not exist yet.
+
+        Args:
+            name (str): The name of the counter.
+            **kwargs: The arguments to create the counter.
+
+        Returns:
+            RateCounter: The registered counter.
+        """
+        return self._metrics.setdefault(name, RateCounter(**kwargs))
+
+    def snapshot(self) -> dict:
+        """Get the current state of all metrics.
+
+        Returns:
+            dict: The state of each metric by its name.
+        """
+        return {
+            name: metric.to_dict() if hasattr(metric, "to_dict") else metric()
+            for name, metric in self._metrics.items()
+        }
+
+    def to_json(self, path: str | Path | None = None) -> str:
+        """Export a snapshot of all metrics as JSON.
+
+        Args:
+            path (str | Path | None, optional): The file to write the JSON to. Defaults to None.
+
+        Returns:
+            str: The JSON document.
+        """
+        document = json.dumps({"timestamp": time.time(), "metrics": self.snapshot()}, indent=2)
+        if path is not None:
+            Path(path).write_text(document, encoding="utf-8")
+        return document
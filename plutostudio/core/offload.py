@@ -0,0 +1,416 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Offload the signal processing to worker processes.
+
+## Description
+Runs heavy DSP stages in worker processes to use more than one core.
+The IQ blocks are exchanged through ring buffers in shared memory, so the
+sample data is never pickled. Only the small results of the stages are
+sent back to the main process.
+
+### Details
+- *File:*     `offload.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import logging
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+from queue import Empty
+import numpy as np
+
+# === Logging ===
+logger = logging.getLogger(__name__)
+
+# === Constants ===
+_HEADER = 2  # The write and read counter in front of the slots
+
+# === Functions ===
+
+
+def _work(ring, stage, semaphore, stop_event, results) -> None:
+    """The processing loop of a worker process.
+
+    The stage processes the blocks in place in the shared memory. The
+    slot is only released after the stage returned.
+
+    Args:
+        ring (SharedBlockRing): The ring buffer of this worker, attached by name.
+        stage (function): The processing stage called with each block.
+        semaphore (Semaphore): Counts the blocks available in the ring buffer.
+        stop_event (Event): Stops the worker when set.
+        results (Queue): The queue for the results of the stage.
+    """
+    try:
+        while not stop_event.is_set():
+            if not semaphore.acquire(timeout=0.1):
+                continue
+            sequence, block = ring.peek()
+            result = stage(block)
+            ring.advance()
+            if result is not None:
+                results.put((sequence, result))
+    finally:
+        ring.close()
+
+
+# === Classes ===
+
+
+class SharedBlockRing:
+    """This class implements a single-producer/single-consumer ring of blocks in shared memory.
+
+    The ring consists of a fixed number of slots with a fixed block size.
+    The write and read counters and the sequence number of every block are
+    stored in the same shared memory segment as the samples. The producer
+    only advances the write counter and the consumer only advances the read
+    counter, so no lock is needed between the processes.
+
+    Pickling the ring only transfers the name of the segment. The ring is
+    attached to the same memory in the receiving process.
+    """
+
+    @property
+    def name(self) -> str:
+        """Get the name of the shared memory segment.
+
+        Returns:
+            str: The name of the segment.
+        """
+        return self._memory.name
+
+    @property
+    def size(self) -> int:
+        """Get the number of blocks which are not read yet.
+
+        Returns:
+            int: The number of blocks.
+        """
+        return int(self._counters[0] - self._counters[1])
+
+    @property
+    def slots(self) -> int:
+        """Get the number of slots of the ring.
+
+        Returns:
+            int: The number of slots.
+        """
+        return self._slots
+
+    @property
+    def block_size(self) -> int:
+        """Get the number of samples per block.
+
+        Returns:
+            int: The block size.
+        """
+        return self._block_size
+
+    def __init__(
+        self, slots: int, block_size: int, dtype: np.dtype = np.complex64, name: str | None = None
+    ) -> None:
+        """Create a new ring or attach to an existing one.
+
+        Args:
+            slots (int): The number of blocks the ring can hold.
+            block_size (int): The number of samples per block.
+            dtype (np.dtype, optional): The data type of the samples. Defaults to np.complex64.
+            name (str | None, optional): The name of an existing ring to attach to.
+                Defaults to a new ring.
+
+        ---
+        """
+        self._slots: int = slots
+        self._block_size: int = block_size
+        self._dtype = np.dtype(dtype)
+        header = (_HEADER + slots) * np.dtype(np.int64).itemsize
+        nbytes = header + slots * block_size * self._dtype.itemsize
+        self._owner: bool = name is None
+        self._memory = shared_memory.SharedMemory(name=name, create=self._owner, size=nbytes)
+        buffer = self._memory.buf
+        self._counters = np.ndarray(_HEADER, dtype=np.int64, buffer=buffer)
+        self._sequences = np.ndarray(slots, dtype=np.int64, buffer=buffer, offset=_HEADER * 8)
+        self._data = np.ndarray(
+            (slots, block_size), dtype=self._dtype, buffer=buffer, offset=header
+        )
+        if self._owner:
+            self._counters[:] = 0
+
+    def __reduce__(self):
+        """Pickle the ring by the name of its shared memory segment."""
+        return (SharedBlockRing, (self._slots, self._block_size, self._dtype, self.name))
+
+    def put(self, block: np.ndarray, sequence: int) -> bool:
+        """Put a block into the ring.
+
+        Args:
+            block (np.ndarray): The samples, must have the block size of the ring.
+            sequence (int): The sequence number of the block.
+
+        Returns:
+            bool: True when the block was written, False when the ring is full.
+        """
+        write = int(self._counters[0])
+        if write - self._counters[1] >= self._slots:
+            return False
+        slot = write % self._slots
+        self._data[slot] = block
+        self._sequences[slot] = sequence
+
+        # Publish the block only after the samples are written
+        self._counters[0] = write + 1
+        return True
+
+    def peek(self) -> tuple | None:
+        """Get the oldest block without releasing its slot.
+
+        Note:
+            The returned view is only valid until `advance()` is called.
+
+        Returns:
+            tuple | None: The sequence number and a view of the block, None when the ring is empty.
+        """
+        read = int(self._counters[1])
+        if read == self._counters[0]:
+            return None
+        slot = read % self._slots
+        return int(self._sequences[slot]), self._data[slot]
+
+    def advance(self) -> None:
+        """Release the slot of the oldest block."""
+        self._counters[1] += 1
+
+    def close(self) -> None:
+        """Detach from the shared memory and remove it when this ring created it."""
+        # The views have to be released before the memory can be closed
+        self._counters = self._sequences = self._data = None
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+
+class DspOffload:
+    """This class distributes blocks of samples to DSP worker processes.
+
+    The samples put into the offload are cut into blocks of a fixed size.
+    Each block gets a sequence number and is written to the shared memory
+    ring of the next worker which has a free slot. The workers call the
+    stage with a view of the block and send the result back through a queue,
+    together with the sequence number of the block.
+
+    The stage has to be picklable, e.g. a function defined at module level
+    or an instance of such a class. Every worker gets its own copy of the
+    stage, so stateful stages keep their state per worker.
+
+    When all rings are full or the workers are not started, the block is
+    dropped and counted, the producer never blocks.
+    """
+
+    @property
+    def blocks(self) -> int:
+        """Get the number of blocks handed to the workers.
+
+        Returns:
+            int: The number of blocks.
+        """
+        return self._sequence - self._dropped
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of blocks dropped because all workers were busy.
+
+        Returns:
+            int: The number of blocks.
+        """
+        return self._dropped
+
+    @property
+    def workers(self) -> int:
+        """Get the number of worker processes.
+
+        Returns:
+            int: The number of workers.
+        """
+        return self._workers
+
+    def __init__(
+        self,
+        stage,
+        block_size: int = 4096,
+        workers: int | None = None,
+        slots: int = 64,
+        dtype: np.dtype = np.complex64,
+    ) -> None:
+        """Initialize the offload.
+
+        Args:
+            stage (function): The stage called with each block in the worker, its result is returned
+                unless None.
+            block_size (int, optional): The number of samples per block. Defaults to 4096.
+            workers (int | None, optional): The number of worker processes.
+                Defaults to the number of cores.
+            slots (int, optional): The number of blocks buffered per worker. Defaults to 64.
+            dtype (np.dtype, optional): The data type of the samples. Defaults to np.complex64.
+
+        ---
+        """
+        self.stage = stage
+        self.block_size: int = block_size
+        self.slots: int = slots
+        self.dtype = np.dtype(dtype)
+        self._workers: int = workers or os.cpu_count() or 1
+        # Forking a process with running GUI threads can deadlock the child
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: list = []
+        self._rings: list[SharedBlockRing] = []
+        self._semaphores: list = []
+        self._stop_event = self._context.Event()
+        self._results = None
+        self._pending = np.zeros(block_size, dtype=self.dtype)
+        self._fill: int = 0
+        self._next: int = 0
+        self._sequence: int = 0
+        self._dropped: int = 0
+
+    def is_running(self) -> bool:
+        """Check whether the worker processes are running.
+
+        Returns:
+            bool: True when the workers are running.
+        """
+        return bool(self._processes)
+
+    def start(self) -> None:
+        """Create the shared memory rings and start the worker processes."""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._results = self._context.Queue()
+        self._rings = [
+            SharedBlockRing(self.slots, self.block_size, self.dtype) for _ in range(self._workers)
+        ]
+        self._semaphores = [self._context.Semaphore(0) for _ in range(self._workers)]
+        self._processes = [
+            self._context.Process(
+                target=_work,
+                args=(ring, self.stage, semaphore, self._stop_event, self._results),
+                name=f"dsp-{index}",
+                daemon=True,
+            )
+            for index, (ring, semaphore) in enumerate(zip(self._rings, self._semaphores))
+        ]
+        for process in self._processes:
+            process.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the worker processes and release the shared memory.
+
+        Args:
+            timeout (float, optional): The time to wait for each worker in seconds. Defaults to 1.0.
+
+        ---
+        """
+        self._stop_event.set()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                logger.warning("DSP worker %s did not stop, terminating it.", process.name)
+                process.terminate()
+        for ring in self._rings:
+            ring.close()
+        self._processes, self._rings, self._semaphores = [], [], []
+        self._fill = 0
+
+    def put(self, data: np.ndarray) -> int:
+        """Put samples into the offload.
+
+        Full blocks are written directly to the rings. The remaining samples
+        are kept until the next call completes the block.
+
+        Args:
+            data (np.ndarray): The samples.
+
+        Returns:
+            int: The number of blocks dropped by this call.
+        """
+        data = np.asarray(data).ravel()
+        dropped = self._dropped
+
+        # Complete the pending block first
+        if self._fill:
+            count = min(self.block_size - self._fill, data.size)
+            self._pending[self._fill : self._fill + count] = data[:count]
+            self._fill += count
+            data = data[count:]
+            if self._fill < self.block_size:
+                return 0
+            self._dispatch(self._pending)
+            self._fill = 0
+
+        # Hand out all full blocks without copying them in between
+        full = data.size - data.size % self.block_size
+        for start in range(0, full, self.block_size):
+            self._dispatch(data[start : start + self.block_size])
+
+        # Keep the rest for the next call
+        self._fill = data.size - full
+        self._pending[: self._fill] = data[full:]
+        return self._dropped - dropped
+
+    def results(self) -> list:
+        """Get the results which are available.
+
+        Returns:
+            list: Tuples of the sequence number of the block and the result, ordered by the sequence
+                number.
+        """
+        results = []
+        if self._results is None:
+            return results
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except Empty:
+                break
+        return sorted(results, key=lambda result: result[0])
+
+    def _dispatch(self, block: np.ndarray) -> None:
+        """Write a block to the next worker with a free slot.
+
+        Args:
+            block (np.ndarray): The block with the block size.
+        """
+        sequence = self._sequence
+        self._sequence += 1
+        for _ in range(len(self._rings)):
+            index = self._next
+            self._next = (self._next + 1) % len(self._rings)
+            if self._rings[index].put(block, sequence):
+                self._semaphores[index].release()
+                return
+        self._dropped += 1
@@ -0,0 +1,518 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Compose the acquisition from stages.
+
+## Description
+Connects a source device with processing stages and sinks. Every stage
+runs on its own thread and receives its blocks through a bounded queue.
+The queues apply a backpressure policy when a stage falls behind, and
+every stage counts its throughput and records its processing time and
+the latency since the acquisition of the block.
+
+### Details
+- *File:*     `pipeline.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import logging
+import time
+from collections import deque
+from threading import Thread, Event, Condition
+import numpy as np
+from .device import Device, DeviceSupervisor
+from .metrics import Histogram, RateCounter, Telemetry
+
+# === Logging ===
+logger = logging.getLogger(__name__)
+
+# === Constants ===
+POLICIES = ("block", "drop-oldest", "drop-newest")
+
+# === Classes ===
+
+
+class BlockQueue:
+    """This class implements a bounded queue of blocks.
+
+    When the queue is full, the policy decides what happens with a new block:
+    - `block`: The producer waits until the consumer made room.
+    - `drop-oldest`: The oldest queued block is discarded to make room.
+    - `drop-newest`: The new block is discarded.
+
+    Discarded blocks are counted. Like `queue.Queue`, the consumer reports
+    finished blocks with `task_done()`, so `join()` can wait until every
+    queued block was processed.
+    """
+
+    @property
+    def size(self) -> int:
+        """Get the number of queued blocks.
+
+        Returns:
+            int: The number of blocks.
+        """
+        return len(self._blocks)
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of discarded blocks.
+
+        Returns:
+            int: The number of blocks.
+        """
+        return self._dropped
+
+    def __init__(self, max_blocks: int = 16, policy: str = "block") -> None:
+        """Initialize the queue.
+
+        Args:
+            max_blocks (int, optional): The maximum number of queued blocks. Defaults to 16.
+            policy (str, optional): The policy when the queue is full. Defaults to "block".
+
+        ---
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Policy must be one of {POLICIES}, got {policy!r}.")
+        if max_blocks < 1:
+            raise ValueError("The queue must hold at least one block.")
+        self.max_blocks: int = max_blocks
+        self.policy: str = policy
+        self._blocks: deque = deque()
+        self._dropped: int = 0
+        self._unfinished: int = 0
+        self._closed: bool = False
+        self._condition = Condition()
+
+    def put(self, block: np.ndarray, timeout: float | None = None) -> bool:
+        """Put a block into the queue.
+
+        Args:
+            block (np.ndarray): The block.
+            timeout (float | None, optional): The maximum time to wait with the `block` policy.
+                Defaults to None.
+
+        Returns:
+            bool: True when the block was queued.
+        """
+        with self._condition:
+            if len(self._blocks) >= self.max_blocks:
+                if self.policy == "drop-newest":
+                    self._dropped += 1
+                    return False
+                if self.policy == "drop-oldest":
+                    self._blocks.popleft()
+                    self._dropped += 1
+                    self._unfinished -= 1
+                elif not self._condition.wait_for(
+                    lambda: len(self._blocks) < self.max_blocks or self._closed, timeout
+                ) or self._closed:
+                    return False
+            self._blocks.append(block)
+            self._unfinished += 1
+            self._condition.notify_all()
+            return True
+
+    def get(self, timeout: float | None = None) -> np.ndarray | None:
+        """Get the oldest block from the queue.
+
+        Args:
+            timeout (float | None, optional): The maximum time to wait for a block.
+                Defaults to None.
+
+        Returns:
+            np.ndarray | None: The block, None when no block arrived in time or the queue is closed.
+        """
+        with self._condition:
+            arrived = self._condition.wait_for(lambda: self._blocks or self._closed, timeout)
+            if not arrived or not self._blocks:
+                return None
+            block = self._blocks.popleft()
+            self._condition.notify_all()
+            return block
+
+    def task_done(self) -> None:
+        """Report that a block returned by `get()` was processed."""
+        with self._condition:
+            self._unfinished -= 1
+            self._condition.notify_all()
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait until all queued blocks were processed.
+
+        Args:
+            timeout (float | None, optional): The maximum time to wait in seconds. Defaults to None.
+
+        Returns:
+            bool: True when all blocks were processed in time.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._unfinished <= 0, timeout)
+
+    def close(self) -> None:
+        """Close the queue and wake up all waiting threads."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def open(self) -> None:
+        """Open the queue again and discard the queued blocks."""
+        with self._condition:
+            self._blocks.clear()
+            self._unfinished = 0
+            self._closed = False
+
+
+class Stage:
+    """This class processes blocks on its own thread.
+
+    The function of the stage is called with every block of the input queue.
+    Its result is handed to the following stages, unless it is None. The
+    return value of sinks is ignored. Errors of the function are logged and
+    counted, the stage continues with the next block.
+
+    The blocks travel through the queues together with the time at which
+    they were acquired. The stage records the time spent in its function
+    and the latency from the acquisition until the block was processed.
+    """
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of input blocks discarded by the backpressure policy.
+
+        Returns:
+            int: The number of blocks.
+        """
+        return self.queue.dropped
+
+    @property
+    def errors(self) -> int:
+        """Get the number of blocks for which the function failed.
+
+        Returns:
+            int: The number of blocks.
+        """
+        return self._errors
+
+    def __init__(
+        self, function, name: str | None = None, max_blocks: int = 16, policy: str = "block"
+    ) -> None:
+        """Initialize the stage.
+
+        Args:
+            function (function): Called with each block, returns the block for the following
+                stages or None.
+            name (str | None, optional): The name of the stage.
+                Defaults to the name of the function.
+            max_blocks (int, optional): The maximum number of queued input blocks. Defaults to 16.
+            policy (str, optional): The backpressure policy of the input queue. Defaults to "block".
+
+        ---
+        """
+        self.function = function
+        self.name: str = name or getattr(function, "__qualname__", type(function).__name__)
+        self.queue = BlockQueue(max_blocks, policy)
+        self.rate = RateCounter()
+        self.blocks = RateCounter()
+        self.duration = Histogram()
+        self.latency = Histogram()
+        self.last_timestamp: float | None = None
+        self._errors: int = 0
+        self._outputs: list[Stage] = []
+
+    def process(self, block: np.ndarray) -> np.ndarray | None:
+        """Process one block and count it.
+
+        Args:
+            block (np.ndarray): The input block.
+
+        Returns:
+            np.ndarray | None: The result for the following stages.
+        """
+        start = time.perf_counter()
+        try:
+            result = self.function(block)
+        # Stages are user code, a failing block must not stop the pipeline
+        except Exception: # pylint: disable=broad-except
+            self._errors += 1
+            logger.exception("Stage %s failed to process a block.", self.name)
+            return None
+        self.duration.record(time.perf_counter() - start)
+        self.rate.add(np.size(block))
+        self.blocks.add()
+        return result if self._outputs else None
+
+    def forward(self, block: np.ndarray, timestamp: float, stop_event: Event) -> None:
+        """Hand a block to the following stages.
+
+        With the `block` policy this waits until the following stage made
+        room or the pipeline is stopped.
+
+        Args:
+            block (np.ndarray): The block.
+            timestamp (float): The `time.perf_counter()` time at which the block was acquired.
+            stop_event (Event): Stops waiting when set.
+
+        ---
+        """
+        for output in self._outputs:
+            while not output.queue.put((timestamp, block), timeout=0.1):
+                if output.queue.policy != "block" or stop_event.is_set():
+                    break
+
+    def run(self, stop_event: Event) -> None:
+        """The processing loop of the stage.
+
+        Args:
+            stop_event (Event): Stops the loop when set.
+
+        ---
+        """
+        while not stop_event.is_set():
+            item = self.queue.get(timeout=0.1)
+            if item is None:
+                continue
+            timestamp, block = item
+            result = self.process(block)
+            self.latency.record(time.perf_counter() - timestamp)
+            self.last_timestamp = timestamp
+            if result is not None:
+                self.forward(result, timestamp, stop_event)
+            self.queue.task_done()
+
+
+class Pipeline:
+    """This class runs a device through a chain of stages into sinks.
+
+    The source thread acquires the device through a `DeviceSupervisor`,
+    which reconnects the device when it fails. The blocks then pass the
+    processing stages in the order they were added. Every sink receives
+    the output of the last stage, e.g. a recorder and the buffer of the
+    viewer.
+
+    Example:
+    ```
+    pipeline = Pipeline(Pluto())
+    pipeline.add_stage(decimate, policy="drop-oldest")
+    pipeline.add_sink(recorder.put)
+    pipeline.add_sink(display.put, policy="drop-newest")
+    pipeline.start()
+    ```
+    """
+
+    @property
+    def rate(self) -> RateCounter:
+        """Get the throughput of the source.
+
+        Returns:
+            RateCounter: The counter of the acquired samples.
+        """
+        return self._source.rate
+
+    @property
+    def stages(self) -> tuple:
+        """Get the processing stages and sinks.
+
+        Returns:
+            tuple: The stages in the order they were added, followed by the sinks.
+        """
+        return tuple(self._stages + self._sinks)
+
+    def __init__(self, device: Device) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            device (Device): The source of the blocks.
+
+        ---
+        """
+        self.device = device
+        self.supervisor = DeviceSupervisor(device)
+        self._source = Stage(self.supervisor.acquire, name=device.name)
+        self._stages: list[Stage] = []
+        self._sinks: list[Stage] = []
+        self._threads: list[Thread] = []
+        self._stop_event = Event()
+        self._source_stop = Event()
+
+    def add_stage(
+        self, function, name: str | None = None, max_blocks: int = 16, policy: str = "block"
+    ) -> Stage:
+        """Append a processing stage to the chain.
+
+        Args:
+            function (function): Called with each block, returns the processed block or None.
+            name (str | None, optional): The name of the stage.
+                Defaults to the name of the function.
+            max_blocks (int, optional): The maximum number of queued input blocks. Defaults to 16.
+            policy (str, optional): The backpressure policy of the input queue. Defaults to "block".
+
+        Returns:
+            Stage: The added stage.
+        """
+        return self._add(Stage(function, name, max_blocks, policy), sink=False)
+
+    def add_sink(
+        self, function, name: str | None = None, max_blocks: int = 16, policy: str = "block"
+    ) -> Stage:
+        """Add a sink which receives the output of the last stage.
+
+        Args:
+            function (function): Called with each block, the return value is ignored.
+            name (str | None, optional): The name of the sink. Defaults to the name of the function.
+            max_blocks (int, optional): The maximum number of queued input blocks. Defaults to 16.
+            policy (str, optional): The backpressure policy of the input queue. Defaults to "block".
+
+        Returns:
+            Stage: The added sink.
+        """
+        return self._add(Stage(function, name, max_blocks, policy), sink=True)
+
+    def is_running(self) -> bool:
+        """Check whether the threads of the pipeline are running.
+
+        Returns:
+            bool: True when at least one thread is running.
+        """
+        return any(thread.is_alive() for thread in self._threads)
+
+    def is_acquiring(self) -> bool:
+        """Check whether the source is still acquiring.
+
+        Returns:
+            bool: False when the pipeline is stopped or the device has no more data.
+        """
+        return bool(self._threads) and self._threads[0].is_alive()
+
+    def start(self) -> None:
+        """Start the source and one thread per stage."""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._source_stop.clear()
+        self._source.rate.reset()
+        self._threads = [
+            Thread(target=self._acquire, name=f"source-{self.device.name}", daemon=True)
+        ]
+        for stage in self.stages:
+            stage.queue.open()
+            self._threads.append(
+                Thread(target=stage.run, args=(self._stop_event,), name=stage.name, daemon=True)
+            )
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float | None = None, drain: bool = False) -> None:
+        """Stop all threads of the pipeline.
+
+        The source is stopped first. With `drain`, the stages then process
+        all blocks which were already acquired before they are stopped, e.g.
+        to record every acquired sample.
+
+        Args:
+            timeout (float | None, optional): The time to wait for each thread in seconds.
+                Defaults to None.
+            drain (bool, optional): Process the queued blocks before stopping. Defaults to False.
+
+        ---
+        """
+        self._source_stop.set()
+        if self._threads:
+            self._threads[0].join(timeout)
+
+        # The stages are drained in order, so no block arrives at a drained stage
+        if drain:
+            for stage in self.stages:
+                stage.queue.join(timeout)
+
+        self._stop_event.set()
+        for stage in self.stages:
+            stage.queue.close()
+        for thread in self._threads[1:]:
+            thread.join(timeout)
+
+    def register(self, telemetry: Telemetry, prefix: str = "pipeline") -> None:
+        """Register the metrics of the source and all stages.
+
+        Args:
+            telemetry (Telemetry): The registry to add the metrics to.
+            prefix (str, optional): The prefix of the metric names. Defaults to "pipeline".
+
+        ---
+        """
+        telemetry.add(f"{prefix}.acquire", self._source.duration)
+        telemetry.add(f"{prefix}.samples", self._source.rate)
+        for stage in self.stages:
+            name = f"{prefix}.{stage.name}"
+            telemetry.add(f"{name}.duration", stage.duration)
+            telemetry.add(f"{name}.latency", stage.latency)
+            telemetry.add(f"{name}.samples", stage.rate)
+            telemetry.add(f"{name}.queue", lambda stage=stage: stage.queue.size)
+            telemetry.add(f"{name}.dropped", lambda stage=stage: stage.dropped)
+
+    def _add(self, stage: Stage, sink: bool) -> Stage:
+        """Connect a stage to the pipeline.
+
+        Args:
+            stage (Stage): The new stage.
+            sink (bool): Whether the stage is a sink.
+
+        Raises:
+            RuntimeError: The pipeline is running.
+
+        Returns:
+            Stage: The connected stage.
+        """
+        if self.is_running():
+            raise RuntimeError("Stages cannot be added while the pipeline is running.")
+        if sink:
+            self._sinks.append(stage)
+        else:
+            self._stages.append(stage)
+
+        # Rewire the chain, the sinks follow the last processing stage
+        chain = [self._source] + self._stages
+        for previous, following in zip(chain, chain[1:]):
+            previous._outputs = [following]  # pylint: disable=protected-access
+        chain[-1]._outputs = list(self._sinks)  # pylint: disable=protected-access
+        return stage
+
+    def _acquire(self) -> None:
+        """The acquisition loop of the source."""
+        while not self._source_stop.is_set():
+            start = time.perf_counter()
+            try:
+                data = self.supervisor.acquire(self._source_stop)
+            except EOFError:
+                logger.info("Acquisition of %s reached the end of the data.", self.device.name)
+                return
+            timestamp = time.perf_counter()
+            if data.size:
+                self._source.duration.record(timestamp - start)
+                self._source.rate.add(data.size)
+                self._source.blocks.add()
+                # Devices may reuse their output array, the queued block has to own its samples
+                self._source.forward(np.array(data), timestamp, self._source_stop)
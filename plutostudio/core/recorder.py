@@ -0,0 +1,368 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Record the acquired data to disk.
+
+## Description
+The recorder streams blocks of samples to disk in the SigMF format. Every
+recording consists of one or more segments, each with a binary data file and
+a JSON metadata file with the sample rate, the center frequency and the time
+of the first sample. Blocks dropped while the disk stalls start a new capture
+with the time of its first sample, so the gap is visible in the metadata.
+The keys of the `plutostudio` namespace are declared as an optional SigMF
+extension. The data is written from a separate thread, so slow disk
+access never blocks the acquisition.
+
+### Details
+- *File:*     `recorder.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import json
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from threading import Thread, Event
+import numpy as np
+from plutostudio import __version__
+from .buffer import IQ_INT16, RingBuffer
+
+# === Constants ===
+# SigMF names of the supported sample types
+DATATYPES = {
+    np.dtype(np.complex64): "cf32_le",
+    np.dtype(np.complex128): "cf64_le",
+    IQ_INT16: "ci16_le",
+    np.dtype(np.float32): "rf32_le",
+    np.dtype(np.float64): "rf64_le",
+    np.dtype(np.int16): "ri16_le",
+}
+SIGMF_VERSION = "1.0.0"
+# SigMF declaration of the plutostudio keys in the metadata
+EXTENSION = {"name": "plutostudio", "version": "1.0.0", "optional": True}
+
+
+# === Classes ===
+
+
+class Recorder:
+    """This class records a stream of samples to SigMF files.
+
+    The acquisition thread hands the blocks to the recorder with `put()`,
+    which only copies them into a `RingBuffer`. A writer thread drains the
+    ring buffer and appends the samples to the current segment with large
+    buffered writes. When the ring buffer is full because the disk stalls,
+    the blocks are dropped and counted instead of blocking the acquisition.
+    The producer notes where in the stream each block was dropped, the writer
+    then advances the sample clock of the metadata by the dropped samples.
+
+    A new segment is started when the current segment reaches the maximum
+    size or duration. The segments are named `<path>_<index>.sigmf-data`
+    and `<path>_<index>.sigmf-meta`.
+    """
+
+    @property
+    def samples_written(self) -> int:
+        """Get the number of samples written to disk.
+
+        Returns:
+            int: The number of written samples.
+        """
+        return self._samples_written
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of samples dropped because the writer fell behind.
+
+        Returns:
+            int: The number of dropped samples.
+        """
+        return self._buffer.dropped
+
+    @property
+    def segments(self) -> tuple:
+        """Get the data files written so far.
+
+        Returns:
+            tuple: The paths of the data files of all segments.
+        """
+        return tuple(self._segments)
+
+    @property
+    def error(self) -> Exception | None:
+        """Get the exception which stopped the writer thread.
+
+        Returns:
+            Exception | None: The exception or None while the writer works.
+        """
+        return self._error
+
+    def is_recording(self) -> bool:
+        """Check if the recorder is running.
+
+        Returns:
+            bool: True if the writer thread is running, False when it is stopped or failed.
+        """
+        return self._thread is not None and self._error is None
+
+    def __init__(
+        self,
+        path: str | Path,
+        sample_rate: float,
+        center_frequency: float = 0.0,
+        dtype: np.dtype = np.complex64,
+        max_segment_bytes: int = 2**30,
+        max_segment_seconds: float | None = None,
+        buffer_size: int = 2**23,
+    ) -> None:
+        """Initialize the recorder.
+
+        Args:
+            path (str | Path): The base path of the recording without extension.
+            sample_rate (float): The sample rate in Hz.
+            center_frequency (float, optional): The center frequency in Hz. Defaults to 0.0.
+            dtype (np.dtype, optional): The type of the recorded samples. Defaults to np.complex64.
+            max_segment_bytes (int, optional): The maximum size of one segment. Defaults to 2**30.
+            max_segment_seconds (float | None, optional): The maximum duration of one segment.
+                Defaults to None.
+            buffer_size (int, optional): The number of samples buffered for the writer.
+                Defaults to 2**23.
+
+        Raises:
+            ValueError: The sample type is not supported.
+            OSError: The directory of the recording cannot be created.
+
+        ---
+        """
+        if np.dtype(dtype) not in DATATYPES:
+            raise ValueError(f"Unsupported sample type '{np.dtype(dtype)}'.")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.sample_rate: float = sample_rate
+        self.center_frequency: float = center_frequency
+        self.max_segment_bytes: int = max_segment_bytes
+        self.max_segment_seconds: float | None = max_segment_seconds
+        self._buffer = RingBuffer(buffer_size, dtype=dtype)
+        self._stop_event = Event()
+        self._thread = None
+        self._error: Exception | None = None
+
+        # State of the producer, the writer takes the drops from the queue
+        self._accepted: int = 0
+        self._drops = deque()
+
+        # State of the writer thread
+        self._segments = []
+        self._file = None
+        self._segment_samples: int = 0
+        self._segment_started: float = 0.0
+        self._samples_written: int = 0
+        self._skipped: int = 0
+        self._captures = []
+        self._start_sample: int = 0
+        self._start_time = datetime.now(timezone.utc)
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self.is_recording():
+            return
+        self._stop_event.clear()
+        self._error = None
+        self._start_sample = self._samples_written + self._skipped
+        self._start_time = datetime.now(timezone.utc)
+        self._thread = Thread(target=self._write_loop, name="Recorder", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write the remaining samples and stop the writer thread.
+
+        Raises:
+            Exception: The exception which stopped the writer thread, e.g. an OSError.
+        """
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        if self._error is not None:
+            raise self._error
+
+    def put(self, data: np.ndarray) -> bool:
+        """Hand a block of samples to the recorder.
+
+        Note:
+            Must only be called from one producer thread.
+
+        Args:
+            data (np.ndarray): The samples to record.
+
+        Returns:
+            bool: True if the block was buffered, False if it was dropped or the writer failed.
+        """
+        if self._error is not None:
+            return False
+        dropped = self._buffer.dropped
+        if not self._buffer.put(data):
+            # Note the position of the gap in the stream of the written samples
+            self._drops.append((self._accepted, self._buffer.dropped - dropped))
+            return False
+        self._accepted += np.size(data)
+        return True
+
+    def _write_loop(self) -> None:
+        """Write the buffered samples to disk until the recorder is stopped."""
+        try:
+            while not self._stop_event.is_set():
+                samples = self._buffer.read_available()
+                if samples.size:
+                    self._write(samples)
+                else:
+                    self._stop_event.wait(0.005)
+
+            # Write what is left after the stop request
+            self._write(self._buffer.read_available())
+            self._close_segment()
+        except Exception as error: # pylint: disable=broad-except
+            # Keep the exception for stop(), the segment is closed without its metadata
+            self._error = error
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _write(self, samples: np.ndarray) -> None:
+        """Write samples to the segments.
+
+        Args:
+            samples (np.ndarray): The samples to write.
+        """
+        itemsize = samples.dtype.itemsize
+        while samples.size:
+            # Start a new segment when the current one is full or too old
+            if self._file is None or self._segment_samples * itemsize >= self.max_segment_bytes:
+                self._open_segment()
+            elif (
+                self.max_segment_seconds is not None
+                and time.monotonic() - self._segment_started >= self.max_segment_seconds
+            ):
+                self._open_segment()
+
+            # Write as much as fits into the segment
+            free = max(self.max_segment_bytes // itemsize - self._segment_samples, 1)
+            chunk = samples[:free]
+            chunk.tofile(self._file)
+            self._segment_samples += chunk.size
+            self._samples_written += chunk.size
+            samples = samples[chunk.size :]
+
+    def _open_segment(self) -> None:
+        """Close the current segment and start a new one."""
+        self._close_segment()
+        name = f"{self.path.name}_{len(self._segments):04d}"
+        path = self.path.with_name(f"{name}.sigmf-data")
+        self._segments.append(path)
+        self._file = open(path, "wb", buffering=2**20)  # pylint: disable=consider-using-with
+        self._segment_samples = 0
+        self._segment_started = time.monotonic()
+
+        # Skip the blocks dropped before the first sample of the segment
+        while self._next_drop(self._samples_written + 1) is not None:
+            pass
+        self._captures = [self._capture(0)]
+        self._write_metadata()
+
+    def _close_segment(self) -> None:
+        """Flush the current segment and update its metadata."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+
+        # Start a new capture after every gap within the segment
+        first_sample = self._samples_written - self._segment_samples
+        while (position := self._next_drop(self._samples_written)) is not None:
+            capture = self._capture(position - first_sample)
+            if capture["core:sample_start"] == self._captures[-1]["core:sample_start"]:
+                self._captures[-1] = capture
+            else:
+                self._captures.append(capture)
+        self._write_metadata()
+
+    def _next_drop(self, end: int) -> int | None:
+        """Take the next drop before a written sample and advance the sample clock.
+
+        Args:
+            end (int): The index of the written sample, drops at this sample are not taken.
+
+        Returns:
+            int | None: The index of the written sample after the gap, None when there is no
+                drop before the sample.
+        """
+        if not self._drops or self._drops[0][0] >= end:
+            return None
+        position, count = self._drops.popleft()
+        self._skipped += count
+        return position
+
+    def _capture(self, sample_start: int) -> dict:
+        """Create the capture which starts at a sample of the current segment.
+
+        Args:
+            sample_start (int): The index of the first sample of the capture in the segment.
+
+        Returns:
+            dict: The SigMF capture with the acquisition time of the sample.
+        """
+        sample = self._samples_written - self._segment_samples + sample_start
+        elapsed = (sample + self._skipped - self._start_sample) / self.sample_rate
+        timestamp = self._start_time + timedelta(seconds=elapsed)
+        return {
+            "core:sample_start": sample_start,
+            "core:frequency": self.center_frequency,
+            "core:datetime": timestamp.isoformat().replace("+00:00", "Z"),
+        }
+
+    def _write_metadata(self) -> None:
+        """Write the SigMF metadata of the current segment."""
+        first_sample = self._samples_written - self._segment_samples
+        metadata = {
+            "global": {
+                "core:datatype": DATATYPES[self._buffer.dtype],
+                "core:sample_rate": self.sample_rate,
+                "core:version": SIGMF_VERSION,
+                "core:recorder": f"PlutoStudio v{__version__}",
+                "core:num_channels": 1,
+                "core:extensions": [EXTENSION],
+                "plutostudio:first_sample": first_sample,
+                "plutostudio:samples": self._segment_samples,
+                "plutostudio:dropped": self._buffer.dropped,
+            },
+            "captures": self._captures,
+            "annotations": [],
+        }
+        path = self._segments[-1].with_name(self._segments[-1].stem + ".sigmf-meta")
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(metadata, file, indent=4)
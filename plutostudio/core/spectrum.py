@@ -0,0 +1,318 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Spectrum processing for the application.
+
+## Description
+The spectrum module turns blocks of IQ samples into power spectra. The
+samples are split into overlapping frames, windowed and transformed with the
+FFT. The power spectra of the frames are averaged to reduce the noise of the
+displayed spectrum.
+
+### Details
+- *File:*     `spectrum.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+from functools import lru_cache
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# === Constants ===
+# Coefficients of the cosine sum windows
+WINDOWS = {
+    "rectangular": (1.0,),
+    "hann": (0.5, 0.5),
+    "blackman": (0.42, 0.5, 0.08),
+    "flattop": (0.21557895, 0.41663158, 0.277263158, 0.083578947, 0.006947368),
+}
+AVERAGING = ("none", "exponential", "linear")
+# NumPy 2 can write the transform into a preallocated array, older versions allocate the result
+FFT_OUT = np.lib.NumpyVersion(np.__version__) >= "2.0.0"
+
+
+# === Functions ===
+@lru_cache(maxsize=32)
+def get_window(name: str, size: int) -> np.ndarray:
+    """Get the periodic window of the given type and size.
+
+    The windows are computed once per type and size and cached afterwards.
+
+    Args:
+        name (str): The name of the window, one of `WINDOWS`.
+        size (int): The number of samples of the window.
+
+    Raises:
+        ValueError: The window type is not known.
+
+    Returns:
+        np.ndarray: The read-only float32 window.
+    """
+    if name not in WINDOWS:
+        raise ValueError(f"Unknown window '{name}', use one of {tuple(WINDOWS)}.")
+
+    # Sum the cosine terms with alternating signs
+    phase = 2 * np.pi * np.arange(size) / size
+    window = np.zeros(size)
+    for order, coefficient in enumerate(WINDOWS[name]):
+        window += (-1) ** order * coefficient * np.cos(order * phase)
+    window = window.astype(np.float32)
+    window.flags.writeable = False
+    return window
+
+
+def frequencies(size: int, sample_rate: float) -> np.ndarray:
+    """Get the frequencies of the bins of a centered spectrum.
+
+    Args:
+        size (int): The FFT size.
+        sample_rate (float): The sample rate in Hz.
+
+    Returns:
+        np.ndarray: The frequency of each bin in Hz, from negative to positive.
+    """
+    return np.fft.fftshift(np.fft.fftfreq(size, 1 / sample_rate))
+
+
+def to_db(power: np.ndarray) -> np.ndarray:
+    """Convert a power spectrum to decibel.
+
+    Args:
+        power (np.ndarray): The linear power spectrum.
+
+    Returns:
+        np.ndarray: The power spectrum in dB.
+    """
+    return 10 * np.log10(np.maximum(power, np.finfo(np.float32).tiny))
+
+
+# === Classes ===
+
+
+class Spectrum:
+    """This class computes averaged power spectra from a stream of IQ samples.
+
+    The samples of consecutive blocks are treated as one continuous stream.
+    Samples which do not fill a complete frame are kept until the next block
+    arrives. All frames of a block are windowed and transformed at once in
+    preallocated working memory, which only grows for larger blocks.
+
+    For even FFT sizes, the window is modulated with `(-1)**n`, which moves
+    the spectrum by half of the FFT size, so the spectrum comes out centered
+    without an extra shift. The window also includes the scaling.
+
+    The power spectrum is centered, i.e. the first bin is the most negative
+    frequency, and scaled such that a tone with the amplitude `A` has the
+    power `A**2`, independent of the window.
+    """
+
+    @property
+    def fft_size(self) -> int:
+        """Get the FFT size.
+
+        Returns:
+            int: The number of samples per frame.
+        """
+        return self._fft_size
+
+    @property
+    def hop(self) -> int:
+        """Get the number of samples between the start of two frames.
+
+        Returns:
+            int: The hop size in samples.
+        """
+        return self._hop
+
+    @property
+    def frames(self) -> int:
+        """Get the number of frames in the current average.
+
+        Returns:
+            int: The number of averaged frames.
+        """
+        return self._frames
+
+    def __init__(
+        self,
+        fft_size: int = 1024,
+        window: str = "hann",
+        overlap: float = 0.5,
+        averaging: str = "exponential",
+        averages: int = 10,
+    ) -> None:
+        """Initialize the spectrum.
+
+        Args:
+            fft_size (int, optional): The number of samples per frame. Defaults to 1024.
+            window (str, optional): The window type, one of `WINDOWS`. Defaults to "hann".
+            overlap (float, optional): The overlap of two frames in [0, 1). Defaults to 0.5.
+            averaging (str, optional): The averaging mode, one of `AVERAGING`.
+                Defaults to "exponential".
+            averages (int, optional): The number of averaged frames. Defaults to 10.
+
+        Raises:
+            ValueError: One of the settings is not valid.
+
+        ---
+        """
+        if not 0 <= overlap < 1:
+            raise ValueError("The overlap has to be in the range [0, 1).")
+        if averaging not in AVERAGING:
+            raise ValueError(f"Unknown averaging '{averaging}', use one of {AVERAGING}.")
+        if averages < 1:
+            raise ValueError("At least one frame has to be averaged.")
+
+        # Store the settings
+        self._fft_size: int = fft_size
+        self._hop: int = max(1, round(fft_size * (1 - overlap)))
+        self._window = get_window(window, fft_size)
+        self._scale: float = 1 / float(np.sum(self._window)) ** 2
+        self._shift: bool = fft_size % 2 == 1
+        self._modulated = self._window * np.float32(np.sqrt(self._scale))
+        if not self._shift:
+            self._modulated[1::2] *= -1
+        self.averaging: str = averaging
+        self.averages: int = averages
+
+        # Allocate the working memory
+        self._stream = np.zeros(2 * fft_size, dtype=np.complex64)
+        self._pending: int = 0
+        self._windowed = np.zeros((0, fft_size), dtype=np.complex64)
+        self._frame_power = np.zeros((0, fft_size), dtype=np.float32)
+        self._power = np.zeros(fft_size, dtype=np.float32)
+        self._sum = np.zeros(fft_size, dtype=np.float64)
+        self._weight: float = 0.0
+        self._frames: int = 0
+
+    def get(self) -> np.ndarray:
+        """Get the current power spectrum.
+
+        Note:
+            The returned view is updated in place by the following updates.
+
+        Returns:
+            np.ndarray: The centered power spectrum as float32.
+        """
+        return self._power.view()
+
+    def reset(self) -> None:
+        """Reset the average and discard the pending samples."""
+        self._pending = 0
+        self._power.fill(0)
+        self._sum.fill(0)
+        self._weight = 0.0
+        self._frames = 0
+
+    def update(self, samples: np.ndarray) -> bool:
+        """Process a block of IQ samples.
+
+        Args:
+            samples (np.ndarray): The new complex samples.
+
+        Returns:
+            bool: True if the spectrum was updated, False if more samples are needed.
+        """
+        # Continue the stream with the samples left over from the last block
+        total = self._pending + len(samples)
+        if total > self._stream.size:
+            # Less than one frame is pending, so blocks of this size fit from now on
+            stream = np.zeros(len(samples) + self._fft_size, dtype=np.complex64)
+            stream[: self._pending] = self._stream[: self._pending]
+            self._stream = stream
+        stream = self._stream[:total]
+        stream[self._pending :] = samples
+        count = 0
+        if total >= self._fft_size:
+            count = (total - self._fft_size) // self._hop + 1
+        if count == 0:
+            self._pending = total
+            return False
+
+        # Window all frames at once
+        if self._windowed.shape[0] < count:
+            # At most this many frames start in a block of this size
+            rows = max(count, (len(samples) - 1) // self._hop + 1)
+            self._windowed = np.zeros((rows, self._fft_size), dtype=np.complex64)
+            self._frame_power = np.zeros((rows, self._fft_size), dtype=np.float32)
+        windowed = self._windowed[:count]
+        power = self._frame_power[:count]
+        frames = sliding_window_view(stream, self._fft_size)[:: self._hop][:count]
+        np.multiply(frames, self._modulated, out=windowed)
+
+        # Keep the samples which do not fill a frame for the next block
+        self._pending = total - count * self._hop
+        stream[: self._pending] = stream[count * self._hop :]
+
+        # Transform the frames and compute the power from the squared real and imaginary parts
+        if FFT_OUT:
+            spectra = np.fft.fft(windowed, axis=1, out=windowed)
+        else:
+            spectra = np.fft.fft(windowed, axis=1)
+        parts = spectra.view(spectra.real.dtype)
+        np.square(parts, out=parts)
+        np.add(parts[:, 0::2], parts[:, 1::2], out=power)
+        if self._shift:
+            power = np.fft.fftshift(power, axes=1)
+        self._average(power)
+        return True
+
+    def _average(self, power: np.ndarray) -> None:
+        """Average the power spectra of new frames.
+
+        Args:
+            power (np.ndarray): The power spectra with one frame per row.
+        """
+        count = power.shape[0]
+        if self.averaging == "none":
+            self._power[:] = power[-1]
+            self._frames = 1
+
+        elif self.averaging == "exponential":
+            # Apply the recursion avg += alpha * (power - avg) for all frames at once
+            alpha = 1 / self.averages
+            # The float32 weights keep the product in float32 without a float64 copy of the frames
+            decay = ((1 - alpha) ** np.arange(count - 1, -1, -1)).astype(np.float32)
+            self._sum *= (1 - alpha) ** count
+            self._sum += alpha * (decay @ power)
+
+            # Correct the bias of the average towards the initial zeros
+            self._weight = self._weight * (1 - alpha) ** count + 1 - (1 - alpha) ** count
+            self._frames = min(self._frames + count, self.averages)
+            self._power[:] = self._sum / self._weight
+
+        else:
+            # Restart the linear average after the requested number of frames
+            start = 0
+            while start < count:
+                if self._frames == self.averages:
+                    self._sum.fill(0)
+                    self._frames = 0
+                stop = start + self.averages - self._frames
+                self._sum += power[start:stop].sum(axis=0)
+                self._frames += power[start:stop].shape[0]
+                start = stop
+            self._power[:] = self._sum / self._frames
@@ -35,12 +35,17 @@ Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
 ---
 """
 # === Imports ===
-from threading import Thread, Event
+import time
+import numpy as np
 import ttkbootstrap as ttk
 from plutostudio import __version__
 from plutostudio.core.device import Pluto
 from plutostudio.core.buffer import CircularBuffer as Buffer
+from plutostudio.core.buffer import RingBuffer
+from plutostudio.core.metrics import Telemetry
+from plutostudio.core.pipeline import Pipeline
 from .layout import DefaultLayout
+from .scheduler import RenderScheduler
 from .viewer import DefaultViewer
 
 
@@ -54,21 +59,25 @@ class PlutoApp(ttk.Window):
         ttk (Window): The ttk.Window to use as parent.
     """
 
-    def __init__(self):
+    def __init__(self, fps: float = 30.0, show_stats: bool = False):
         """Initialize the main application window.
 
         This function initializes the main application window and
         is intended to run the main application loop.
+
+        Args:
+            fps (float, optional): The target frame rate of the viewer. Defaults to 30.0.
+            show_stats (bool, optional): Show the panel with the performance metrics.
+                Defaults to False.
         """
         # Initialize the main window
         super().__init__(themename="darkly")
         self.title(f"Pluto Studio - v{__version__}")
         self.geometry("1920x1080")
         self.resizable(False, False)
-        self._stop_event = Event()
 
         # Add the layout
-        self.layout = DefaultLayout(self, padding=10)
+        self.layout = DefaultLayout(self, show_stats=show_stats, padding=10)
         self.layout.register_start_callback(self.start_acquisition)
         self.layout.register_stop_callback(self.stop_acquisition)
 
@@ -79,35 +88,103 @@ class PlutoApp(ttk.Window):
         self.device = Pluto()
 
         # Add data buffer
-        self.buffer = Buffer(1024)
-
-        # Add the acquisition thread
-        self.acquisition_thread = None
+        self.buffer = Buffer(1024, dtype=np.complex64)
+
+        # Add the buffer between the acquisition pipeline and the viewer
+        self.acquisition_buffer = RingBuffer(2**20, dtype=np.complex64)
+
+        # Add the acquisition pipeline, blocks are dropped when the viewer falls behind
+        self.pipeline = Pipeline(self.device)
+        self._viewer_sink = self.pipeline.add_sink(
+            self.acquisition_buffer.put, name="viewer", policy="drop-newest"
+        )
+        self.player = None
+
+        # Render the viewer from the main loop, independent of the acquisition
+        self.render_scheduler = RenderScheduler(self, self.update_view, fps)
+
+        # Collect the performance metrics of the acquisition and the viewer
+        self.telemetry = Telemetry()
+        self.pipeline.register(self.telemetry)
+        self._draw_time = self.telemetry.histogram("viewer.draw")
+        self._latency = self.telemetry.histogram("viewer.latency")
+        self.telemetry.add(
+            "viewer.fill", lambda: self.acquisition_buffer.size / self.acquisition_buffer.capacity
+        )
+        self.telemetry.add("viewer.dropped", lambda: self.acquisition_buffer.dropped)
+        self.telemetry.add("viewer.skipped", lambda: self.render_scheduler.skipped)
+        if show_stats:
+            self.update_stats()
 
     def destroy(self) -> None:
         """Destroy the main application window."""
+        # Stop the acquisition pipeline and the rendering
+        self.stop_acquisition()
+
         # Disconnect the device
         if self.device.is_connected():
             self.device.disconnect()
 
-        # Stop the acquisition thread
-        self.stop_acquisition()
-
         # Give the thread time to stop and destroy the window
         return super().after(100, super().destroy)
 
+    def add_audio(self, receiver, player) -> None:
+        """Demodulate the acquired samples to an audio player.
+
+        The demodulation runs in its own sink of the pipeline, so redrawing
+        the viewer on the Tk thread does not delay the audio.
+
+        Args:
+            receiver (Receiver): The receiver which demodulates the samples.
+            player (AudioPlayer): The player of the audio.
+        """
+        self.player = player
+        self.pipeline.add_sink(lambda block: player.put(receiver.process(block)), name="audio")
+        player.register(self.telemetry)
+
     def start_acquisition(self):
         """Start the data acquisition."""
-        self._stop_event.clear()
-        Thread(target=self.acquisition_loop).start()
+        if self.player is not None:
+            self.player.start()
+        self.pipeline.start()
+        self.render_scheduler.start()
 
     def stop_acquisition(self):
         """Stop the data acquisition."""
-        self._stop_event.set()
-
-    def acquisition_loop(self):
-        """The acquisition loop."""
-        while not self._stop_event.is_set():
-            # self.buffer.clear()
-            self.buffer.put(self.device.acquire())
-            self.viewer.draw(self.buffer.get())
+        self.pipeline.stop()
+        self.render_scheduler.stop()
+        if self.player is not None:
+            self.player.stop()
+
+    def update_view(self):
+        """Move the acquired data to the display buffer and draw it.
+
+        Called from the Tk main loop by the render scheduler.
+        """
+        start = time.perf_counter()
+        self.buffer.put(self.acquisition_buffer.read_available())
+        self.viewer.set_rates(self.render_scheduler.frame_rate, self.pipeline.rate.rate)
+        self.viewer.draw(self.buffer.get())
+        end = time.perf_counter()
+        self._draw_time.record(end - start)
+
+        # The newest sample on screen was acquired with the last block of the viewer sink
+        acquired = self._viewer_sink.last_timestamp
+        if acquired is not None:
+            self._latency.record(end - acquired)
+
+    def update_stats(self):
+        """Show the performance metrics in the stats panel once per second."""
+        self.layout.set_stats(self.telemetry.snapshot())
+        self.after(1000, self.update_stats)
+
+    def export_metrics(self, path) -> str:
+        """Export the performance metrics as JSON.
+
+        Args:
+            path (str | Path): The file to write the metrics to.
+
+        Returns:
+            str: The JSON document.
+        """
+        return self.telemetry.to_json(path)
@@ -87,11 +87,13 @@ class DefaultLayout(Layout):
         parent (object): The tkinter object to use as parent.
     """
 
-    def __init__(self, parent, **kwargs):
+    def __init__(self, parent, show_stats: bool = False, **kwargs):
         """Initialize the DefaultLayout.
 
         Args:
             parent (object): The parent tkinter object.
+            show_stats (bool, optional): Show the panel with the performance metrics.
+                Defaults to False.
 
         ---
         """
@@ -139,6 +141,36 @@ class DefaultLayout(Layout):
         # Position the viewer
         self.view_frame.grid(row=2, column=3, sticky="nsew")
 
+        # Add the optional panel with the performance metrics
+        self.stats = None
+        if show_stats:
+            self.stats = ttk.Label(self.content, font="TkFixedFont", justify="left", anchor="nw")
+            self.stats.grid(row=2, column=0, columnspan=2, sticky="nsew")
+
+    def set_stats(self, snapshot: dict) -> None:
+        """Show the performance metrics in the stats panel.
+
+        Histograms are shown with their median, 99th percentile and maximum
+        in milliseconds, counters with their rate.
+
+        Args:
+            snapshot (dict): The metrics as returned by `Telemetry.snapshot()`.
+
+        ---
+        """
+        if self.stats is None:
+            return
+        lines = []
+        for name, value in snapshot.items():
+            if isinstance(value, dict) and "p50" in value:
+                p50, p99, peak = (value[key] * 1e3 for key in ("p50", "p99", "max"))
+                lines.append(f"{name}\n  {p50:.2f} / {p99:.2f} / {peak:.2f} ms")
+            elif isinstance(value, dict):
+                lines.append(f"{name}\n  {value['rate']:.3g} /s")
+            else:
+                lines.append(f"{name}\n  {value:g}")
+        self.stats["text"] = "\n".join(lines)
+
     def _on_button_run(self):
         """Action when Run button is pressed."""
         # Disable the run button and enable the stop button
@@ -0,0 +1,154 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Schedule the rendering of the viewers.
+
+## Description
+The scheduler draws the viewers from the Tk main loop with a fixed target
+frame rate. The rendering runs independent of the data acquisition, so a
+slow viewer does not slow down the acquisition and Tk is only ever called
+from the main thread.
+
+### Details
+- *File:*     `scheduler.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import time
+from plutostudio.core.metrics import RateCounter
+
+# === Classes ===
+
+
+class RenderScheduler:
+    """Call a render function periodically from the Tk main loop.
+
+    The render function is scheduled with `after()` on a fixed grid of frame
+    deadlines. When rendering a frame takes longer than one frame period, the
+    missed deadlines are skipped instead of being rendered late, so the
+    scheduler never queues up a backlog of frames.
+    """
+
+    @property
+    def fps(self) -> float:
+        """Get the target frame rate.
+
+        Returns:
+            float: The target frame rate in frames per second.
+        """
+        return self._fps
+
+    @fps.setter
+    def fps(self, value: float) -> None:
+        """Set the target frame rate.
+
+        Args:
+            value (float): The target frame rate in frames per second.
+
+        Raises:
+            ValueError: The frame rate is not positive.
+        """
+        if value <= 0:
+            raise ValueError("The frame rate has to be positive.")
+        self._fps = value
+
+    @property
+    def frame_rate(self) -> float:
+        """Get the measured frame rate.
+
+        Returns:
+            float: The rendered frames per second.
+        """
+        return self._frames.rate
+
+    @property
+    def skipped(self) -> int:
+        """Get the number of skipped frames.
+
+        Returns:
+            int: The number of frames skipped since the start.
+        """
+        return self._skipped
+
+    def is_running(self) -> bool:
+        """Check if the scheduler is running.
+
+        Returns:
+            bool: True if the rendering is scheduled, False otherwise.
+        """
+        return self._job is not None
+
+    def __init__(self, widget, callback, fps: float = 30.0) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            widget (object): The tkinter widget which provides the `after()` timer.
+            callback (function): The render function to call for every frame.
+            fps (float, optional): The target frame rate. Defaults to 30.0.
+
+        ---
+        """
+        self.fps = fps
+        self._widget = widget
+        self._callback = callback
+        self._frames = RateCounter()
+        self._skipped: int = 0
+        self._deadline: float = 0.0
+        self._job = None
+
+    def start(self) -> None:
+        """Start rendering."""
+        if self.is_running():
+            return
+        self._frames.reset()
+        self._skipped = 0
+        self._deadline = time.perf_counter()
+        self._job = self._widget.after(0, self._on_timer)
+
+    def stop(self) -> None:
+        """Stop rendering."""
+        if self._job is not None:
+            self._widget.after_cancel(self._job)
+            self._job = None
+
+    def _on_timer(self) -> None:
+        """Render one frame and schedule the next one."""
+        # Render the frame
+        self._callback()
+        self._frames.add()
+
+        # Skip the deadlines which already passed while rendering
+        period = 1 / self._fps
+        self._deadline += period
+        now = time.perf_counter()
+        if now > self._deadline:
+            missed = int((now - self._deadline) / period) + 1
+            self._skipped += missed
+            self._deadline += missed * period
+
+        # Schedule the next frame
+        delay = round((self._deadline - now) * 1000)
+        self._job = self._widget.after(max(delay, 1), self._on_timer)
@@ -35,45 +35,199 @@ Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
 ---
 """
 # === Imports ===
-import time
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from functools import lru_cache
+import numpy as np
+from matplotlib import colormaps
+from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
+
+# === Constants ===
+DPI = 100
+HEADLESS_SIZE = (12.8, 7.2)
+STYLE = "dark_background"
+
+
+# === Functions ===
+@lru_cache(maxsize=1)
+def _use_style() -> None:
+    """Apply the matplotlib style of the viewers once."""
+    import matplotlib.style # pylint: disable=import-outside-toplevel
+    matplotlib.style.use(STYLE)
+
+
+@lru_cache(maxsize=8)
+def _positions(size: int, columns: int) -> np.ndarray:
+    """Get the x-coordinates of the decimated data.
+
+    The coordinates only depend on the data size and the number of columns,
+    so they are computed once and reused for every frame.
+
+    Args:
+        size (int): The number of samples.
+        columns (int): The number of pixel columns.
+
+    Returns:
+        np.ndarray: The read-only x-coordinates as sample index.
+    """
+    if size < 2 * columns:
+        positions = np.arange(size)
+    else:
+        step = size // columns
+        centers = np.arange(columns) * step + step / 2
+        positions = np.concatenate((centers, centers[::-1]))
+    positions.flags.writeable = False
+    return positions
+
+
+def decimate_minmax(data: np.ndarray, columns: int) -> tuple:
+    """Reduce the data to its minimum and maximum per pixel column.
+
+    The samples are split into `columns` groups of equal length. The maxima
+    of the groups are returned from left to right, followed by the minima
+    from right to left. Drawn as a line, this is the outline of the envelope
+    of the data with two points per column. Unlike interleaved minima and
+    maxima, the outline does not overlap itself, which is much faster to
+    stroke for the Agg renderer. Samples which do not fill a complete group
+    are added to the last group. Data with less than two samples per column
+    is returned unchanged.
+
+    Args:
+        data (np.ndarray): The real valued samples to reduce.
+        columns (int): The number of pixel columns to reduce the data to.
+
+    Returns:
+        tuple: The x-coordinates as sample index and the reduced data.
+    """
+    if data.size < 2 * columns:
+        return _positions(data.size, columns), data
+
+    # Reduce the complete groups at once
+    step = data.size // columns
+    groups = data[: step * columns].reshape(columns, step)
+    envelope = np.empty(2 * columns, dtype=data.dtype)
+    upper = envelope[:columns]
+    lower = envelope[columns:][::-1]
+    np.max(groups, axis=1, out=upper)
+    np.min(groups, axis=1, out=lower)
+
+    # Fold the remaining samples into the last group
+    if data.size > step * columns:
+        upper[-1] = max(upper[-1], data[step * columns :].max())
+        lower[-1] = min(lower[-1], data[step * columns :].min())
+
+    # Both points of a group are placed in the center of the group
+    return _positions(data.size, columns), envelope
+
+
+@lru_cache(maxsize=8)
+def _nearest(size: int, pixels: int) -> np.ndarray:
+    """Get the nearest data index of each pixel when scaling data to a number of pixels.
+
+    Args:
+        size (int): The number of data points.
+        pixels (int): The number of pixels.
+
+    Returns:
+        np.ndarray: The read-only data index of each pixel.
+    """
+    indices = np.arange(pixels) * size // pixels
+    indices.flags.writeable = False
+    return indices
+
 
 # === Classes ===
 
 
 class Viewer:
-    """Base class for all viewers."""
+    """Base class for all viewers.
+
+    The viewer only redraws the complete figure when the axes change. For
+    all other frames the cached background is restored and only the animated
+    artists are drawn on top of it.
+
+    With the `"auto"` scaling the limits of the y-axis follow the data with a
+    hysteresis: the limits are only changed when the data leaves the current
+    limits or uses less than half of their range. The new limits add a margin
+    around the data, so small changes of the data do not cause a redraw. With
+    the `"fixed"` scaling the limits are only changed by `set_limits()`.
+
+    The figure and its artists exist from the start, but the Tk canvas is
+    only created on the first `<Configure>` event of the parent, when the
+    real size of the widget is known. Until then, drawing only updates the
+    artists. Without a parent, the viewer renders off-screen to an Agg
+    canvas of `HEADLESS_SIZE` inches. This needs no display, e.g. for tests
+    and benchmarks. The backends are imported when the canvas is created.
+    """
+
+    SCALING = ("auto", "fixed")
 
-    def __init__(self, parent):
+    def __init__(self, parent, scaling: str = "auto", margin: float = 0.1):
         """Initialize the viewer.
 
         Args:
-            parent (object): The parent object to use for the viewer.
+            parent (object): The parent object to use for the viewer, None to render off-screen.
+            scaling (str, optional): The scaling of the y-axis, one of `SCALING`.
+                Defaults to "auto".
+            margin (float, optional): The margin around the data relative to its range.
+                Defaults to 0.1.
+
+        Raises:
+            ValueError: The scaling is not known.
 
         ---
         """
-        # Use dark style from matplotlib
-        plt.style.use("dark_background")
-
-        # Initialize the figure with the size of the parent
-        _figure = plt.Figure(
-            figsize=(parent.winfo_width(), parent.winfo_height()),
-            dpi=100,
-            layout="tight",
-        )
+        if scaling not in self.SCALING:
+            raise ValueError(f"Unknown scaling '{scaling}', use one of {self.SCALING}.")
+        self.scaling: str = scaling
+        self.margin: float = margin
 
-        # Initialize the viewer frame
-        self.canvas = FigureCanvasTkAgg(_figure, master=parent)
-        self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
+        # Use dark style from matplotlib, the artists take it when they are created
+        _use_style()
 
-        # Add axes to the figure
-        self.axes = self.canvas.figure.add_subplot(111)
+        # Initialize the figure and the axes, the size is set with the canvas
+        self.figure = Figure(figsize=HEADLESS_SIZE, dpi=DPI, layout="tight")
+        self.axes = self.figure.add_subplot(111)
 
         # Initialize data for blitting
         self._background = None
         self._artists = []
 
+        # Create the canvas once the parent has its real size
+        self.canvas = None
+        if parent is None:
+            self._create_canvas(None)
+        else:
+            parent.bind("<Configure>", lambda event: self._create_canvas(parent, event), add="+")
+
+    def is_ready(self) -> bool:
+        """Check whether the canvas exists and the viewer renders.
+
+        Returns:
+            bool: True when the canvas was created.
+        """
+        return self.canvas is not None
+
+    def _create_canvas(self, parent, event=None) -> None:
+        """Create the canvas with the size of the parent.
+
+        Args:
+            parent (object): The parent object, None to render off-screen.
+            event (tk.Event, optional): The `<Configure>` event with the size of the parent.
+                Defaults to None.
+        """
+        # pylint: disable=import-outside-toplevel
+        if self.canvas is not None or (event is not None and min(event.width, event.height) <= 1):
+            return
+        if parent is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            self.canvas = FigureCanvasAgg(self.figure)
+        else:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            self.figure.set_size_inches(event.width / DPI, event.height / DPI)
+            self.canvas = FigureCanvasTkAgg(self.figure, master=parent)
+            self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+
     def add_artist(self, art):
         """
         Add an artist to be managed.
@@ -85,36 +239,75 @@ class Viewer:
             the canvas this class is managing.
 
         """
-        if art.figure != self.canvas.figure:
+        if art.figure != self.figure:
             raise RuntimeError
         art.set_animated(True)
         self._artists.append(art)
 
+    def set_limits(self, xlim: tuple | None = None, ylim: tuple | None = None) -> None:
+        """Set the limits of the axes and redraw the figure.
+
+        Args:
+            xlim (tuple | None, optional): The new limits of the x-axis. Defaults to None.
+            ylim (tuple | None, optional): The new limits of the y-axis. Defaults to None.
+
+        ---
+        """
+        if xlim is not None:
+            self.axes.set_xlim(*xlim)
+        if ylim is not None:
+            self.axes.set_ylim(*ylim)
+        self._background = None
+
     def on_draw(self, event):
         """Callback to register with 'draw_event'."""
         if event is not None:
-            if event.canvas != self:
+            if event.canvas != self.canvas:
                 raise RuntimeError
-        # Scale axes to fit the data
-        self.axes.relim()
-        self.axes.autoscale_view()
-
         # Save the background
-        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
         self._draw_animated()
 
+    def _scale(self, xlim: tuple, low: float, high: float) -> None:
+        """Adapt the limits of the axes to the data.
+
+        The full redraw is only requested when the limits change.
+
+        Args:
+            xlim (tuple): The required limits of the x-axis.
+            low (float): The minimum of the data.
+            high (float): The maximum of the data.
+        """
+        if self.scaling == "fixed":
+            return
+
+        # Follow the x-axis exactly
+        if self.axes.get_xlim() != xlim:
+            self.set_limits(xlim=xlim)
+
+        # Only rescale the y-axis when the data leaves the limits or is too small
+        bottom, top = self.axes.get_ylim()
+        span = max(high - low, np.finfo(np.float32).eps)
+        if low < bottom or high > top or 2 * span < top - bottom:
+            self.set_limits(ylim=(low - self.margin * span, high + self.margin * span))
+
     def _draw_animated(self):
         """Draw all of the animated artists."""
-        fig = self.canvas.figure
+        fig = self.figure
         for artist in self._artists:
             fig.draw_artist(artist)
 
     def _update(self):
         """Update the screen with animated artists."""
-        fig = self.canvas.figure
-        # paranoia in case we missed the draw event,
+        # the artists are shown once the canvas exists
+        if self.canvas is None:
+            return
+        fig = self.figure
+        # redraw the figure when the axes changed or the draw event was missed
         if self._background is None:
-            self.on_draw(None)
+            self.canvas.draw()
+            if self._background is None:
+                self.on_draw(None)
         else:
             # restore the background
             self.canvas.restore_region(self._background)
@@ -129,43 +322,214 @@ class Viewer:
 class DefaultViewer(Viewer):
     """Default viewer for the GUI."""
 
-    def __init__(self, parent):
+    def __init__(self, parent, scaling: str = "auto"):
         """Initialize the default viewer.
 
         Args:
             parent (object): The parent object to use for the viewer.
+            scaling (str, optional): The scaling of the y-axis. Defaults to "auto".
 
         ---
         """
-        super().__init__(parent)
-        self.last_update = time.perf_counter()
-        (self.trace,) = self.axes.plot([0, 1000], [0, 1], "o", c="y")
+        super().__init__(parent, scaling)
+        self._rates = (0.0, 0.0)
+        (self.trace,) = self.axes.plot([0, 1000], [0, 1], "-", c="y", linewidth=1)
+        (self.trace_q,) = self.axes.plot([0, 1000], [0, 1], "-", c="c", linewidth=1)
         self.fps_counter = self.axes.text(
             0,
             1.0,
-            "FPS: 0.00",
+            "FPS: 0.00 | 0.00 MS/s",
             fontsize=20,
             fontweight="bold",
         )
         self.add_artist(self.trace)
+        self.add_artist(self.trace_q)
         self.add_artist(self.fps_counter)
 
     def draw(self, data):
         """Update the viewer.
 
+        The data is reduced to its envelope per pixel column, so the time to
+        draw the traces only depends on the width of the canvas.
+
         Args:
-            data (list): The data to display.
+            data (np.ndarray): The data to display. For complex data
+                the I and Q components are shown as separate traces.
 
         ---
         """
         # Update the data
-        self.trace.set_data(range(len(data)), data)
+        columns = max(int(self.axes.bbox.width), 1)
+        positions, real = decimate_minmax(data.real, columns)
+        _, imag = decimate_minmax(np.imag(data), columns)
+        self.trace.set_data(positions, real)
+        self.trace_q.set_data(positions, imag)
+
+        # Adapt the axes to the data
+        if data.size:
+            low = min(real.min(), imag.min())
+            high = max(real.max(), imag.max())
+            self._scale((0, data.size), float(low), float(high))
 
-        # Update the FPS counter
-        now = time.perf_counter()
-        fps = 1 / (now - self.last_update)
-        self.fps_counter.set_text(f"FPS: {fps:.2f}")
-        self.last_update = now
+        # Update the viewer
+        super()._update()
+
+    def set_rates(self, frame_rate: float, sample_rate: float) -> None:
+        """Update the displayed render and acquisition rates.
+
+        The rates are shown with the next call of `draw()`.
+
+        Args:
+            frame_rate (float): The render rate in frames per second.
+            sample_rate (float): The acquisition rate in samples per second.
+
+        ---
+        """
+        # The rates only change once per measurement interval
+        if (frame_rate, sample_rate) == self._rates:
+            return
+        self._rates = (frame_rate, sample_rate)
+        self.fps_counter.set_text(f"FPS: {frame_rate:.2f} | {sample_rate / 1e6:.2f} MS/s")
+
+
+class _PixelImage(AxesImage):
+    """Image of RGBA bytes which is scaled to the screen by a nearest neighbor lookup.
+
+    Matplotlib resamples every image in floating point, which costs most of
+    the frame time for large images. Bytes need no interpolation with the
+    nearest neighbor, so the screen pixels are looked up as 32 bit words
+    with cached indices. The drawing is clipped to the axes by the renderer.
+    """
+
+    def make_image(self, renderer, magnification=1.0, unsampled=False):
+        """Scale the image to the screen pixels.
+
+        Args:
+            renderer (RendererBase): The renderer, unused.
+            magnification (float, optional): The scaling of the image. Defaults to 1.0.
+            unsampled (bool, optional): Unused, the image is always scaled. Defaults to False.
+
+        Returns:
+            tuple: The RGBA bytes and the position of the lower left corner on the screen.
+        """
+        # The first data column is at x1, the first data row at y2 like with the upper origin
+        x1, x2, y1, y2 = self.get_extent()
+        corners = self.get_transform().transform([(x1, y1), (x2, y2)]) * magnification
+        (left, bottom), (right, top) = corners
+        x0, y0 = round(min(left, right)), round(min(bottom, top))
+        width = round(max(left, right)) - x0
+        height = round(max(bottom, top)) - y0
+        if width < 1 or height < 1:
+            return None, 0, 0, None
+
+        # The first row of the screen image is at the bottom, flip the data according to the axes
+        data = self.get_array()
+        rows = _nearest(data.shape[0], height)
+        columns = _nearest(data.shape[1], width)
+        if top > bottom:
+            rows = rows[::-1]
+        if right < left:
+            columns = columns[::-1]
+        words = data.view(np.uint32).reshape(data.shape[:2])
+        pixels = np.take(words[rows], columns, axis=1)
+        return pixels.view(np.uint8).reshape(height, width, 4), x0, y0, None
+
+
+class WaterfallViewer(Viewer):
+    """Waterfall viewer which shows the spectra over time.
+
+    Every spectrum is one row of the image and the newest row is shown on top.
+    The rows are kept in a preallocated circular buffer which is mirrored like
+    the `CircularBuffer`, so the rows in chronological order are always one
+    contiguous view. The image artist is only created once and the new rows
+    are passed to the existing artist.
+
+    The spectra are colored once when they are added: the power is quantized
+    to 8 bit and looked up in a table of `LEVELS` RGBA colors. The image then
+    holds RGBA bytes, so matplotlib neither normalizes nor colors the whole
+    image for every frame, and the bytes are scaled to the screen by a
+    lookup instead of a floating point resampling.
+    """
+
+    LEVELS = 256
+
+    def __init__(
+        self,
+        parent,
+        bins: int = 1024,
+        rows: int = 512,
+        limits: tuple = (-120.0, 0.0),
+        cmap: str = "viridis",
+    ):
+        """Initialize the waterfall viewer.
+
+        Args:
+            parent (object): The parent object to use for the viewer.
+            bins (int, optional): The number of frequency bins per spectrum. Defaults to 1024.
+            rows (int, optional): The number of spectra shown in the image. Defaults to 512.
+            limits (tuple, optional): The power range of the colormap in dB.
+                Defaults to (-120.0, 0.0).
+            cmap (str, optional): The name of the colormap. Defaults to "viridis".
+
+        ---
+        """
+        super().__init__(parent, scaling="fixed")
+        self.limits: tuple = limits
+
+        # The colors of the quantized power levels
+        self._colors = colormaps[cmap](np.linspace(0, 1, self.LEVELS), bytes=True)
+
+        # Allocate the mirrored rows, initialized with the color of the lower power limit
+        self._rows = np.empty((2 * rows, bins, 4), dtype=np.uint8)
+        self._rows[:] = self._colors[0]
+        self._count: int = rows
+        self._index: int = 0
+
+        # Create the image once, the data is updated in place
+        self.image = _PixelImage(self.axes, interpolation="nearest", extent=(0, bins, rows, 0))
+        self.image.set_data(self._rows[:rows])
+        self.axes.add_image(self.image)
+        self.axes.set_xlim(0, bins)
+        self.axes.set_ylim(rows, 0)
+        self.axes.set_ylabel("Spectrum")
+        self.add_artist(self.image)
+
+    def set_frequency_range(self, start: float, stop: float) -> None:
+        """Set the frequency range shown on the x-axis.
+
+        Args:
+            start (float): The frequency of the first bin.
+            stop (float): The frequency of the last bin.
+
+        ---
+        """
+        self.image.set_extent((start, stop, self._count, 0))
+        self.set_limits(xlim=(start, stop))
+
+    def draw(self, data):
+        """Add new spectra to the waterfall and update the viewer.
+
+        Args:
+            data (np.ndarray): One spectrum in dB or several spectra with one
+                spectrum per row, the oldest first.
+
+        ---
+        """
+        # Color the new rows by quantizing the power to the levels of the colormap
+        low, high = self.limits
+        spectra = np.atleast_2d(data)[-self._count :]
+        levels = (spectra - low) * ((self.LEVELS - 1) / (high - low))
+        levels = np.clip(levels, 0, self.LEVELS - 1, out=levels).astype(np.uint8)
+        colors = self._colors[levels]
+
+        # Insert the new rows above the newest row
+        for color in colors:
+            self._index = (self._index - 1) % self._count
+            self._rows[self._index] = color
+            self._rows[self._index + self._count] = color
+
+        # Show the rows starting with the newest one
+        self.image.set_data(self._rows[self._index : self._index + self._count])
 
         # Update the viewer
         super()._update()
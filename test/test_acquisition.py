@@ -0,0 +1,301 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Test the acquisition module.
+
+## Description
+Contains the test group to test the concurrent acquisition of several devices.
+
+### Details
+- *File:*     `test_acquisition.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import time
+import pytest
+import numpy as np
+
+# Import the Unit Under Test
+import plutostudio.core.acquisition as UUT
+from plutostudio.core.device import RandomGenerator, SignalGenerator, FileReplayDevice
+
+# === Fixtures ===
+
+
+class Clock:
+    """Clock which is advanced manually."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def feed(stream, start, blocks, size, jitter=0.0):
+    """Feed blocks of sample times to a stream as if they were acquired in realtime."""
+    rng = np.random.default_rng(0)
+    for block in range(blocks):
+        first = start + block * size
+        data = (np.arange(first, first + size) / stream.sample_rate).astype(np.complex64)
+        stream.put(data, (first + size) / stream.sample_rate + jitter * rng.random())
+
+
+# === Tests ===
+
+
+class Test_DeviceStream():
+    """Test group to test the stream of one device."""
+    def test_put(self):
+        """Test that the blocks are tagged with the sample counter and time."""
+        # Arrange
+        stream = UUT.DeviceStream(RandomGenerator(), 1000.0, capacity=100)
+
+        # Act
+        first = stream.put(np.ones(10), 1.01)
+        second = stream.put(np.ones(20), 1.03)
+
+        # Assert
+        assert first == UUT.BlockTag(0, pytest.approx(1.0), 10)
+        assert second == UUT.BlockTag(10, pytest.approx(1.01), 20)
+        assert stream.samples == 30
+        assert stream.rate.total == 30
+
+    def test_read(self):
+        """Test reading samples by their index."""
+        # Arrange
+        stream = UUT.DeviceStream(RandomGenerator(), 1000.0, capacity=100)
+        for block in range(5):
+            stream.put(np.arange(block * 30, (block + 1) * 30), 0.0)
+
+        # Act
+        data = stream.read(60, 40)
+
+        # Assert
+        assert stream.oldest == 50
+        np.testing.assert_array_equal(data, np.arange(60, 100))
+
+    @pytest.mark.parametrize("sample, count", [(40, 10), (140, 20), (-1, 2)])
+    def test_read_out_of_history(self, sample, count):
+        """Test that samples outside of the history cannot be read."""
+        # Arrange
+        stream = UUT.DeviceStream(RandomGenerator(), 1000.0, capacity=100)
+        stream.put(np.arange(150), 0.0)
+
+        # Act
+        # Assert
+        with pytest.raises(IndexError):
+            stream.read(sample, count)
+
+    def test_read_channels(self):
+        """Test reading the history of several channels."""
+        # Arrange
+        stream = UUT.DeviceStream(RandomGenerator(), 1000.0, capacity=100)
+        stream.put(np.stack([np.arange(10), -np.arange(10)]), 0.0)
+
+        # Act
+        data = stream.read(2, 3)
+
+        # Assert
+        np.testing.assert_array_equal(data, [[2, 3, 4], [-2, -3, -4]])
+
+    def test_timing(self):
+        """Test converting between sample indices and time."""
+        # Arrange
+        stream = UUT.DeviceStream(RandomGenerator(), 1000.0)
+        feed(stream, 0, 10, 100)
+
+        # Act
+        sample = stream.sample_at(0.4505)
+        timestamp = stream.time_of(250)
+
+        # Assert
+        assert sample in (450, 451)
+        assert timestamp == pytest.approx(0.25)
+
+    def test_timing_no_data(self):
+        """Test that no time base exists before the first block."""
+        # Arrange
+        stream = UUT.DeviceStream(RandomGenerator(), 1000.0)
+
+        # Act
+        # Assert
+        with pytest.raises(IndexError):
+            stream.sample_at(0.0)
+
+    def test_clear(self):
+        """Test clearing the history."""
+        # Arrange
+        stream = UUT.DeviceStream(RandomGenerator(), 1000.0)
+        stream.put(np.ones(10), 1.0)
+
+        # Act
+        stream.clear()
+
+        # Assert
+        assert stream.samples == 0
+        with pytest.raises(IndexError):
+            stream.read(0, 1)
+
+
+class Test_AcquisitionManager():
+    """Test group to test the acquisition of several devices."""
+    def test_add_device(self):
+        """Test adding devices with and without a known sample rate."""
+        # Arrange
+        manager = UUT.AcquisitionManager(capacity=1000)
+
+        # Act
+        stream = manager.add_device(SignalGenerator(sample_rate=2e6))
+
+        # Assert
+        assert manager.streams == (stream,)
+        assert stream.sample_rate == 2e6
+        assert stream.capacity == 1000
+        with pytest.raises(ValueError):
+            manager.add_device(RandomGenerator())
+
+    def test_window(self):
+        """Test that the windows of devices with different rates are aligned in time."""
+        # Arrange
+        manager = UUT.AcquisitionManager()
+        slow = manager.add_device(RandomGenerator(), 1000.0)
+        fast = manager.add_device(RandomGenerator(), 4000.0)
+        feed(slow, 0, 20, 100, jitter=1e-4)
+        feed(fast, 0, 20, 1000, jitter=1e-4)
+
+        # Act
+        first, second = manager.window(8, timestamp=0.5)
+
+        # Assert
+        assert first.real[0] == pytest.approx(0.5, abs=2e-3)
+        assert second.real[0] == pytest.approx(0.5, abs=2e-3)
+        assert np.diff(second.real) == pytest.approx(np.full(7, 1 / 4000), abs=1e-6)
+
+    def test_latest_window(self):
+        """Test that the newest window is limited by the slowest device."""
+        # Arrange
+        manager = UUT.AcquisitionManager()
+        ahead = manager.add_device(RandomGenerator(), 1000.0)
+        behind = manager.add_device(RandomGenerator(), 1000.0)
+        feed(ahead, 0, 10, 100)
+        feed(behind, 0, 6, 100)
+
+        # Act
+        first, second = manager.window(100)
+
+        # Assert
+        assert manager.latest() == pytest.approx(0.6)
+        np.testing.assert_allclose(first.real, second.real)
+        assert second.real[-1] == pytest.approx(0.599)
+
+    def test_latest_window_late_block(self):
+        """Test that the newest window ends at the newest sample when a block is tagged late."""
+        # Arrange
+        manager = UUT.AcquisitionManager()
+        stream = manager.add_device(RandomGenerator(), 1000.0)
+        for block, timestamp in enumerate((0.1, 0.2, 0.305)):
+            stream.put(np.arange(block * 100, (block + 1) * 100).astype(np.complex64), timestamp)
+
+        # Act
+        (window,) = manager.window(150)
+
+        # Assert
+        np.testing.assert_array_equal(window.real, np.arange(150, 300))
+
+    def test_latest_window_jitter(self):
+        """Test the newest window of devices with jittered block timestamps."""
+        # Arrange
+        manager = UUT.AcquisitionManager()
+        first = manager.add_device(RandomGenerator(), 1000.0)
+        second = manager.add_device(RandomGenerator(), 1000.0)
+        feed(first, 0, 10, 100, jitter=0.02)
+        feed(second, 0, 10, 100, jitter=0.02)
+
+        # Act
+        windows = [manager.window(count) for count in (50, 100, 150, 250, 400)]
+
+        # Assert
+        for count, (ahead, behind) in zip((50, 100, 150, 250, 400), windows):
+            assert ahead.size == behind.size == count
+            assert max(ahead.real[-1], behind.real[-1]) == pytest.approx(0.999)
+
+    def test_window_out_of_history(self):
+        """Test that a window before the history cannot be read."""
+        # Arrange
+        manager = UUT.AcquisitionManager(capacity=200)
+        stream = manager.add_device(RandomGenerator(), 1000.0)
+        feed(stream, 0, 10, 100)
+
+        # Act
+        # Assert
+        with pytest.raises(IndexError):
+            manager.window(100, timestamp=0.1)
+
+    def test_concurrent_acquisition(self):
+        """Test acquiring several devices on their own threads."""
+        # Arrange
+        clock = Clock()
+        manager = UUT.AcquisitionManager(capacity=2**14, clock=clock)
+        streams = [
+            manager.add_device(SignalGenerator(block_size=256, sample_rate=1e6)) for _ in range(3)
+        ]
+
+        # Act
+        manager.start()
+        end = time.monotonic() + 2.0
+        while min(stream.samples for stream in streams) < 4096 and time.monotonic() < end:
+            time.sleep(0.001)
+        running = manager.is_running()
+        manager.stop()
+
+        # Assert
+        assert running is True
+        assert manager.is_running() is False
+        assert all(stream.samples >= 4096 for stream in streams)
+        assert all(not stream.device.is_connected() for stream in streams)
+        with pytest.raises(RuntimeError):
+            manager.start()
+            manager.add_device(SignalGenerator())
+        manager.stop()
+
+    def test_end_of_data(self, tmp_path):
+        """Test that the thread of a device stops at the end of a recording."""
+        # Arrange
+        path = tmp_path / "capture.sigmf-data"
+        np.arange(1000).astype(np.complex64).tofile(path)
+        manager = UUT.AcquisitionManager()
+        replay = FileReplayDevice(path, block_size=100, realtime=False, loop=False)
+        stream = manager.add_device(replay, 1000.0)
+
+        # Act
+        manager.start()
+        manager._threads[0].join(2.0)
+
+        # Assert
+        assert manager.is_running() is False
+        assert stream.samples == 1000
+        manager.stop()
@@ -0,0 +1,191 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Test the audio module.
+
+## Description
+Contains the test group to test the audio module.
+
+### Details
+- *File:*     `test_audio.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import time
+import wave
+import pytest
+import numpy as np
+
+# Import the Unit Under Test
+import plutostudio.core.audio as UUT
+from plutostudio.core.demodulator import Receiver
+from plutostudio.core.device import SignalGenerator
+from plutostudio.core.metrics import Telemetry
+from plutostudio.core.pipeline import Pipeline
+
+# === Constants ===
+RATE = 8000
+
+# === Functions ===
+
+
+def _read_wav(path) -> np.ndarray:
+    """Read the samples of a mono 16 bit WAV file."""
+    with wave.open(str(path), "rb") as file:
+        assert file.getframerate() == RATE
+        return np.frombuffer(file.readframes(file.getnframes()), dtype="<i2") / 32767
+
+# === Tests ===
+
+
+class Test_WavOutput():
+    """Test group to test the WAV file output."""
+    def test_write(self, tmp_path):
+        """Test writing and clipping samples."""
+        # Arrange
+        uut = UUT.WavOutput(tmp_path / "audio.wav", RATE)
+
+        # Act
+        uut.open()
+        uut.write(np.array([0.0, 0.5, -2.0], dtype=np.float32))
+        uut.write(np.array([2.0], dtype=np.float32))
+        uut.close()
+
+        # Assert
+        assert uut.frames == 4
+        assert np.allclose(_read_wav(tmp_path / "audio.wav"), [0.0, 0.5, -1.0, 1.0], atol=1e-4)
+
+
+class Test_AudioPlayer():
+    """Test group to test the audio player."""
+    def test_gapless(self, tmp_path):
+        """Test that a steady producer plays without gaps and within the latency."""
+        # Arrange
+        audio = np.sin(2 * np.pi * 440 * np.arange(RATE // 2) / RATE).astype(np.float32) * 0.5
+        output = UUT.WavOutput(tmp_path / "audio.wav", RATE)
+        uut = UUT.AudioPlayer(output, period=0.01, max_latency=0.1)
+        latency = []
+
+        # Act
+        uut.start()
+        for start in range(0, audio.size, 40):
+            while uut.latency > 0.05:
+                time.sleep(0.002)
+            assert uut.put(audio[start : start + 40])
+            latency.append(uut.latency)
+        uut.stop()
+
+        # Assert
+        assert not uut.is_playing()
+        assert uut.underruns == 0
+        assert uut.overruns == 0
+        assert max(latency) < 0.1
+        played = _read_wav(tmp_path / "audio.wav")
+        assert np.allclose(played[: audio.size], audio, atol=1e-4)
+        assert np.all(played[audio.size :] == 0)
+
+    def test_receiver_sink(self, tmp_path):
+        """Test that a source faster than real time is paced by a blocking player without gaps."""
+        # Arrange
+        generator = SignalGenerator(block_size=4096, sample_rate=1e6)
+        generator.add_tone(101e3)
+        receiver = Receiver("fm", 1e6, offset=100e3, audio_rate=RATE)
+        output = UUT.WavOutput(tmp_path / "audio.wav", receiver.audio_rate)
+        uut = UUT.AudioPlayer(output, period=0.01, max_latency=0.06, block=True)
+        pipeline = Pipeline(generator)
+        produced = []
+        pipeline.add_sink(
+            lambda block: (produced.append(audio := receiver.process(block)), uut.put(audio)),
+            name="audio",
+            max_blocks=2,
+        )
+
+        # Act
+        uut.start()
+        pipeline.start()
+        time.sleep(0.5)
+        pipeline.stop(drain=True)
+        uut.stop()
+
+        # Assert
+        audio = np.concatenate(produced)
+        assert uut.underruns == 0
+        assert uut.overruns == 0
+        assert pipeline.rate.total < 1e6
+        with wave.open(str(tmp_path / "audio.wav"), "rb") as file:
+            played = np.frombuffer(file.readframes(file.getnframes()), dtype="<i2") / 32767
+        assert np.allclose(played[: audio.size], np.clip(audio, -1, 1), atol=1e-4)
+        assert np.allclose(played[100 : audio.size], 1e3 / 5e3, atol=0.01)
+
+    def test_underrun(self, tmp_path):
+        """Test that missing audio is replaced by silence."""
+        # Arrange
+        output = UUT.WavOutput(tmp_path / "audio.wav", RATE)
+        uut = UUT.AudioPlayer(output, period=0.01, prefill=0.0)
+
+        # Act
+        uut.start()
+        time.sleep(0.1)
+        uut.stop()
+
+        # Assert
+        assert uut.underruns > 0
+        assert output.frames == uut.underruns * 80
+        assert np.all(_read_wav(tmp_path / "audio.wav") == 0)
+
+    def test_overrun(self, tmp_path):
+        """Test that blocks beyond the maximum latency are dropped."""
+        # Arrange
+        uut = UUT.AudioPlayer(UUT.WavOutput(tmp_path / "audio.wav", RATE), max_latency=0.1)
+
+        # Act
+        accepted = [uut.put(np.zeros(400, dtype=np.float32)) for _ in range(3)]
+
+        # Assert
+        assert accepted == [True, True, False]
+        assert uut.overruns == 1
+        assert uut.latency == pytest.approx(0.1)
+
+    def test_invalid_latency(self, tmp_path):
+        """Test that the buffer has to hold the prefill and one period."""
+        with pytest.raises(ValueError):
+            UUT.AudioPlayer(
+                UUT.WavOutput(tmp_path / "audio.wav", RATE), period=0.05, max_latency=0.1
+            )
+
+    def test_register(self, tmp_path):
+        """Test the registration of the metrics."""
+        # Arrange
+        telemetry = Telemetry()
+        uut = UUT.AudioPlayer(UUT.WavOutput(tmp_path / "audio.wav", RATE))
+
+        # Act
+        uut.register(telemetry)
+
+        # Assert
+        assert set(telemetry.names) == {
+            "audio.write", "audio.latency", "audio.underruns", "audio.overruns"
+        }
@@ -34,6 +34,8 @@ Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
 ---
 """
 # === Imports ===
+import threading
+import time
 import pytest
 import numpy as np
 
@@ -166,6 +168,20 @@ class Test_FixedBuffer():
             assert buffer.size == 10
             assert buffer.get()[9] == 9
 
+    def test_put_overflow_keeps_fitting_part(self):
+        """Test that the fitting part of an overflowing block is stored."""
+        # Arrange
+        buffer = UUT.FixedBuffer(10)
+        buffer.put(np.arange(4))
+
+        # Act
+        with pytest.raises(IndexError):
+            buffer.put(np.arange(4, 20))
+
+        # Assert
+        assert buffer.size == 10
+        assert (buffer.get() == np.arange(10)).all()
+
     def test_put_list_and_clear(self):
         """Test putting data in the fixed buffer."""
         # Arrange
@@ -262,4 +278,207 @@ class Test_CircularBuffer():
         # Assert
         assert buffer.size == 10
         assert buffer.get()[0] == 10
-        assert buffer.get()[9] == 19
\ No newline at end of file
+        assert buffer.get()[9] == 19
+
+    def test_put_wraparound(self):
+        """Test a block which wraps around the end of the circular buffer."""
+        # Arrange
+        buffer = UUT.CircularBuffer(10)
+        buffer.put(np.arange(8))
+
+        # Act
+        buffer.put(np.arange(8, 12))
+
+        # Assert
+        assert buffer.size == 10
+        assert (buffer.get() == np.arange(2, 12)).all()
+
+    def test_put_block_larger_than_capacity(self):
+        """Test that only the newest samples of a large block are kept."""
+        # Arrange
+        buffer = UUT.CircularBuffer(10)
+        buffer.put(np.arange(3))
+
+        # Act
+        buffer.put(np.arange(100, 125))
+
+        # Assert
+        assert buffer.size == 10
+        assert (buffer.get() == np.arange(115, 125)).all()
+        buffer.put(125)
+        assert (buffer.get() == np.arange(116, 126)).all()
+
+    def test_get_chronological_view(self):
+        """Test that get returns a view of the data without copying it."""
+        # Arrange
+        buffer = UUT.CircularBuffer(10)
+        buffer.put(np.arange(7))
+
+        # Act
+        buffer.put(np.arange(7, 14))
+        view = buffer.get()
+
+        # Assert
+        assert view.size == 10
+        assert np.shares_memory(view, buffer._data)
+        assert (view == np.arange(4, 14)).all()
+
+    def test_get_before_full(self):
+        """Test that the unused samples follow the data when not full yet."""
+        # Arrange
+        buffer = UUT.CircularBuffer(10)
+
+        # Act
+        buffer.put([1, 2, 3])
+
+        # Assert
+        assert (buffer.get()[:3] == [1, 2, 3]).all()
+        assert (buffer.get()[3:] == 0).all()
+
+
+class Test_BufferTypes():
+    """Test group to test the buffers with different sample types."""
+    @pytest.mark.parametrize("dtype", [np.complex64, np.float32, UUT.IQ_INT16])
+    def test_init_dtype(self, dtype):
+        """Test that the data is allocated with the requested type."""
+        # Arrange
+        # Act
+        buffer = UUT.CircularBuffer(10, dtype=dtype)
+
+        # Assert
+        assert buffer.dtype == dtype
+        assert buffer.get().dtype == dtype
+        assert buffer.get().size == 10
+
+    def test_put_complex(self):
+        """Test that complex data keeps its Q component."""
+        # Arrange
+        buffer = UUT.FixedBuffer(10, dtype=np.complex64)
+
+        # Act
+        buffer.put(np.array([1 + 2j, 3 - 4j]))
+
+        # Assert
+        assert buffer.get()[0] == 1 + 2j
+        assert buffer.get()[1] == 3 - 4j
+
+    def test_put_iq_int16(self):
+        """Test that complex data is stored interleaved as IQ_INT16."""
+        # Arrange
+        buffer = UUT.CircularBuffer(4, dtype=UUT.IQ_INT16)
+
+        # Act
+        buffer.put(np.array([1 + 2j, -3 - 4j, 5 + 6j]))
+
+        # Assert
+        assert buffer.size == 3
+        assert (buffer.get()[:3].view(np.int16) == [1, 2, -3, -4, 5, 6]).all()
+        assert (UUT.to_complex(buffer.get()[:3]) == [1 + 2j, -3 - 4j, 5 + 6j]).all()
+
+    def test_memory_per_sample(self):
+        """Test the memory used per complex sample."""
+        # Arrange
+        # Act
+        buffer_c64 = UUT.FixedBuffer(10, dtype=np.complex64)
+        buffer_iq = UUT.FixedBuffer(10, dtype=UUT.IQ_INT16)
+
+        # Assert
+        assert buffer_c64.get().nbytes == 80
+        assert buffer_iq.get().nbytes == 40
+
+
+class Test_RingBuffer():
+    """Test group to test the single-producer/single-consumer ring buffer."""
+    def test_default_init(self):
+        """Test the default initialization of the ring buffer."""
+        # Arrange
+        # Act
+        buffer = UUT.RingBuffer()
+
+        # Assert
+        assert buffer.size == 0
+        assert buffer.capacity == 1000
+        assert buffer.overruns == 0
+        assert buffer.dropped == 0
+        assert buffer.read_available().size == 0
+
+    def test_put_and_read(self):
+        """Test reading the available data in chronological order."""
+        # Arrange
+        buffer = UUT.RingBuffer(10)
+
+        # Act
+        buffer.put(np.arange(4))
+        buffer.put(np.arange(4, 7))
+
+        # Assert
+        assert buffer.size == 7
+        assert (buffer.read_available() == np.arange(7)).all()
+        assert buffer.size == 0
+
+    def test_read_wraparound(self):
+        """Test reading data which wraps around the end of the buffer."""
+        # Arrange
+        buffer = UUT.RingBuffer(10)
+        buffer.put(np.arange(8))
+        buffer.read_available()
+
+        # Act
+        buffer.put(np.arange(8, 14))
+
+        # Assert
+        assert (buffer.read_available(4) == np.arange(8, 12)).all()
+        assert (buffer.read_available() == np.arange(12, 14)).all()
+
+    def test_overrun(self):
+        """Test that a block which does not fit is dropped and counted."""
+        # Arrange
+        buffer = UUT.RingBuffer(10)
+        buffer.put(np.arange(8))
+
+        # Act
+        stored = buffer.put(np.arange(8, 11))
+
+        # Assert
+        assert stored is False
+        assert buffer.overruns == 1
+        assert buffer.dropped == 3
+        assert (buffer.read_available() == np.arange(8)).all()
+
+    def test_clear(self):
+        """Test that clear discards the unread data."""
+        # Arrange
+        buffer = UUT.RingBuffer(10)
+        buffer.put(np.arange(8))
+
+        # Act
+        buffer.clear()
+
+        # Assert
+        assert buffer.size == 0
+        assert buffer.put(np.arange(10)) is True
+
+    def test_threaded_transfer(self):
+        """Test that a consumer thread only ever sees complete blocks."""
+        # Arrange
+        buffer = UUT.RingBuffer(64, dtype=np.int64)
+        blocks = 500
+        received = []
+
+        def producer():
+            for index in range(blocks):
+                while not buffer.put(np.full(16, index)):
+                    time.sleep(0)
+
+        # Act
+        thread = threading.Thread(target=producer)
+        thread.start()
+        while thread.is_alive() or buffer.size:
+            received.append(buffer.read_available())
+            time.sleep(0)
+        thread.join()
+        data = np.concatenate(received)
+
+        # Assert
+        assert data.size == 16 * blocks
+        assert (data == np.repeat(np.arange(blocks), 16)).all()
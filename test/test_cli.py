@@ -0,0 +1,208 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Test the cli module.
+
+## Description
+Contains the test group to test the headless acquisition.
+
+### Details
+- *File:*     `test_cli.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import json
+import subprocess
+import sys
+import wave
+import pytest
+import numpy as np
+
+# Import the Unit Under Test
+import plutostudio.cli as UUT
+
+# === Tests ===
+
+
+class Test_Startup():
+    """Test group to test the startup of the headless acquisition."""
+    def test_no_gui_imports(self):
+        """Test that importing the entry point loads neither the GUI nor the drivers."""
+        # Arrange
+        script = (
+            "import sys, plutostudio.cli; "
+            "print([name for name in ('matplotlib', 'ttkbootstrap', 'tkinter', 'adi', 'iio') "
+            "if name in sys.modules])"
+        )
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+
+        # Assert
+        assert result.stdout.strip() == "[]"
+
+    def test_import_budget(self):
+        """Test that importing the entry point takes a fraction of the startup budget."""
+        # Arrange
+        script = (
+            "import time; start = time.perf_counter(); import plutostudio.cli; "
+            "print(time.perf_counter() - start)"
+        )
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+
+        # Assert
+        assert float(result.stdout) < UUT.STARTUP_BUDGET / 2
+
+
+class Test_Run():
+    """Test group to test the headless acquisition."""
+    def test_record(self, tmp_path):
+        """Test recording a number of samples from the signal generator."""
+        # Arrange
+        base = tmp_path / "capture"
+        metrics = tmp_path / "metrics.json"
+
+        # Act
+        code = UUT.main(
+            ["--device", "signal", "--block-size", "1024", "--samples", "10000",
+             "--spectrum", "256", "--record", str(base), "--metrics", str(metrics)]
+        )
+
+        # Assert
+        assert code == 0
+        assert (tmp_path / "capture_0000.sigmf-data").stat().st_size >= 10000 * 8
+        document = json.loads(metrics.read_text())["metrics"]
+        assert document["pipeline.samples"]["total"] >= 10000
+        assert 0 < document["cli.startup"]
+
+    def test_channels(self, tmp_path, capsys):
+        """Test monitoring the power of down-converted channels."""
+        # Arrange
+        metrics = tmp_path / "metrics.json"
+
+        # Act
+        code = UUT.main(
+            ["--device", "signal", "--block-size", "4096", "--duration", "0.5", "--interval", "0.1",
+             "--channel", "5e5", "--channel=-1e6", "--decimation", "8", "--metrics", str(metrics)]
+        )
+
+        # Assert
+        assert code == 0
+        assert "channels" in capsys.readouterr().err
+        document = json.loads(metrics.read_text())["metrics"]
+        assert document["pipeline.ddc.samples"]["total"] > 0
+
+    def test_audio(self, tmp_path):
+        """Test demodulating a channel to a WAV file."""
+        # Arrange
+        audio = tmp_path / "audio.wav"
+        metrics = tmp_path / "metrics.json"
+
+        # Act
+        code = UUT.main(
+            ["--device", "signal", "--block-size", "4096", "--duration", "0.5", "--channel", "5e5",
+             "--demod", "am", "--audio", str(audio), "--metrics", str(metrics)]
+        )
+
+        # Assert
+        assert code == 0
+        with wave.open(str(audio), "rb") as file:
+            assert file.getframerate() == 50000
+            assert file.getnframes() > 0
+        document = json.loads(metrics.read_text())["metrics"]
+        assert document["audio.latency"] <= 0.1
+
+    def test_audio_with_spectrum(self, tmp_path):
+        """Test that the spectrum does not decouple the paced audio from the source."""
+        # Arrange
+        audio = tmp_path / "audio.wav"
+        metrics = tmp_path / "metrics.json"
+
+        # Act
+        code = UUT.main(
+            ["--device", "signal", "--sample-rate", "1e6", "--block-size", "4096",
+             "--duration", "0.5", "--channel", "125000", "--demod", "fm", "--spectrum", "1024",
+             "--audio", str(audio), "--metrics", str(metrics)]
+        )
+
+        # Assert
+        assert code == 0
+        with wave.open(str(audio), "rb") as file:
+            played = file.getnframes() / file.getframerate() * 1e6
+        document = json.loads(metrics.read_text())["metrics"]
+        assert document["pipeline.audio.dropped"] == 0
+        assert played == pytest.approx(document["pipeline.samples"]["total"], abs=0.05e6)
+
+    def test_record_error(self, tmp_path):
+        """Test that a failing recorder ends the run with an error."""
+        # Arrange
+        (tmp_path / "capture_0000.sigmf-data").mkdir()
+
+        # Act
+        code = UUT.main(
+            ["--device", "signal", "--duration", "5", "--record", str(tmp_path / "capture")]
+        )
+
+        # Assert
+        assert code == 1
+
+    def test_audio_without_output(self):
+        """Test that the demodulator needs an audio output."""
+        assert UUT.main(["--device", "signal", "--demod", "fm"]) == 1
+
+    def test_stream_file(self, tmp_path, capfdbinary):
+        """Test streaming a complete recording to stdout."""
+        # Arrange
+        path = tmp_path / "capture.sigmf-data"
+        samples = (np.arange(5000) * (1 + 1j)).astype(np.complex64)
+        samples.tofile(path)
+
+        # Act
+        code = UUT.main(
+            ["--device", "file", "--file", str(path), "--no-realtime", "--block-size", "1000",
+             "--stream", "-"]
+        )
+        output = capfdbinary.readouterr()
+
+        # Assert
+        assert code == 0
+        np.testing.assert_array_equal(np.frombuffer(output.out, dtype=np.complex64), samples)
+        assert b"Acquired 5000 samples." in output.err
+
+    def test_missing_file(self):
+        """Test that the file device needs a recording."""
+        # Arrange
+        # Act
+        code = UUT.main(["--device", "file"])
+
+        # Assert
+        assert code == 1
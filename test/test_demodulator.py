@@ -0,0 +1,180 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Test the demodulator module.
+
+## Description
+Contains the test group to test the demodulator module.
+
+### Details
+- *File:*     `test_demodulator.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import pytest
+import numpy as np
+
+# Import the Unit Under Test
+import plutostudio.core.demodulator as UUT
+
+# === Constants ===
+RATE = 48e3
+TIME = np.arange(9600) / RATE
+
+# === Tests ===
+
+
+class Test_FmDemodulator():
+    """Test group to test the FM demodulator."""
+    def test_tone(self):
+        """Test the demodulation of a tone."""
+        # Arrange
+        phase = 5e3 / 1e3 * np.sin(2 * np.pi * 1e3 * TIME)
+        samples = np.exp(1j * phase).astype(np.complex64)
+        uut = UUT.FmDemodulator(RATE, deviation=5e3)
+
+        # Act
+        audio = uut.process(samples)
+
+        # Assert
+        assert audio.dtype == np.float32
+        assert audio[0] == 0.0
+        expected = np.cos(2 * np.pi * 1e3 * (TIME - 0.5 / RATE))
+        assert np.allclose(audio[1:], expected[1:], atol=0.01)
+
+    def test_block_continuity(self):
+        """Test that blocks of any size give the same output as one block."""
+        # Arrange
+        samples = np.exp(2j * np.pi * 3e3 * TIME).astype(np.complex64)
+        reference = UUT.FmDemodulator(RATE, decimation=3).process(samples)
+        uut = UUT.FmDemodulator(RATE, decimation=3)
+
+        # Act
+        starts = range(0, samples.size, 700)
+        blocks = [uut.process(samples[start : start + 700]) for start in starts]
+        audio = np.concatenate(blocks)
+
+        # Assert
+        assert audio.size == reference.size == samples.size // 3
+        assert np.allclose(audio, reference, atol=1e-6)
+        assert np.allclose(audio[100:], 3e3 / 5e3, atol=1e-3)
+
+
+class Test_AmDemodulator():
+    """Test group to test the AM demodulator."""
+    def test_tone(self):
+        """Test that the audio is the modulation depth independent of the level."""
+        # Arrange
+        modulation = 0.5 * np.cos(2 * np.pi * 1e3 * TIME)
+        samples = (0.1 * (1 + modulation) * np.exp(0.3j)).astype(np.complex64)
+        uut = UUT.AmDemodulator(RATE, window=0.05)
+
+        # Act
+        audio = uut.process(samples[:5000])
+        audio = np.concatenate((audio, uut.process(samples[5000:])))
+
+        # Assert
+        assert np.allclose(audio[2400:], modulation[2400:], atol=1e-4)
+
+    def test_decimation(self):
+        """Test the decimation to the audio rate."""
+        # Arrange
+        uut = UUT.AmDemodulator(4 * RATE, decimation=4)
+
+        # Act
+        audio = uut.process(np.ones(4000, dtype=np.complex64))
+
+        # Assert
+        assert uut.audio_rate == RATE
+        assert audio.size == 1000
+        assert np.allclose(audio, 0.0, atol=1e-5)
+
+
+class Test_SsbDemodulator():
+    """Test group to test the SSB demodulator."""
+    @pytest.mark.parametrize("sideband, level", [("usb", 1.0), ("lsb", 0.0)])
+    def test_sideband(self, sideband, level):
+        """Test that only the selected sideband is demodulated."""
+        # Arrange
+        samples = np.exp(2j * np.pi * 1e3 * TIME).astype(np.complex64)
+        uut = UUT.SsbDemodulator(RATE, sideband, taps=255)
+
+        # Act
+        audio = uut.process(samples)
+
+        # Assert
+        amplitude = np.sqrt(2 * np.mean(audio[1000:] ** 2))
+        assert amplitude == pytest.approx(level, abs=0.02)
+
+    def test_invalid(self):
+        """Test that the sideband and bandwidth are checked."""
+        with pytest.raises(ValueError):
+            UUT.SsbDemodulator(RATE, "dsb")
+        with pytest.raises(ValueError):
+            UUT.SsbDemodulator(RATE, bandwidth=RATE)
+
+
+class Test_CreateDemodulator():
+    """Test group to test the creation of the demodulators."""
+    @pytest.mark.parametrize("mode, expected", [
+        ("fm", UUT.FmDemodulator),
+        ("am", UUT.AmDemodulator),
+        ("usb", UUT.SsbDemodulator),
+        ("lsb", UUT.SsbDemodulator),
+    ])
+    def test_modes(self, mode, expected):
+        """Test the demodulator of each mode."""
+        # Act
+        uut = UUT.create_demodulator(mode, RATE, decimation=2)
+
+        # Assert
+        assert isinstance(uut, expected)
+        assert uut.decimation == 2
+
+    def test_unknown_mode(self):
+        """Test that unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            UUT.create_demodulator("cw", RATE)
+
+
+class Test_Receiver():
+    """Test group to test the receiver of one channel."""
+    def test_fm_channel(self):
+        """Test the demodulation of an FM channel beside the center."""
+        # Arrange
+        rate = 1e6
+        time = np.arange(2**16) / rate
+        phase = 5e3 / 1e3 * np.sin(2 * np.pi * 1e3 * time) + 2 * np.pi * 150e3 * time
+        uut = UUT.Receiver("fm", rate, offset=150e3, audio_rate=48e3)
+
+        # Act
+        audio = uut.process(np.exp(1j * phase).astype(np.complex64))
+
+        # Assert
+        assert uut.audio_rate == pytest.approx(50e3)
+        assert audio.size == time.size // 20
+        amplitude = np.sqrt(2 * np.mean(audio[200:] ** 2))
+        assert amplitude == pytest.approx(1.0, abs=0.02)
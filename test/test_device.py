@@ -34,10 +34,15 @@ Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
 ---
 """
 # === Imports ===
+import time
+from threading import Event
 import pytest
+import numpy as np
 
 # Import the module to test
 import plutostudio.core.device as UUT
+from plutostudio.core.buffer import IQ_INT16
+from plutostudio.core.recorder import Recorder
 
 # === Fixtures ===
 @pytest.fixture
@@ -46,6 +51,14 @@ def PlutoMock(mocker):
     yield mocker.patch("adi.Pluto")
 
 
+@pytest.fixture
+def recording(tmp_path):
+    """Create a recording with 100 complex samples."""
+    path = tmp_path / "capture.sigmf-data"
+    (np.arange(100) * (1 + 1j)).astype(np.complex64).tofile(path)
+    yield path
+
+
 # === Tests ===
 
 
@@ -95,6 +108,274 @@ class Test_DeviceBase:
         # Act
         assert device.acquire() == 0
 
+
+class Test_RandomGenerator():
+    """Test group to test the RandomGenerator class."""
+
+    def test_acquire(self):
+        """The generator should return complex IQ data."""
+        # Arrange
+        device = UUT.RandomGenerator()
+
+        # Act
+        data = device.acquire()
+
+        # Assert
+        assert data.dtype == np.complex64
+        assert data.size == 1024
+        assert (data.imag != 0).any()
+
+    def test_connect(self):
+        """The generator can be connected without hardware."""
+        # Arrange
+        device = UUT.RandomGenerator()
+
+        # Act
+        device.connect()
+        connected = device.is_connected()
+        device.disconnect()
+
+        # Assert
+        assert connected is True
+        assert device.is_connected() is False
+
+
+class Test_SignalGenerator():
+    """Test group to test the SignalGenerator class."""
+
+    def test_device_init(self):
+        """Test the initial state of a device."""
+        # Arrange
+        # Act
+        device = UUT.SignalGenerator(block_size=256)
+
+        # Assert
+        assert device.name == "SignalGenerator"
+        assert device.is_connected() is False
+        assert device.acquire().size == 256
+        assert (device.acquire() == 0).all()
+
+    def test_connect(self):
+        """Test connecting and disconnecting the generator."""
+        # Arrange
+        device = UUT.SignalGenerator()
+
+        # Act
+        device.connect()
+        connected = device.is_connected()
+        device.disconnect()
+
+        # Assert
+        assert connected is True
+        assert device.is_connected() is False
+
+    def test_reuse_output(self):
+        """Test that every block is written to the same memory."""
+        # Arrange
+        device = UUT.SignalGenerator()
+        device.add_tone(1e3)
+
+        # Act
+        first = device.acquire()
+        second = device.acquire()
+
+        # Assert
+        assert first is second
+        assert first.dtype == np.complex64
+
+    def test_tone_phase_continuous(self):
+        """Test that the tone continues across the blocks."""
+        # Arrange
+        device = UUT.SignalGenerator(block_size=1000, sample_rate=1e6)
+        device.add_tone(1234.0, amplitude=0.5, phase=1.0)
+
+        # Act
+        data = np.concatenate([device.acquire().copy() for _ in range(5)])
+
+        # Assert
+        expected = 0.5 * np.exp(1j * (2 * np.pi * 1234.0 / 1e6 * np.arange(5000) + 1.0))
+        assert np.abs(data - expected).max() < 1e-5
+
+    def test_chirp_phase_continuous(self):
+        """Test that the chirp sweeps the frequency without phase jumps."""
+        # Arrange
+        device = UUT.SignalGenerator(block_size=300, sample_rate=1e6)
+        device.add_chirp(0.0, 1e5, period=1e-3)
+
+        # Act
+        data = np.concatenate([device.acquire().copy() for _ in range(10)])
+        step = np.angle(data[1:] / data[:-1]) * 1e6 / (2 * np.pi)
+
+        # Assert
+        assert np.abs(np.abs(data) - 1).max() < 1e-5
+        assert step[499] == pytest.approx(50e3, rel=1e-3)
+        assert step.max() < 1e5
+        assert step[999] == pytest.approx(0.0, abs=1.0)
+
+    def test_burst(self):
+        """Test the timing and the symbols of the bursts."""
+        # Arrange
+        device = UUT.SignalGenerator(block_size=700, sample_rate=1e6, seed=1)
+        device.add_burst(0.0, symbol_rate=1e5, duration=2e-4, period=1e-3, modulation="bpsk")
+
+        # Act
+        data = np.concatenate([device.acquire().copy() for _ in range(3)])
+
+        # Assert
+        assert np.abs(data[:200]) == pytest.approx(np.ones(200))
+        assert (data[200:1000] == 0).all()
+        assert np.abs(data[1000:1200]) == pytest.approx(np.ones(200))
+        assert (data[1200:2000] == 0).all()
+        symbols = data[1000:1200].real.reshape(20, 10)
+        assert (symbols == symbols[:, :1]).all()
+
+    def test_invalid_modulation(self):
+        """Test the exception for an unknown modulation."""
+        # Arrange
+        device = UUT.SignalGenerator()
+
+        # Act
+        with pytest.raises(ValueError):
+            device.add_burst(0.0, 1e3, 1e-3, 1e-2, modulation="fsk")
+
+    def test_noise_snr(self):
+        """Test the power of the noise for a given SNR."""
+        # Arrange
+        device = UUT.SignalGenerator(block_size=2**16, seed=0)
+        device.add_tone(1e3, amplitude=2.0)
+        device.set_noise(snr=10)
+
+        # Act
+        data = device.acquire()
+
+        # Assert
+        assert device.signal_power == 4.0
+        assert np.mean(np.abs(data) ** 2) == pytest.approx(4.4, rel=0.02)
+
+    def test_seed_deterministic(self):
+        """Test that the same seed creates the same signal."""
+        # Arrange
+        devices = [UUT.SignalGenerator(seed=42), UUT.SignalGenerator(seed=42)]
+        for device in devices:
+            device.add_burst(1e4, 1e4, 1e-3, 2e-3)
+            device.set_noise(power=1.0)
+
+        # Act
+        data = [device.acquire().copy() for device in devices]
+
+        # Assert
+        assert (data[0] == data[1]).all()
+
+
+class Test_FileReplayDevice():
+    """Test group to test the FileReplayDevice class."""
+
+    def test_device_init(self, recording):
+        """Test the initial state of a device."""
+        # Arrange
+        # Act
+        device = UUT.FileReplayDevice(recording)
+
+        # Assert
+        assert device.name == "capture.sigmf-data"
+        assert device.is_connected() is False
+        assert device.dtype == np.complex64
+        assert device.length == 0
+
+    def test_connect_missing_file(self, tmp_path):
+        """Test the exception when the recording does not exist."""
+        # Arrange
+        device = UUT.FileReplayDevice(tmp_path / "missing.sigmf-data")
+
+        # Act
+        with pytest.raises(IOError):
+            device.connect()
+
+    def test_acquire(self, recording):
+        """Test that the blocks are views of the mapped file."""
+        # Arrange
+        device = UUT.FileReplayDevice(recording, block_size=30, realtime=False)
+        device.connect()
+
+        # Act
+        first = device.acquire()
+        second = device.acquire()
+
+        # Assert
+        assert device.length == 100
+        assert (first == np.arange(30) * (1 + 1j)).all()
+        assert (second == np.arange(30, 60) * (1 + 1j)).all()
+        assert np.shares_memory(first, device._device)
+
+    def test_loop(self, recording):
+        """Test that the replay restarts at the end of the recording."""
+        # Arrange
+        device = UUT.FileReplayDevice(recording, block_size=40, realtime=False)
+        device.connect()
+
+        # Act
+        sizes = [device.acquire().size for _ in range(4)]
+
+        # Assert
+        assert sizes == [40, 40, 20, 40]
+        assert device.position == 40
+
+    def test_end_without_loop(self, recording):
+        """Test the exception at the end of the recording without looping."""
+        # Arrange
+        device = UUT.FileReplayDevice(recording, block_size=100, realtime=False, loop=False)
+        device.connect()
+        device.acquire()
+
+        # Act
+        with pytest.raises(EOFError):
+            device.acquire()
+
+    def test_seek(self, recording):
+        """Test continuing the replay at another sample."""
+        # Arrange
+        device = UUT.FileReplayDevice(recording, block_size=10, realtime=False)
+        device.connect()
+
+        # Act
+        device.seek(75)
+
+        # Assert
+        assert device.acquire()[0] == 75 * (1 + 1j)
+
+    def test_realtime(self, recording):
+        """Test that the replay is paced to the sample rate."""
+        # Arrange
+        device = UUT.FileReplayDevice(recording, block_size=50, sample_rate=1000.0)
+        device.connect()
+
+        # Act
+        start = time.perf_counter()
+        device.acquire()
+        device.acquire()
+
+        # Assert
+        assert time.perf_counter() - start >= 0.09
+
+    def test_metadata(self, tmp_path):
+        """Test that the settings are read from the SigMF metadata."""
+        # Arrange
+        recorder = Recorder(tmp_path / "capture", 2e6, dtype=IQ_INT16)
+        recorder.start()
+        recorder.put(np.array([1 + 2j, 3 + 4j]))
+        recorder.stop()
+
+        # Act
+        device = UUT.FileReplayDevice(recorder.segments[0], realtime=False)
+        device.connect()
+
+        # Assert
+        assert device.sample_rate == 2e6
+        assert device.dtype == IQ_INT16
+        assert (device.acquire() == [1 + 2j, 3 + 4j]).all()
+        assert device.acquire().dtype == np.complex64
+
+
 class Test_PlutoDevice():
     """Test group to test the PlutoDevice class."""
 
@@ -121,3 +402,221 @@ class Test_PlutoDevice():
         # Assert
         assert PlutoMock.call_count == 1
         assert device.is_connected() is True
+
+    def test_device_connect_uri(self, PlutoMock):
+        """Test connecting to a specific device."""
+        # Arrange
+        device = UUT.Pluto(uri="usb:1.2.5")
+
+        # Act
+        device.connect()
+
+        # Assert
+        PlutoMock.assert_called_once_with("usb:1.2.5")
+        assert device.name == "PlutoSDR (usb:1.2.5)"
+
+    def test_connect_applies_config(self, PlutoMock):
+        """Test that the configuration is written to the device when connecting."""
+        # Arrange
+        config = UUT.PlutoConfig(
+            lo=433_920_000, buffer_size=2**18, kernel_buffers=16, gain_mode="manual", gain=20.0
+        )
+        device = UUT.Pluto(config)
+
+        # Act
+        device.connect()
+
+        # Assert
+        sdr = PlutoMock.return_value
+        assert sdr.rx_lo == 433_920_000
+        assert sdr.rx_buffer_size == 2**18
+        assert sdr.rx_enabled_channels == [0]
+        assert sdr.rx_hardwaregain_chan0 == 20.0
+        sdr._rxadc.set_kernel_buffers_count.assert_called_once_with(16)
+
+    def test_configure_while_connected(self, PlutoMock):
+        """Test that frontend changes do not recreate the receive buffer."""
+        # Arrange
+        device = UUT.Pluto()
+        device.connect()
+        sdr = PlutoMock.return_value
+
+        # Act
+        device.configure(lo=2_400_000_000)
+
+        # Assert
+        assert sdr.rx_lo == 2_400_000_000
+        assert device.config.lo == 2_400_000_000
+        assert sdr.rx_destroy_buffer.call_count == 1
+
+    def test_configure_buffer_size(self, PlutoMock):
+        """Test that a new buffer size recreates the receive buffer."""
+        # Arrange
+        device = UUT.Pluto()
+        device.connect()
+        sdr = PlutoMock.return_value
+
+        # Act
+        device.configure(buffer_size=2**20)
+
+        # Assert
+        assert sdr.rx_buffer_size == 2**20
+        assert sdr.rx_destroy_buffer.call_count == 2
+
+    def test_configure_disconnected(self, PlutoMock):
+        """Test that the configuration is stored until the next connect."""
+        # Arrange
+        device = UUT.Pluto()
+
+        # Act
+        device.configure(sample_rate=10_000_000)
+
+        # Assert
+        assert device.config.sample_rate == 10_000_000
+        assert PlutoMock.call_count == 0
+
+    def test_disconnect(self, PlutoMock):
+        """Test that disconnecting releases the receive buffers."""
+        # Arrange
+        device = UUT.Pluto()
+        device.connect()
+        sdr = PlutoMock.return_value
+
+        # Act
+        device.disconnect()
+
+        # Assert
+        assert device.is_connected() is False
+        assert sdr.rx_destroy_buffer.call_count == 2
+
+    def test_disconnect_lost_device(self, PlutoMock):
+        """Test that disconnecting works when the device is already gone."""
+        # Arrange
+        device = UUT.Pluto()
+        device.connect()
+        PlutoMock.return_value.rx_destroy_buffer.side_effect = OSError
+
+        # Act
+        device.disconnect()
+
+        # Assert
+        assert device.is_connected() is False
+
+
+class Test_PlutoConfig():
+    """Test group to test the PlutoConfig class."""
+
+    def test_default(self):
+        """Test the default configuration."""
+        # Arrange
+        # Act
+        config = UUT.PlutoConfig()
+
+        # Assert
+        assert config.lo == 1_000_000_000
+        assert config.channels == (0,)
+        assert config.buffer_size * config.kernel_buffers >= 2**16
+
+    @pytest.mark.parametrize(
+        "settings",
+        [
+            {"lo": 10_000_000},
+            {"sample_rate": 100_000_000},
+            {"bandwidth": 100},
+            {"buffer_size": 0},
+            {"kernel_buffers": 0},
+            {"gain_mode": "auto"},
+            {"channels": (2,)},
+        ],
+    )
+    def test_invalid(self, settings):
+        """Test the exception for invalid settings."""
+        # Arrange
+        # Act
+        with pytest.raises(ValueError):
+            UUT.PlutoConfig(**settings)
+
+
+class Test_DeviceSupervisor():
+    """Test group to test the DeviceSupervisor class."""
+
+    class FlakyDevice(UUT.SignalGenerator):
+        """Signal generator which fails a given number of times."""
+
+        def __init__(self, failures):
+            super().__init__(block_size=100, sample_rate=1e4)
+            self.failures = failures
+            self.connects = 0
+
+        def connect(self):
+            self.connects += 1
+            super().connect()
+
+        def acquire(self):
+            if self.failures:
+                self.failures -= 1
+                raise OSError("USB transfer failed")
+            return super().acquire()
+
+    def test_acquire(self):
+        """Test that the device is connected on the first acquisition."""
+        # Arrange
+        device = self.FlakyDevice(0)
+        supervisor = UUT.DeviceSupervisor(device)
+
+        # Act
+        data = supervisor.acquire()
+
+        # Assert
+        assert data.size == 100
+        assert device.connects == 1
+        assert supervisor.reconnects == 0
+
+    def test_reconnect(self):
+        """Test that the device is reconnected with backoff after errors."""
+        # Arrange
+        device = self.FlakyDevice(0)
+        gaps = []
+        supervisor = UUT.DeviceSupervisor(
+            device, initial_delay=0.01, max_delay=0.02, on_gap=gaps.append
+        )
+        supervisor.acquire()
+        device.failures = 3
+
+        # Act
+        start = time.perf_counter()
+        data = supervisor.acquire()
+        elapsed = time.perf_counter() - start
+
+        # Assert
+        assert data.size == 100
+        assert device.connects == 4
+        assert supervisor.reconnects == 1
+        assert 0.01 + 0.02 + 0.02 <= elapsed < 0.5
+        assert len(gaps) == 1
+        assert supervisor.lost_samples == gaps[0] >= 400
+
+    def test_stop_during_outage(self):
+        """Test that the recovery stops when the stop event is set."""
+        # Arrange
+        device = self.FlakyDevice(10**6)
+        supervisor = UUT.DeviceSupervisor(device, initial_delay=0.01)
+        stop_event = Event()
+        stop_event.set()
+
+        # Act
+        data = supervisor.acquire(stop_event)
+
+        # Assert
+        assert data.size == 0
+
+    def test_end_of_recording(self, recording):
+        """Test that the end of a recording is not treated as device error."""
+        # Arrange
+        device = UUT.FileReplayDevice(recording, block_size=100, realtime=False, loop=False)
+        supervisor = UUT.DeviceSupervisor(device)
+        supervisor.acquire()
+
+        # Act
+        with pytest.raises(EOFError):
+            supervisor.acquire()
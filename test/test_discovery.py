@@ -0,0 +1,228 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Test the discovery module.
+
+## Description
+Contains the test group to test the device discovery service.
+
+### Details
+- *File:*     `test_discovery.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import time
+from threading import Event, Thread
+import pytest
+
+# Import the Unit Under Test
+import plutostudio.core.discovery as UUT
+
+# === Fixtures ===
+
+
+class FakeScanner:
+    """Scanner which returns configurable results and can be blocked."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+        self.release = Event()
+        self.release.set()
+
+    def __call__(self):
+        self.release.wait(1.0)
+        self.calls += 1
+        result = self.results[min(self.calls, len(self.results)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def wait_for(condition, timeout=1.0):
+    """Wait until the condition is true."""
+    end = time.monotonic() + timeout
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.001)
+    return condition()
+
+
+# === Tests ===
+
+
+class Test_DeviceDiscovery():
+    """Test group to test the device discovery service."""
+    def test_init(self):
+        """Test the initial state of the discovery service."""
+        # Arrange
+        # Act
+        discovery = UUT.DeviceDiscovery(FakeScanner(("usb:1.2.5",)))
+
+        # Assert
+        assert discovery.is_stale() is True
+        assert discovery.is_scanning() is False
+        assert discovery.age == float("inf")
+
+    def test_scan(self):
+        """Test scanning and caching the devices."""
+        # Arrange
+        scanner = FakeScanner(("usb:1.2.5", "ip:192.168.2.1"))
+        discovery = UUT.DeviceDiscovery(scanner, ttl=10.0)
+
+        # Act
+        found = discovery.scan()
+        cached = discovery.devices()
+
+        # Assert
+        assert found == ("usb:1.2.5", "ip:192.168.2.1")
+        assert cached == found
+        assert scanner.calls == 1
+        assert discovery.is_stale() is False
+
+    def test_devices_does_not_block(self):
+        """Test that the cached devices are returned while a scan is running."""
+        # Arrange
+        scanner = FakeScanner(("usb:1.2.5",))
+        scanner.release.clear()
+        discovery = UUT.DeviceDiscovery(scanner)
+
+        # Act
+        start = time.perf_counter()
+        devices = discovery.devices()
+        elapsed = time.perf_counter() - start
+        scanning = discovery.is_scanning()
+        scanner.release.set()
+
+        # Assert
+        assert devices == ()
+        assert elapsed < 0.1
+        assert scanning is True
+        assert wait_for(lambda: discovery.devices() == ("usb:1.2.5",))
+
+    def test_ttl(self):
+        """Test that an outdated result starts a new scan."""
+        # Arrange
+        scanner = FakeScanner(("usb:1.2.5",))
+        discovery = UUT.DeviceDiscovery(scanner, ttl=0.01)
+        discovery.scan()
+
+        # Act
+        time.sleep(0.02)
+        discovery.devices()
+
+        # Assert
+        assert wait_for(lambda: scanner.calls == 2)
+
+    def test_events(self):
+        """Test the events for added and removed devices."""
+        # Arrange
+        scanner = FakeScanner(("usb:1",), ("usb:1", "usb:2"), ("usb:2",))
+        discovery = UUT.DeviceDiscovery(scanner)
+        added, removed = [], []
+        discovery.register_added_callback(added.append)
+        discovery.register_removed_callback(removed.append)
+
+        # Act
+        for _ in range(3):
+            discovery.scan()
+
+        # Assert
+        assert added == ["usb:1", "usb:2"]
+        assert removed == ["usb:1"]
+
+    def test_scan_error(self):
+        """Test that the last result is kept when the scan fails."""
+        # Arrange
+        scanner = FakeScanner(("usb:1",), OSError("backend failed"))
+        discovery = UUT.DeviceDiscovery(scanner)
+        discovery.scan()
+
+        # Act
+        devices = discovery.scan()
+
+        # Assert
+        assert devices == ("usb:1",)
+        assert discovery.is_scanning() is False
+
+    def test_scan_error_backoff(self):
+        """Test that a failed scan is retried only after the time to live."""
+        # Arrange
+        scanner = FakeScanner(OSError("backend failed"), ("usb:1",))
+        discovery = UUT.DeviceDiscovery(scanner, ttl=0.2)
+        discovery.scan()
+
+        # Act
+        for _ in range(20):
+            discovery.devices()
+        calls = scanner.calls
+        time.sleep(0.25)
+        discovery.devices()
+
+        # Assert
+        assert calls == 1
+        assert wait_for(lambda: discovery.devices() == ("usb:1",))
+        assert scanner.calls == 2
+
+    def test_scan_waits_for_running_scan(self):
+        """Test that scan() returns the result of a scan which is already running."""
+        # Arrange
+        scanner = FakeScanner(("usb:1",))
+        scanner.release.clear()
+        discovery = UUT.DeviceDiscovery(scanner)
+        discovery.refresh()
+        Thread(target=lambda: (time.sleep(0.05), scanner.release.set()), daemon=True).start()
+
+        # Act
+        devices = discovery.scan()
+
+        # Assert
+        assert devices == ("usb:1",)
+        assert scanner.calls == 1
+
+    def test_periodic(self):
+        """Test scanning periodically in the background."""
+        # Arrange
+        scanner = FakeScanner(("usb:1",))
+        discovery = UUT.DeviceDiscovery(scanner)
+
+        # Act
+        discovery.start(interval=0.005)
+        reached = wait_for(lambda: scanner.calls >= 3)
+        discovery.stop()
+
+        # Assert
+        assert reached is True
+        assert discovery.devices() == ("usb:1",)
+
+    @pytest.mark.slow()
+    def test_default_scanner(self):
+        """Test scanning with the libiio backend."""
+        # Arrange
+        discovery = UUT.DeviceDiscovery()
+
+        # Act
+        # Assert
+        assert isinstance(discovery.scan(), tuple)
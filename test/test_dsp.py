@@ -0,0 +1,395 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Test the dsp module.
+
+## Description
+Contains the test group to test the dsp module.
+
+### Details
+- *File:*     `test_dsp.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import pytest
+import numpy as np
+
+# Import the Unit Under Test
+import plutostudio.core.dsp as UUT
+
+# === Fixtures ===
+
+
+@pytest.fixture
+def samples() -> np.ndarray:
+    """Create a random complex test signal."""
+    rng = np.random.default_rng(1)
+    return (rng.standard_normal(5000) + 1j * rng.standard_normal(5000)).astype(np.complex64) * 0.1
+
+
+def _chunked(uut, samples: np.ndarray, sizes: tuple[int, ...]) -> np.ndarray:
+    """Process the samples in blocks of changing sizes."""
+    blocks, start, index = [], 0, 0
+    while start < samples.size:
+        size = sizes[index % len(sizes)]
+        blocks.append(uut.process(samples[start : start + size]))
+        start, index = start + size, index + 1
+    return np.concatenate(blocks)
+
+
+# === Tests ===
+
+
+class Test_Design():
+    """Test group to test the filter design functions."""
+    def test_lowpass(self):
+        """Test the gain of the lowpass filter."""
+        # Act
+        taps = UUT.lowpass(101, 0.1)
+        response = np.abs(np.fft.rfft(taps, 1000))
+
+        # Assert
+        assert taps.dtype == np.float32
+        assert not taps.flags.writeable
+        assert taps.sum() == pytest.approx(1.0, rel=1e-5)
+        assert np.allclose(taps, taps[::-1])
+        assert response[:80].min() > 0.99
+        assert response[130:].max() < 1e-3
+
+    def test_lowpass_invalid_cutoff(self):
+        """Test that the cutoff frequency is checked."""
+        with pytest.raises(ValueError):
+            UUT.lowpass(11, 0.5)
+
+    def test_halfband(self):
+        """Test the zero coefficients of the halfband filter."""
+        # Act
+        taps = UUT.halfband(20)
+        center = taps.size // 2
+
+        # Assert
+        assert taps.size == 23
+        assert taps[0] != 0
+        assert np.all(taps[center + 2 :: 2] == 0)
+        assert taps[center] == pytest.approx(0.5, abs=1e-3)
+
+    def test_compensator(self):
+        """Test that the compensator flattens the CIC passband."""
+        # Arrange
+        taps = UUT.compensator(8, 4, taps=63, cutoff=0.2)
+        frequency = np.fft.rfftfreq(1024)
+        response = np.abs(np.fft.rfft(taps, 1024)) * UUT.cic_response(frequency, 8, 4)
+
+        # Assert
+        passband = response[frequency < 0.15]
+        assert passband.min() > 0.98
+        assert passband.max() < 1.02
+
+
+class Test_FirDecimator():
+    """Test group to test the polyphase FIR decimator."""
+    def test_reference(self, samples):
+        """Test the output against the full convolution."""
+        # Arrange
+        taps = UUT.lowpass(33, 0.1)
+        uut = UUT.FirDecimator(4, taps)
+
+        # Act
+        output = uut.process(samples)
+
+        # Assert
+        reference = np.convolve(samples, taps)[: samples.size][3::4]
+        assert uut.decimation == 4
+        assert output.dtype == np.complex64
+        assert output.size == samples.size // 4
+        assert np.allclose(output, reference, atol=1e-5)
+
+    @pytest.mark.parametrize("decimation", [1, 2, 3, 5])
+    def test_block_continuity(self, samples, decimation):
+        """Test that blocks of any size give the same output as one block."""
+        # Arrange
+        reference = UUT.FirDecimator(decimation).process(samples)
+        uut = UUT.FirDecimator(decimation)
+
+        # Act
+        output = _chunked(uut, samples, (1, 7, 100, 2, 513))
+
+        # Assert
+        assert output.size == reference.size
+        assert np.allclose(output, reference, atol=1e-5)
+
+    def test_halfband(self, samples):
+        """Test the decimation with the zero coefficients of a halfband filter."""
+        # Arrange
+        taps = UUT.halfband(23)
+        uut = UUT.FirDecimator(2, taps)
+
+        # Act
+        output = _chunked(uut, samples, (3, 64))
+
+        # Assert
+        reference = np.convolve(samples, taps)[: samples.size][1::2]
+        assert np.allclose(output, reference, atol=1e-5)
+
+    def test_reset(self, samples):
+        """Test that the reset clears the history."""
+        # Arrange
+        uut = UUT.FirDecimator(3)
+        first = uut.process(samples[:100])
+        uut.process(samples[100:211])
+
+        # Act
+        uut.reset()
+
+        # Assert
+        assert np.array_equal(uut.process(samples[:100]), first)
+
+    def test_invalid_decimation(self):
+        """Test that the decimation has to be positive."""
+        with pytest.raises(ValueError):
+            UUT.FirDecimator(0)
+
+
+class Test_CicDecimator():
+    """Test group to test the CIC decimator."""
+    def test_reference(self, samples):
+        """Test the output against cascaded moving sums."""
+        # Arrange
+        uut = UUT.CicDecimator(8, stages=3, resolution=2**-20)
+        boxcar = np.ones(8) / 8
+        reference = samples.astype(np.complex128)
+        for _ in range(3):
+            reference = np.convolve(reference, boxcar)[: samples.size]
+
+        # Act
+        output = uut.process(samples)
+
+        # Assert
+        assert output.dtype == np.complex64
+        assert np.allclose(output, reference[7::8], atol=1e-5)
+
+    def test_dc_gain(self):
+        """Test the unity gain at DC."""
+        # Arrange
+        uut = UUT.CicDecimator(16, stages=5)
+
+        # Act
+        output = uut.process(np.full(1024, 0.5 - 0.25j, dtype=np.complex64))
+
+        # Assert
+        assert np.allclose(output[5:], 0.5 - 0.25j, atol=1e-4)
+
+    def test_block_continuity(self, samples):
+        """Test that blocks of any size give the same output as one block."""
+        # Arrange
+        reference = UUT.CicDecimator(5, delay=2).process(samples)
+        uut = UUT.CicDecimator(5, delay=2)
+
+        # Act
+        output = _chunked(uut, samples, (1, 3, 0, 77, 1000))
+
+        # Assert
+        assert np.array_equal(output, reference)
+
+    def test_strided_samples(self, samples):
+        """Test the decimation of a strided view, e.g. one channel of interleaved samples."""
+        # Arrange
+        interleaved = np.repeat(samples, 2)
+        reference = UUT.CicDecimator(4).process(samples)
+        uut = UUT.CicDecimator(4)
+
+        # Act
+        output = uut.process(interleaved[::2])
+
+        # Assert
+        assert np.array_equal(output, reference)
+
+    def test_real_samples(self):
+        """Test the decimation of real samples."""
+        # Arrange
+        uut = UUT.CicDecimator(4, dtype=np.float32)
+
+        # Act
+        output = uut.process(np.ones(64, dtype=np.float32))
+
+        # Assert
+        assert output.dtype == np.float32
+        assert output.size == 16
+        assert output[-1] == pytest.approx(1.0)
+
+
+class Test_Chains():
+    """Test group to test the filter chains."""
+    def test_halfband_cascade(self, samples):
+        """Test the decimation and continuity of the halfband cascade."""
+        # Arrange
+        reference = UUT.halfband_cascade(3).process(samples)
+        uut = UUT.halfband_cascade(3)
+
+        # Act
+        output = _chunked(uut, samples, (5, 300))
+
+        # Assert
+        assert uut.decimation == 8
+        assert output.size == samples.size // 8
+        assert np.allclose(output, reference, atol=1e-5)
+
+    def test_halfband_cascade_attenuation(self):
+        """Test that a tone above the output band is suppressed."""
+        # Arrange
+        uut = UUT.halfband_cascade(2, taps=31)
+        tone = np.exp(2j * np.pi * 0.2 * np.arange(8192)).astype(np.complex64)
+
+        # Act
+        output = uut.process(tone)
+
+        # Assert
+        assert np.abs(output[100:]).max() < 1e-3
+
+    def test_cic_chain(self, samples):
+        """Test the decimation and passband gain of the CIC chain."""
+        # Arrange
+        uut = UUT.cic_chain(16)
+        tone = np.exp(2j * np.pi * 0.005 * np.arange(16384)).astype(np.complex64)
+
+        # Act
+        output = uut.process(tone)
+
+        # Assert
+        assert uut.decimation == 16
+        assert output.size == tone.size // 16
+        assert np.abs(output[100:]).mean() == pytest.approx(1.0, abs=0.02)
+
+    def test_cic_chain_invalid(self):
+        """Test that the decimation has to be even."""
+        with pytest.raises(ValueError):
+            UUT.cic_chain(5)
+
+
+class Test_Nco():
+    """Test group to test the numerically controlled oscillators."""
+    def test_table(self):
+        """Test the lookup table."""
+        # Act
+        table = UUT.nco_table(8)
+
+        # Assert
+        assert table.size == 256
+        assert not table.flags.writeable
+        assert table[64] == pytest.approx(1j, abs=1e-6)
+
+    def test_generate(self):
+        """Test the oscillators against the exact complex exponential."""
+        # Arrange
+        uut = UUT.Nco([1e3, -2.5e3], 48e3)
+        time = np.arange(480) / 48e3
+
+        # Act
+        output = uut.generate(480)
+
+        # Assert
+        assert output.shape == (2, 480)
+        assert np.allclose(output[0], np.exp(2j * np.pi * 1e3 * time), atol=1e-4)
+        assert np.allclose(output[1], np.exp(-2j * np.pi * 2.5e3 * time), atol=1e-4)
+        assert np.allclose(uut.frequencies, [1e3, -2.5e3], atol=1e-4)
+
+    def test_phase_continuity(self):
+        """Test that the phase continues across blocks."""
+        # Arrange
+        reference = UUT.Nco(1234.5, 1e5).generate(1000)
+        uut = UUT.Nco(1234.5, 1e5)
+
+        # Act
+        output = np.concatenate([uut.generate(size) for size in (1, 499, 0, 500)], axis=1)
+
+        # Assert
+        assert np.array_equal(output, reference)
+
+    def test_tune(self):
+        """Test that the retuning keeps the phase."""
+        # Arrange
+        uut = UUT.Nco(0.0, 1e3)
+        uut.generate(10)
+
+        # Act
+        uut.tune(0, 250.0)
+        output = uut.generate(4)[0]
+
+        # Assert
+        assert np.allclose(output, [1, 1j, -1, -1j], atol=1e-6)
+
+
+class Test_DigitalDownConverter():
+    """Test group to test the digital down-converter."""
+    def test_channels(self):
+        """Test that each channel receives only its own tone."""
+        # Arrange
+        rate = 1e6
+        time = np.arange(2**15) / rate
+        samples = np.exp(2j * np.pi * 100e3 * time) + 0.5 * np.exp(-2j * np.pi * 250e3 * time)
+        samples = samples.astype(np.complex64)
+        uut = UUT.DigitalDownConverter(rate, [100e3, -250e3, 400e3], decimation=10)
+
+        # Act
+        output = uut.process(samples)
+
+        # Assert
+        assert output.shape == (3, samples.size // 10)
+        assert uut.output_rate == pytest.approx(1e5)
+        assert np.allclose(np.abs(output[0, 100:]), 1.0, atol=1e-3)
+        assert np.allclose(np.abs(output[1, 100:]), 0.5, atol=1e-3)
+        assert np.abs(output[2, 100:]).max() < 1e-3
+
+    def test_block_continuity(self, samples):
+        """Test that blocks of any size give the same output as one block."""
+        # Arrange
+        reference = UUT.DigitalDownConverter(1e6, [1e5, -3e4], decimation=4).process(samples)
+        uut = UUT.DigitalDownConverter(1e6, [1e5, -3e4], decimation=4)
+
+        # Act
+        blocks = [uut.process(samples[start : start + 333]) for start in range(0, 5000, 333)]
+        output = np.concatenate(blocks, axis=1)
+
+        # Assert
+        assert np.allclose(output, reference, atol=1e-5)
+
+    def test_tune(self):
+        """Test that a channel can be moved."""
+        # Arrange
+        uut = UUT.DigitalDownConverter(1e6, [1e5, 2e5], factory=lambda: UUT.halfband_cascade(2))
+
+        # Act
+        uut.tune(1, -2e5)
+
+        # Assert
+        assert uut.decimation == 4
+        assert np.allclose(uut.offsets, [1e5, -2e5], atol=1e-3)
+
+    @pytest.mark.parametrize("offsets", [[], [5e5], [1e5, -6e5]])
+    def test_invalid_offsets(self, offsets):
+        """Test that the offsets are checked."""
+        with pytest.raises(ValueError):
+            UUT.DigitalDownConverter(1e6, offsets)
@@ -0,0 +1,222 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Test the metrics module.
+
+## Description
+Contains the test group to test the metrics module.
+
+### Details
+- *File:*     `test_metrics.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import json
+import time
+import pytest
+import numpy as np
+
+# Import the Unit Under Test
+import plutostudio.core.metrics as UUT
+
+# === Tests ===
+
+
+class Test_RateCounter():
+    """Test group to test the rate counter."""
+    def test_init(self):
+        """Test the initial state of the rate counter."""
+        # Arrange
+        # Act
+        counter = UUT.RateCounter()
+
+        # Assert
+        assert counter.rate == 0.0
+        assert counter.total == 0
+
+    def test_rate_before_interval(self):
+        """Test that the rate is only updated after the interval."""
+        # Arrange
+        counter = UUT.RateCounter(interval=10.0)
+
+        # Act
+        counter.add(100)
+
+        # Assert
+        assert counter.rate == 0.0
+        assert counter.total == 100
+
+    def test_rate_after_interval(self):
+        """Test the rate after the interval has passed."""
+        # Arrange
+        counter = UUT.RateCounter(interval=0.01)
+
+        # Act
+        counter.add(100)
+        time.sleep(0.02)
+        counter.add(100)
+
+        # Assert
+        assert 0 < counter.rate < 200 / 0.02
+        assert counter.total == 200
+
+    def test_reset(self):
+        """Test resetting the counter."""
+        # Arrange
+        counter = UUT.RateCounter(interval=0.0)
+        counter.add(100)
+
+        # Act
+        counter.reset()
+
+        # Assert
+        assert counter.rate == 0.0
+        assert counter.total == 0
+
+    def test_to_dict(self):
+        """Test the exported state of the rate counter."""
+        # Arrange
+        counter = UUT.RateCounter()
+
+        # Act
+        counter.add(5)
+
+        # Assert
+        assert counter.to_dict() == {"total": 5, "rate": 0.0}
+
+
+class Test_Histogram():
+    """Test group to test the latency histogram."""
+    def test_init(self):
+        """Test the initial state of the histogram."""
+        # Arrange
+        # Act
+        histogram = UUT.Histogram()
+
+        # Assert
+        assert histogram.count == 0
+        assert histogram.mean == 0.0
+        assert histogram.percentile(50) == 0.0
+        with pytest.raises(ValueError):
+            UUT.Histogram(lowest=1.0, highest=0.5)
+
+    @pytest.mark.parametrize("digits", [1, 2, 3])
+    def test_percentiles(self, digits):
+        """Test that the percentiles are within the relative error."""
+        # Arrange
+        histogram = UUT.Histogram(digits=digits)
+        values = np.random.default_rng(0).lognormal(np.log(1e-3), 1.0, 10_000)
+
+        # Act
+        for value in values:
+            histogram.record(value)
+
+        # Assert
+        assert histogram.count == values.size
+        assert histogram.mean == pytest.approx(values.mean())
+        assert histogram.min == values.min()
+        assert histogram.max == values.max()
+        for percent in UUT.PERCENTILES:
+            expected = np.percentile(values, percent, method="inverted_cdf")
+            assert histogram.percentile(percent) == pytest.approx(expected, rel=10**-digits)
+
+    def test_out_of_range(self):
+        """Test that values outside of the range are counted at the limits."""
+        # Arrange
+        histogram = UUT.Histogram(lowest=1e-3, highest=1.0)
+
+        # Act
+        for value in (-1.0, 0.0, 1e-6, 100.0):
+            histogram.record(value)
+
+        # Assert
+        assert histogram.count == 4
+        assert histogram.percentile(50) == -1.0
+        assert histogram.percentile(100) == 100.0
+
+    def test_time(self):
+        """Test recording the time of a with block."""
+        # Arrange
+        histogram = UUT.Histogram()
+
+        # Act
+        with histogram.time():
+            time.sleep(0.01)
+
+        # Assert
+        assert histogram.count == 1
+        assert 0.01 <= histogram.max < 0.5
+
+    def test_reset(self):
+        """Test discarding the recorded values."""
+        # Arrange
+        histogram = UUT.Histogram()
+        histogram.record(1.0)
+
+        # Act
+        histogram.reset()
+
+        # Assert
+        assert histogram.count == 0
+        assert histogram.to_dict()["p99"] == 0.0
+
+
+class Test_Telemetry():
+    """Test group to test the metrics registry."""
+    def test_register(self):
+        """Test creating and registering metrics by name."""
+        # Arrange
+        telemetry = UUT.Telemetry()
+
+        # Act
+        histogram = telemetry.histogram("draw")
+        counter = telemetry.counter("samples")
+        telemetry.add("fill", lambda: 0.5)
+
+        # Assert
+        assert telemetry.histogram("draw") is histogram
+        assert telemetry.counter("samples") is counter
+        assert telemetry.names == ("draw", "samples", "fill")
+
+    def test_to_json(self, tmp_path):
+        """Test exporting the metrics as JSON."""
+        # Arrange
+        telemetry = UUT.Telemetry()
+        telemetry.histogram("draw").record(0.02)
+        telemetry.counter("samples").add(1024)
+        telemetry.add("fill", lambda: 0.5)
+        path = tmp_path / "metrics.json"
+
+        # Act
+        document = telemetry.to_json(path)
+
+        # Assert
+        metrics = json.loads(path.read_text())["metrics"]
+        assert json.loads(document)["metrics"] == metrics
+        assert metrics["draw"]["count"] == 1
+        assert metrics["draw"]["p50"] == pytest.approx(0.02)
+        assert metrics["samples"]["total"] == 1024
+        assert metrics["fill"] == 0.5
@@ -0,0 +1,174 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Test the offload module.
+
+## Description
+Contains the test group to test the DSP offload to worker processes.
+
+### Details
+- *File:*     `test_offload.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import pickle
+import time
+import pytest
+import numpy as np
+
+# Import the Unit Under Test
+import plutostudio.core.offload as UUT
+
+# === Fixtures ===
+
+
+@pytest.fixture
+def ring():
+    """Create a shared memory ring and release it afterwards."""
+    ring = UUT.SharedBlockRing(4, 8)
+    yield ring
+    ring.close()
+
+
+# === Tests ===
+
+
+class Test_SharedBlockRing():
+    """Test group to test the ring of blocks in shared memory."""
+    def test_init(self, ring):
+        """Test the initial state of the ring."""
+        # Arrange
+        # Act
+        # Assert
+        assert ring.size == 0
+        assert ring.slots == 4
+        assert ring.block_size == 8
+        assert ring.peek() is None
+
+    def test_put_peek(self, ring):
+        """Test writing and reading blocks in order."""
+        # Arrange
+        ring.put(np.arange(8), 10)
+        ring.put(np.arange(8) + 8, 11)
+
+        # Act
+        sequence, block = ring.peek()
+        ring.advance()
+        second, _ = ring.peek()
+
+        # Assert
+        assert sequence == 10
+        assert block.dtype == np.complex64
+        np.testing.assert_array_equal(block, np.arange(8))
+        assert second == 11
+        assert ring.size == 1
+
+    def test_full(self, ring):
+        """Test that a full ring rejects the block."""
+        # Arrange
+        for sequence in range(4):
+            ring.put(np.ones(8), sequence)
+
+        # Act
+        rejected = ring.put(np.ones(8), 4)
+        ring.advance()
+        accepted = ring.put(np.ones(8), 4)
+
+        # Assert
+        assert rejected is False
+        assert accepted is True
+        assert ring.size == 4
+
+    def test_pickle_attaches(self, ring):
+        """Test that a pickled ring shares the memory of the original."""
+        # Arrange
+        attached = pickle.loads(pickle.dumps(ring))
+
+        # Act
+        ring.put(np.full(8, 3.0), 7)
+        sequence, block = attached.peek()
+        attached.advance()
+
+        # Assert
+        assert attached.name == ring.name
+        assert sequence == 7
+        np.testing.assert_array_equal(block, np.full(8, 3.0))
+        assert ring.size == 0
+        del block
+        attached.close()
+
+
+class Test_DspOffload():
+    """Test group to test the offload to worker processes."""
+    def test_init(self):
+        """Test the initial state of the offload."""
+        # Arrange
+        # Act
+        offload = UUT.DspOffload(np.mean, block_size=16, workers=2)
+
+        # Assert
+        assert offload.workers == 2
+        assert offload.is_running() is False
+        assert offload.results() == []
+
+    def test_not_started(self):
+        """Test that blocks are dropped while the workers are not running."""
+        # Arrange
+        offload = UUT.DspOffload(np.mean, block_size=16, workers=2)
+
+        # Act
+        dropped = offload.put(np.ones(40))
+
+        # Assert
+        assert dropped == 2
+        assert offload.blocks == 0
+
+    def test_process(self):
+        """Test that all blocks are processed by the workers in order."""
+        # Arrange
+        offload = UUT.DspOffload(np.mean, block_size=16, workers=2, slots=32)
+        data = np.repeat(np.arange(20), 16).astype(np.complex64)
+        offload.start()
+
+        # Act
+        try:
+            # Hand over the samples in chunks which do not match the blocks
+            for chunk in np.array_split(data, 7):
+                offload.put(chunk)
+            results = []
+            end = time.monotonic() + 20.0
+            while len(results) < 20 and time.monotonic() < end:
+                results += offload.results()
+                time.sleep(0.01)
+        finally:
+            offload.stop()
+
+        # Assert
+        assert offload.dropped == 0
+        assert offload.blocks == 20
+        assert sorted(sequence for sequence, _ in results) == list(range(20))
+        assert all(result == sequence for sequence, result in results)
+        assert offload.is_running() is False
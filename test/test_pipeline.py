@@ -0,0 +1,319 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Test the pipeline module.
+
+## Description
+Contains the test group to test the acquisition pipeline and its stages.
+
+### Details
+- *File:*     `test_pipeline.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import time
+from threading import Thread
+import pytest
+import numpy as np
+
+# Import the Unit Under Test
+import plutostudio.core.pipeline as UUT
+from plutostudio.core.device import SignalGenerator, FileReplayDevice
+from plutostudio.core.metrics import Telemetry
+
+# === Fixtures ===
+
+
+def wait_for(condition, timeout=2.0):
+    """Wait until the condition is true."""
+    end = time.monotonic() + timeout
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.001)
+    return condition()
+
+
+@pytest.fixture
+def recording(tmp_path):
+    """Create a recording with 1000 complex samples."""
+    path = tmp_path / "capture.sigmf-data"
+    np.arange(1000).astype(np.complex64).tofile(path)
+    yield FileReplayDevice(path, block_size=100, realtime=False, loop=False)
+
+
+# === Tests ===
+
+
+class Test_BlockQueue():
+    """Test group to test the bounded queue and its policies."""
+    def test_init(self):
+        """Test the validation of the settings."""
+        # Arrange
+        # Act
+        # Assert
+        with pytest.raises(ValueError):
+            UUT.BlockQueue(policy="drop-random")
+        with pytest.raises(ValueError):
+            UUT.BlockQueue(0)
+
+    def test_fifo(self):
+        """Test that the blocks are returned in order."""
+        # Arrange
+        queue = UUT.BlockQueue(4)
+        queue.put(np.ones(1))
+        queue.put(np.zeros(1))
+
+        # Act
+        first = queue.get(0)
+        second = queue.get(0)
+        empty = queue.get(0)
+
+        # Assert
+        assert first[0] == 1
+        assert second[0] == 0
+        assert empty is None
+
+    @pytest.mark.parametrize("policy, kept", [("drop-oldest", [1, 2]), ("drop-newest", [0, 1])])
+    def test_drop(self, policy, kept):
+        """Test the dropping policies of a full queue."""
+        # Arrange
+        queue = UUT.BlockQueue(2, policy)
+
+        # Act
+        accepted = [queue.put(np.array([value])) for value in range(3)]
+
+        # Assert
+        assert accepted == [True, True, policy == "drop-oldest"]
+        assert [queue.get(0)[0] for _ in range(2)] == kept
+        assert queue.dropped == 1
+
+    def test_block(self):
+        """Test that the producer waits for room with the block policy."""
+        # Arrange
+        queue = UUT.BlockQueue(1)
+        queue.put(np.zeros(1))
+        Thread(target=lambda: (time.sleep(0.02), queue.get())).start()
+
+        # Act
+        timed_out = queue.put(np.ones(1), timeout=0.001)
+        accepted = queue.put(np.ones(1), timeout=1.0)
+
+        # Assert
+        assert timed_out is False
+        assert accepted is True
+        assert queue.dropped == 0
+
+    def test_join(self):
+        """Test waiting until all blocks were processed."""
+        # Arrange
+        queue = UUT.BlockQueue(4)
+        queue.put(np.zeros(1))
+
+        # Act
+        pending = queue.join(timeout=0.001)
+        queue.get()
+        queue.task_done()
+        done = queue.join(timeout=0.001)
+
+        # Assert
+        assert pending is False
+        assert done is True
+
+    def test_close(self):
+        """Test that closing the queue wakes up the waiting threads."""
+        # Arrange
+        queue = UUT.BlockQueue(1)
+        queue.put(np.zeros(1))
+        Thread(target=lambda: (time.sleep(0.02), queue.close())).start()
+
+        # Act
+        accepted = queue.put(np.ones(1))
+
+        # Assert
+        assert accepted is False
+
+
+class Test_Stage():
+    """Test group to test a single stage."""
+    def test_name(self):
+        """Test the default name of a stage."""
+        # Arrange
+        # Act
+        stage = UUT.Stage(np.conj)
+
+        # Assert
+        assert stage.name == "conjugate"
+        assert UUT.Stage(np.conj, name="mirror").name == "mirror"
+
+    def test_errors(self):
+        """Test that a failing block is counted and skipped."""
+        # Arrange
+        stage = UUT.Stage(lambda block: 1 / len(block))
+
+        # Act
+        result = stage.process(np.zeros(0))
+
+        # Assert
+        assert result is None
+        assert stage.errors == 1
+        assert stage.blocks.total == 0
+
+
+class Test_Pipeline():
+    """Test group to test the pipeline."""
+    def test_stages(self):
+        """Test that blocks pass the stages in order into all sinks."""
+        # Arrange
+        pipeline = UUT.Pipeline(SignalGenerator(block_size=64))
+        first, second = [], []
+        double = pipeline.add_stage(lambda block: 2 * block, name="double")
+        pipeline.add_sink(first.append, name="first")
+        pipeline.add_stage(lambda block: block[:16], name="cut")
+        pipeline.add_sink(second.append, name="second")
+
+        # Act
+        pipeline.start()
+        done = wait_for(lambda: len(first) >= 10 and len(second) >= 10)
+        pipeline.stop()
+
+        # Assert
+        assert done is True
+        assert pipeline.is_running() is False
+        assert [stage.name for stage in pipeline.stages] == ["double", "cut", "first", "second"]
+        assert all(block.size == 16 for block in first + second)
+        assert double.rate.total == 64 * double.blocks.total
+        assert pipeline.rate.total >= double.rate.total
+        assert sum(stage.dropped for stage in pipeline.stages) == 0
+
+    def test_drop_newest(self):
+        """Test that a slow sink drops blocks instead of stalling the source."""
+        # Arrange
+        pipeline = UUT.Pipeline(SignalGenerator(block_size=64))
+        received = []
+        sink = pipeline.add_sink(
+            lambda block: (time.sleep(0.01), received.append(block)),
+            max_blocks=2,
+            policy="drop-newest",
+        )
+
+        # Act
+        pipeline.start()
+        done = wait_for(lambda: sink.dropped > 10)
+        pipeline.stop()
+
+        # Assert
+        assert done is True
+        assert pipeline.rate.total > len(received) * 64
+
+    def test_reused_source_buffer(self):
+        """Test that queued blocks are not overwritten by the next acquisition of the source."""
+        # Arrange
+        generator = SignalGenerator(block_size=256, sample_rate=1e6)
+        generator.add_tone(10e3)
+        pipeline = UUT.Pipeline(generator)
+        received = []
+        pipeline.add_sink(lambda block: (time.sleep(0.002), received.append(block)), max_blocks=16)
+
+        # Act
+        pipeline.start()
+        wait_for(lambda: len(received) >= 40)
+        pipeline.stop(drain=True)
+
+        # Assert
+        samples = np.concatenate(received)
+        assert samples.size == pipeline.rate.total
+        steps = np.angle(samples[1:] * np.conj(samples[:-1]))
+        np.testing.assert_allclose(steps, 2 * np.pi * 10e3 / 1e6, atol=1e-4)
+
+    def test_end_of_data(self, recording):
+        """Test that every block of a recording reaches the sink with the block policy."""
+        # Arrange
+        pipeline = UUT.Pipeline(recording)
+        received = []
+        pipeline.add_sink(lambda block: (time.sleep(0.001), received.append(block)), max_blocks=1)
+
+        # Act
+        pipeline.start()
+        done = wait_for(lambda: len(received) == 10)
+        pipeline.stop()
+
+        # Assert
+        assert done is True
+        np.testing.assert_array_equal(np.concatenate(received).real, np.arange(1000))
+
+    def test_drain(self):
+        """Test that all acquired blocks reach the sinks when draining."""
+        # Arrange
+        pipeline = UUT.Pipeline(SignalGenerator(block_size=64))
+        received = []
+        pipeline.add_stage(lambda block: (time.sleep(0.001), block)[1], max_blocks=4)
+        pipeline.add_sink(received.append, max_blocks=4)
+        pipeline.start()
+        wait_for(lambda: len(received) >= 5)
+
+        # Act
+        pipeline.stop(drain=True)
+
+        # Assert
+        assert pipeline.is_acquiring() is False
+        assert len(received) * 64 == pipeline.rate.total
+
+    def test_telemetry(self):
+        """Test that the stages record their timing into the registered metrics."""
+        # Arrange
+        pipeline = UUT.Pipeline(SignalGenerator(block_size=64))
+        stage = pipeline.add_stage(lambda block: (time.sleep(0.001), block)[1], name="slow")
+        sink = pipeline.add_sink(lambda block: None, name="sink")
+        telemetry = Telemetry()
+        pipeline.register(telemetry)
+
+        # Act
+        pipeline.start()
+        done = wait_for(lambda: sink.blocks.total >= 10)
+        pipeline.stop()
+        metrics = telemetry.snapshot()
+
+        # Assert
+        assert done is True
+        assert stage.duration.min >= 0.001
+        assert sink.latency.min >= stage.duration.min
+        assert sink.last_timestamp is not None
+        assert metrics["pipeline.acquire"]["count"] == pipeline.rate.total // 64
+        assert metrics["pipeline.slow.duration"]["p50"] >= 0.001
+        assert metrics["pipeline.sink.samples"]["total"] == 64 * sink.blocks.total
+        assert metrics["pipeline.sink.dropped"] == 0
+        assert "pipeline.slow.queue" in metrics
+
+    def test_add_while_running(self):
+        """Test that stages cannot be added while the pipeline runs."""
+        # Arrange
+        pipeline = UUT.Pipeline(SignalGenerator(block_size=64))
+        pipeline.start()
+
+        # Act
+        # Assert
+        with pytest.raises(RuntimeError):
+            pipeline.add_sink(print)
+        pipeline.stop()
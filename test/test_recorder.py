@@ -0,0 +1,211 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Test the recorder module.
+
+## Description
+Contains the test group to test the recorder module.
+
+### Details
+- *File:*     `test_recorder.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import json
+import time
+from datetime import datetime
+import pytest
+import numpy as np
+
+# Import the Unit Under Test
+import plutostudio.core.recorder as UUT
+from plutostudio.core.buffer import IQ_INT16
+
+# === Fixtures ===
+def read_metadata(path):
+    """Read the metadata file which belongs to a data file."""
+    with open(path.with_name(path.stem + ".sigmf-meta"), encoding="utf-8") as file:
+        return json.load(file)
+
+
+# === Tests ===
+
+
+class Test_Recorder():
+    """Test group to test the recorder class."""
+    def test_init(self, tmp_path):
+        """Test the initial state of the recorder."""
+        # Arrange
+        # Act
+        recorder = UUT.Recorder(tmp_path / "capture", 1e6)
+
+        # Assert
+        assert recorder.is_recording() is False
+        assert recorder.samples_written == 0
+        assert recorder.dropped == 0
+        assert recorder.segments == ()
+
+    def test_unsupported_type(self, tmp_path):
+        """Test the exception for an unsupported sample type."""
+        # Arrange
+        # Act
+        with pytest.raises(ValueError):
+            UUT.Recorder(tmp_path / "capture", 1e6, dtype=np.uint8)
+
+    def test_record(self, tmp_path):
+        """Test that the recorded samples end up in the data file."""
+        # Arrange
+        recorder = UUT.Recorder(tmp_path / "capture", 2e6, center_frequency=433.92e6)
+        data = (np.arange(1000) + 1j * np.arange(1000)).astype(np.complex64)
+
+        # Act
+        recorder.start()
+        recorder.put(data[:600])
+        recorder.put(data[600:])
+        recorder.stop()
+
+        # Assert
+        assert recorder.is_recording() is False
+        assert recorder.samples_written == 1000
+        assert len(recorder.segments) == 1
+        assert (np.fromfile(recorder.segments[0], dtype=np.complex64) == data).all()
+        metadata = read_metadata(recorder.segments[0])
+        assert metadata["global"]["core:datatype"] == "cf32_le"
+        assert metadata["global"]["core:sample_rate"] == 2e6
+        assert metadata["global"]["plutostudio:samples"] == 1000
+        assert metadata["captures"][0]["core:frequency"] == 433.92e6
+        assert metadata["captures"][0]["core:datetime"].endswith("Z")
+        assert metadata["global"]["core:extensions"] == [
+            {"name": "plutostudio", "version": "1.0.0", "optional": True}
+        ]
+
+    def test_rotate_by_size(self, tmp_path):
+        """Test that a new segment is started when the size is reached."""
+        # Arrange
+        recorder = UUT.Recorder(tmp_path / "capture", 1e3, dtype=IQ_INT16, max_segment_bytes=400)
+
+        # Act
+        recorder.start()
+        recorder.put(np.arange(250) * (1 + 1j))
+        recorder.stop()
+
+        # Assert
+        assert len(recorder.segments) == 3
+        sizes = [path.stat().st_size for path in recorder.segments]
+        assert sizes == [400, 400, 200]
+        last = np.fromfile(recorder.segments[2], dtype=IQ_INT16)
+        assert (last["i"] == np.arange(200, 250)).all()
+        metadata = read_metadata(recorder.segments[2])
+        assert metadata["global"]["core:datatype"] == "ci16_le"
+        assert metadata["global"]["plutostudio:first_sample"] == 200
+        first = read_metadata(recorder.segments[0])
+        assert metadata["captures"][0]["core:datetime"] > first["captures"][0]["core:datetime"]
+
+    def test_create_directory(self, tmp_path):
+        """Test that the directory of the recording is created."""
+        # Arrange
+        recorder = UUT.Recorder(tmp_path / "new" / "capture", 1e3)
+
+        # Act
+        recorder.start()
+        recorder.put(np.zeros(10, dtype=np.complex64))
+        recorder.stop()
+
+        # Assert
+        assert (tmp_path / "new" / "capture_0000.sigmf-data").stat().st_size == 80
+
+    def test_write_error(self, tmp_path):
+        """Test that an error of the writer thread stops the recorder and is raised by stop()."""
+        # Arrange
+        (tmp_path / "capture_0000.sigmf-data").mkdir()
+        recorder = UUT.Recorder(tmp_path / "capture", 1e3)
+        recorder.start()
+
+        # Act
+        recorder.put(np.zeros(10, dtype=np.complex64))
+        recorder._thread.join(timeout=5.0)
+
+        # Assert
+        assert recorder.is_recording() is False
+        assert isinstance(recorder.error, OSError)
+        assert recorder.put(np.zeros(10, dtype=np.complex64)) is False
+        with pytest.raises(OSError):
+            recorder.stop()
+
+    def test_drop_when_full(self, tmp_path):
+        """Test that blocks are dropped instead of blocking when the writer falls behind."""
+        # Arrange
+        recorder = UUT.Recorder(tmp_path / "capture", 1e3, buffer_size=100)
+
+        # Act
+        stored = [recorder.put(np.zeros(60, dtype=np.complex64)) for _ in range(2)]
+
+        # Assert
+        assert stored == [True, False]
+        assert recorder.dropped == 60
+
+    def test_drop_gap(self, tmp_path):
+        """Test that the sample clock of the metadata advances by the dropped samples."""
+        # Arrange
+        recorder = UUT.Recorder(tmp_path / "capture", 1e3, buffer_size=100)
+        recorder.put(np.zeros(60, dtype=np.complex64))
+        recorder.put(np.zeros(60, dtype=np.complex64))
+
+        # Act
+        recorder.start()
+        while recorder.samples_written < 60:
+            time.sleep(0.001)
+        recorder.put(np.zeros(40, dtype=np.complex64))
+        recorder.stop()
+
+        # Assert
+        captures = read_metadata(recorder.segments[0])["captures"]
+        start = datetime.fromisoformat(captures[0]["core:datetime"])
+        gap = datetime.fromisoformat(captures[1]["core:datetime"])
+        assert len(recorder.segments) == 1
+        assert [capture["core:sample_start"] for capture in captures] == [0, 60]
+        assert (gap - start).total_seconds() == pytest.approx(0.12)
+
+    def test_drop_before_segment(self, tmp_path):
+        """Test that a segment after a gap starts at the time of its first sample."""
+        # Arrange
+        recorder = UUT.Recorder(tmp_path / "capture", 1e3, max_segment_bytes=480, buffer_size=60)
+        recorder.put(np.zeros(60, dtype=np.complex64))
+        recorder.put(np.zeros(30, dtype=np.complex64))
+
+        # Act
+        recorder.start()
+        while recorder.samples_written < 60:
+            time.sleep(0.001)
+        recorder.put(np.zeros(10, dtype=np.complex64))
+        recorder.stop()
+
+        # Assert
+        first, second = (read_metadata(segment)["captures"] for segment in recorder.segments)
+        start = datetime.fromisoformat(first[0]["core:datetime"])
+        gap = datetime.fromisoformat(second[0]["core:datetime"])
+        assert len(first) == 1 and len(second) == 1
+        assert (gap - start).total_seconds() == pytest.approx(0.09)
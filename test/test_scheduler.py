@@ -0,0 +1,139 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Test the scheduler module.
+
+## Description
+Contains the test group to test the render scheduler.
+
+### Details
+- *File:*     `test_scheduler.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import time
+import pytest
+
+# Import the Unit Under Test
+import plutostudio.ui.scheduler as UUT
+
+# === Fixtures ===
+
+
+class FakeWidget:
+    """Widget which records the scheduled timer callbacks."""
+
+    def __init__(self):
+        self.jobs = {}
+        self.delays = []
+
+    def after(self, delay, callback):
+        self.delays.append(delay)
+        job = len(self.delays)
+        self.jobs[job] = callback
+        return job
+
+    def after_cancel(self, job):
+        del self.jobs[job]
+
+    def run_next(self):
+        job = max(self.jobs)
+        self.jobs.pop(job)()
+
+
+@pytest.fixture
+def widget():
+    """Provide a fake tkinter widget."""
+    yield FakeWidget()
+
+
+# === Tests ===
+
+
+class Test_RenderScheduler():
+    """Test group to test the render scheduler."""
+    def test_init(self, widget):
+        """Test the initial state of the scheduler."""
+        # Arrange
+        # Act
+        scheduler = UUT.RenderScheduler(widget, lambda: None, fps=25.0)
+
+        # Assert
+        assert scheduler.fps == 25.0
+        assert scheduler.is_running() is False
+        assert scheduler.skipped == 0
+        assert not widget.jobs
+
+    def test_invalid_fps(self, widget):
+        """Test that the frame rate has to be positive."""
+        # Arrange
+        # Act
+        with pytest.raises(ValueError):
+            UUT.RenderScheduler(widget, lambda: None, fps=0)
+
+    def test_start_and_stop(self, widget):
+        """Test that the rendering is scheduled and cancelled."""
+        # Arrange
+        scheduler = UUT.RenderScheduler(widget, lambda: None)
+
+        # Act
+        scheduler.start()
+        running = scheduler.is_running()
+        scheduler.stop()
+
+        # Assert
+        assert running is True
+        assert scheduler.is_running() is False
+        assert not widget.jobs
+
+    def test_render_frame(self, widget):
+        """Test that a frame is rendered and the next one scheduled."""
+        # Arrange
+        frames = []
+        scheduler = UUT.RenderScheduler(widget, lambda: frames.append(1), fps=10.0)
+        scheduler.start()
+
+        # Act
+        widget.run_next()
+
+        # Assert
+        assert len(frames) == 1
+        assert len(widget.jobs) == 1
+        assert 1 <= widget.delays[-1] <= 100
+        assert scheduler.skipped == 0
+
+    def test_skip_frames(self, widget):
+        """Test that frames are skipped when rendering is too slow."""
+        # Arrange
+        scheduler = UUT.RenderScheduler(widget, lambda: time.sleep(0.035), fps=100.0)
+        scheduler.start()
+
+        # Act
+        widget.run_next()
+
+        # Assert
+        assert scheduler.skipped >= 3
+        assert 1 <= widget.delays[-1] <= 10
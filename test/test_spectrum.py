@@ -0,0 +1,237 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Test the spectrum module.
+
+## Description
+Contains the test group to test the spectrum module.
+
+### Details
+- *File:*     `test_spectrum.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import pytest
+import numpy as np
+
+# Import the Unit Under Test
+import plutostudio.core.spectrum as UUT
+
+# === Fixtures ===
+def tone(count: int, bin_index: int, size: int, amplitude: float = 1.0) -> np.ndarray:
+    """Create a complex tone centered in one FFT bin."""
+    phase = 2 * np.pi * bin_index / size * np.arange(count)
+    return (amplitude * np.exp(1j * phase)).astype(np.complex64)
+
+
+# === Tests ===
+
+
+class Test_Window():
+    """Test group to test the window tables."""
+    @pytest.mark.parametrize("name", list(UUT.WINDOWS))
+    def test_window(self, name):
+        """Test the shape and type of the windows."""
+        # Arrange
+        # Act
+        window = UUT.get_window(name, 64)
+
+        # Assert
+        assert window.dtype == np.float32
+        assert window.size == 64
+        assert window.max() == pytest.approx(1.0, abs=1e-3)
+
+    def test_window_cached(self):
+        """Test that the windows are only computed once."""
+        # Arrange
+        # Act
+        # Assert
+        assert UUT.get_window("hann", 128) is UUT.get_window("hann", 128)
+        assert UUT.get_window("hann", 128).flags.writeable is False
+
+    def test_unknown_window(self):
+        """Test the exception for an unknown window."""
+        # Arrange
+        # Act
+        with pytest.raises(ValueError):
+            UUT.get_window("unknown", 64)
+
+
+class Test_Spectrum():
+    """Test group to test the spectrum class."""
+    def test_init(self):
+        """Test the default initialization of the spectrum."""
+        # Arrange
+        # Act
+        spectrum = UUT.Spectrum()
+
+        # Assert
+        assert spectrum.fft_size == 1024
+        assert spectrum.hop == 512
+        assert spectrum.frames == 0
+        assert spectrum.get().dtype == np.float32
+        assert (spectrum.get() == 0).all()
+
+    @pytest.mark.parametrize("kwargs", [{"overlap": 1.0}, {"averaging": "median"}, {"averages": 0}])
+    def test_invalid_settings(self, kwargs):
+        """Test the exception for invalid settings."""
+        # Arrange
+        # Act
+        with pytest.raises(ValueError):
+            UUT.Spectrum(**kwargs)
+
+    @pytest.mark.parametrize("window", list(UUT.WINDOWS))
+    def test_tone_power(self, window):
+        """Test the bin and the power of a tone."""
+        # Arrange
+        spectrum = UUT.Spectrum(64, window=window, averaging="none")
+
+        # Act
+        updated = spectrum.update(tone(64, 8, 64, amplitude=2.0))
+
+        # Assert
+        assert updated is True
+        assert np.argmax(spectrum.get()) == 32 + 8
+        assert spectrum.get()[32 + 8] == pytest.approx(4.0, rel=1e-3)
+
+    def test_pending_samples(self):
+        """Test that incomplete frames are completed by the next block."""
+        # Arrange
+        spectrum = UUT.Spectrum(64, overlap=0.0, averaging="linear", averages=100)
+        samples = tone(64 * 3, -4, 64)
+
+        # Act
+        first = spectrum.update(samples[:40])
+        second = spectrum.update(samples[40:100])
+        spectrum.update(samples[100:])
+
+        # Assert
+        assert first is False
+        assert second is True
+        assert spectrum.frames == 3
+        assert np.argmax(spectrum.get()) == 32 - 4
+
+    def test_odd_size(self):
+        """Test the centered spectrum of an odd FFT size."""
+        # Arrange
+        spectrum = UUT.Spectrum(63, averaging="none")
+
+        # Act
+        spectrum.update(tone(63, -5, 63))
+
+        # Assert
+        assert np.argmax(spectrum.get()) == 31 - 5
+        assert spectrum.get()[31 - 5] == pytest.approx(1.0, rel=1e-3)
+
+    def test_block_sizes(self):
+        """Test that the spectrum does not depend on the block sizes."""
+        # Arrange
+        samples = tone(4096, 3, 256) + tone(4096, -20, 256, amplitude=0.1)
+        reference = UUT.Spectrum(256, averaging="linear", averages=100)
+        reference.update(samples)
+        spectrum = UUT.Spectrum(256, averaging="linear", averages=100)
+
+        # Act
+        for start in range(0, samples.size, 300):
+            spectrum.update(samples[start : start + 300])
+
+        # Assert
+        assert spectrum.frames == reference.frames
+        np.testing.assert_allclose(spectrum.get(), reference.get(), rtol=1e-4, atol=1e-9)
+
+    def test_work_buffers_reused(self):
+        """Test that blocks of the same size reuse the working memory."""
+        # Arrange
+        spectrum = UUT.Spectrum(256)
+        block = tone(2048, 1, 256)
+        spectrum.update(block)
+        buffers = (spectrum._stream, spectrum._windowed, spectrum._frame_power)
+
+        # Act
+        for _ in range(3):
+            spectrum.update(block)
+
+        # Assert
+        assert spectrum._stream is buffers[0]
+        assert spectrum._windowed is buffers[1]
+        assert spectrum._frame_power is buffers[2]
+
+    def test_overlap(self):
+        """Test the number of frames with overlap."""
+        # Arrange
+        spectrum = UUT.Spectrum(64, overlap=0.75, averaging="linear", averages=100)
+
+        # Act
+        spectrum.update(tone(256, 1, 64))
+
+        # Assert
+        assert spectrum.hop == 16
+        assert spectrum.frames == 13
+
+    def test_exponential_matches_recursion(self):
+        """Test the batched exponential average against the frame recursion."""
+        # Arrange
+        rng = np.random.default_rng(0)
+        samples = rng.standard_normal(64 * 20) + 1j * rng.standard_normal(64 * 20)
+        samples = samples.astype(np.complex64)
+        batched = UUT.Spectrum(64, overlap=0.0, averaging="exponential", averages=4)
+        framewise = UUT.Spectrum(64, overlap=0.0, averaging="none")
+        average = np.zeros(64)
+
+        # Act
+        batched.update(samples)
+        for index in range(20):
+            framewise.update(samples[index * 64 : (index + 1) * 64])
+            average += (framewise.get() - average) / 4
+
+        # Assert
+        assert batched.frames == 4
+        assert batched.get() == pytest.approx(average / (1 - 0.75**20), rel=1e-3)
+
+    def test_linear_restart(self):
+        """Test that the linear average restarts after the number of averages."""
+        # Arrange
+        spectrum = UUT.Spectrum(64, overlap=0.0, averaging="linear", averages=4)
+
+        # Act
+        spectrum.update(tone(64 * 6, 2, 64))
+
+        # Assert
+        assert spectrum.frames == 2
+
+    def test_reset(self):
+        """Test resetting the spectrum."""
+        # Arrange
+        spectrum = UUT.Spectrum(64)
+        spectrum.update(tone(100, 2, 64))
+
+        # Act
+        spectrum.reset()
+
+        # Assert
+        assert spectrum.frames == 0
+        assert (spectrum.get() == 0).all()
+        assert spectrum.update(tone(40, 2, 64)) is False
@@ -0,0 +1,249 @@
+# PlutoStudio - A Python based GUI for the ADALM-PlutoSDR
+# Copyright (c) 2023 Sebastian Oberschwendtner, sebastian.oberschwendtner@gmail.com
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+""" Test the viewer module.
+
+## Description
+Contains the test group to test the data preparation of the viewers.
+
+### Details
+- *File:*     `test_viewer.py`
+- *Details:*  Python 3.11
+- *Date:*     2026-10-17
+- *Version:*  v1.0.0
+
+### Author
+Sebastian Oberschwendtner, :email: sebastian.oberschwendtner@gmail.com
+
+---
+## Code
+
+---
+"""
+# === Imports ===
+import pytest
+import numpy as np
+
+# Import the Unit Under Test
+import plutostudio.ui.viewer as UUT
+
+# === Tests ===
+
+
+class Test_DecimateMinMax():
+    """Test group to test the min/max decimation."""
+    def test_short_data(self):
+        """Test that short data is returned unchanged."""
+        # Arrange
+        data = np.arange(10.0)
+
+        # Act
+        positions, reduced = UUT.decimate_minmax(data, 8)
+
+        # Assert
+        assert (positions == np.arange(10)).all()
+        assert reduced is data
+
+    def test_envelope(self):
+        """Test the minimum and maximum of each column."""
+        # Arrange
+        data = np.array([1, 5, 3, 0, -2, 4, 7, 7], dtype=np.float32)
+
+        # Act
+        positions, reduced = UUT.decimate_minmax(data, 2)
+
+        # Assert
+        assert (reduced == [5, 7, -2, 0]).all()
+        assert (positions == [2, 6, 6, 2]).all()
+        assert reduced.dtype == np.float32
+
+    def test_remainder(self):
+        """Test that the remaining samples are part of the last column."""
+        # Arrange
+        data = np.zeros(1000)
+        data[-1] = 9.0
+        data[-2] = -9.0
+
+        # Act
+        positions, reduced = UUT.decimate_minmax(data, 3)
+
+        # Assert
+        assert reduced.size == 6
+        assert reduced[2] == 9.0
+        assert reduced[3] == -9.0
+
+    def test_large_data(self):
+        """Test that the output size only depends on the number of columns."""
+        # Arrange
+        data = np.random.default_rng(0).standard_normal(1_000_000)
+
+        # Act
+        positions, reduced = UUT.decimate_minmax(data, 1900)
+
+        # Assert
+        assert reduced.size == positions.size == 3800
+        assert reduced.max() == data.max()
+        assert reduced.min() == data.min()
+
+    def test_positions_reused(self):
+        """Test that the x-coordinates are reused between frames."""
+        # Arrange
+        data = np.zeros(1000)
+
+        # Act
+        first, _ = UUT.decimate_minmax(data, 100)
+        second, _ = UUT.decimate_minmax(data + 1, 100)
+
+        # Assert
+        assert first is second
+        assert first.flags.writeable is False
+
+
+class Test_HeadlessViewer():
+    """Test group to test the viewers rendering off-screen."""
+    def test_default_viewer(self):
+        """Test drawing complex data without a display."""
+        # Arrange
+        viewer = UUT.DefaultViewer(None)
+        data = (np.arange(4096) - 2048) * (1 + 0.5j) / 2048
+
+        # Act
+        viewer.draw(data)
+        viewer.draw(data)
+
+        # Assert
+        low, high = viewer.axes.get_ylim()
+        assert low <= -1.0 and high >= 1.0
+        assert viewer.axes.get_xlim() == (0, 4096)
+        assert viewer.trace.get_ydata().max() == pytest.approx(1.0, abs=1e-3)
+
+    def test_redraw_hysteresis(self):
+        """Test that only frames which leave the limits redraw the complete figure."""
+        # Arrange
+        viewer = UUT.DefaultViewer(None)
+        draws = []
+        draw = viewer.canvas.draw
+        viewer.canvas.draw = lambda: draws.append(draw())
+        frames = [np.exp(1j * (np.arange(4096) / 64 + phase)) for phase in range(21)]
+        viewer.draw(frames[0])
+        draws.clear()
+
+        # Act
+        backgrounds = []
+        for frame in frames[1:]:
+            viewer.draw(frame)
+            backgrounds.append(viewer._background is not None)
+        in_range = len(draws)
+        for frame in frames[:5]:
+            viewer.draw(100 * frame)
+
+        # Assert
+        assert in_range == 0
+        assert all(backgrounds)
+        assert len(draws) == 1
+        assert viewer.axes.get_ylim()[1] >= 100.0
+
+    def test_waterfall_viewer(self):
+        """Test adding spectra to the waterfall without a display."""
+        # Arrange
+        viewer = UUT.WaterfallViewer(None, bins=64, rows=8)
+
+        # Act
+        viewer.draw(np.full((3, 64), -10.0))
+
+        # Assert
+        image = viewer.image.get_array()
+        colors = viewer._colors
+        assert image.shape == (8, 64, 4)
+        assert image.dtype == np.uint8
+        assert (image[:3] == colors[(110 * 255) // 120]).all()
+        assert (image[3:] == colors[0]).all()
+
+    def test_waterfall_levels(self):
+        """Test the quantization of the power to the colors."""
+        # Arrange
+        viewer = UUT.WaterfallViewer(None, bins=5, rows=4, limits=(0.0, 3.0), cmap="gray")
+
+        # Act
+        viewer.draw(np.array([-1.0, 0.0, 1.5, 3.0, 10.0]))
+
+        # Assert
+        assert list(viewer.image.get_array()[0, :, 0]) == [0, 0, 127, 255, 255]
+        assert (viewer.image.get_array()[0, :, 3] == 255).all()
+
+    def test_waterfall_wraparound(self):
+        """Test that the newest spectra are shown first when the rows wrap around."""
+        # Arrange
+        viewer = UUT.WaterfallViewer(None, bins=2, rows=3, limits=(0.0, 255.0), cmap="gray")
+
+        # Act
+        for level in range(5):
+            viewer.draw(np.full(2, float(level)))
+
+        # Assert
+        assert list(viewer.image.get_array()[:, 0, 0]) == [4, 3, 2]
+
+    @pytest.mark.parametrize("frequency_range", [(-10.0, 10.0), (10.0, -10.0)])
+    def test_waterfall_rendering(self, frequency_range):
+        """Test the rendered pixels of the waterfall, the newest spectrum on top."""
+        # Arrange
+        viewer = UUT.WaterfallViewer(None, bins=4, rows=4, limits=(0.0, 3.0), cmap="gray")
+        viewer.set_frequency_range(*frequency_range)
+        start, stop = frequency_range
+        step = (stop - start) / 4
+
+        # Act
+        viewer.draw(np.full(4, 3.0))
+        viewer.draw(np.array([0.0, 1.0, 2.0, 3.0]))
+
+        # Assert
+        pixels = np.asarray(viewer.canvas.buffer_rgba())
+        def pixel(column, row):
+            x, y = viewer.axes.transData.transform((start + (column + 0.5) * step, row + 0.5))
+            return int(pixels[int(pixels.shape[0] - y), int(x), 0])
+        assert [pixel(column, 0) for column in range(4)] == [0, 85, 170, 255]
+        assert [pixel(column, 1) for column in range(4)] == [255] * 4
+        assert [pixel(column, 3) for column in range(4)] == [0] * 4
+
+    def test_deferred_canvas(self):
+        """Test that the canvas is only created once the parent has its size."""
+        # Arrange
+        class Parent:
+            """Parent widget which records the bound callbacks."""
+            def __init__(self):
+                self.callbacks = []
+
+            def bind(self, sequence, callback, add=None):
+                self.callbacks.append((sequence, callback, add))
+
+        class Event:
+            """Configure event of a widget which is not mapped yet."""
+            width = 1
+            height = 1
+
+        parent = Parent()
+        viewer = UUT.DefaultViewer(parent)
+
+        # Act
+        viewer.draw(np.ones(100, dtype=np.complex64))
+        sequence, callback, add = parent.callbacks[0]
+        callback(Event())
+
+        # Assert
+        assert sequence == "<Configure>"
+        assert add == "+"
+        assert viewer.is_ready() is False
+        assert viewer.trace.get_xdata().size == 100